@@ -12,32 +12,49 @@ import asyncio
 import json
 import logging
 from typing import Dict, List, Any, Optional, Tuple
-from openai import AsyncOpenAI
 import os
 from datetime import datetime
 
+from msl.msl_cancel import current_token
+
 logger = logging.getLogger(__name__)
 
+# 도구 호출의 마감 토큰이 없을 때 사용할 API 요청 타임아웃 (초)
+DEFAULT_REQUEST_TIMEOUT = 60.0
+
 class OpenAIIntegration:
     """OpenAI GPT API를 이용한 MSL 지원 클래스"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, timeout: float = DEFAULT_REQUEST_TIMEOUT):
         """
         OpenAI 클라이언트 초기화
         
         Args:
             api_key: OpenAI API 키 (없으면 환경변수에서 가져옴)
+            timeout: 요청 마감 토큰이 없을 때 사용할 API 요청 타임아웃 (초)
         """
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API 키가 필요합니다. 환경변수 OPENAI_API_KEY를 설정하거나 직접 제공하세요.")
         
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        # OpenAI SDK는 임포트 비용이 커서 클라이언트를 처음 만들 때 불러옴
+        from openai import AsyncOpenAI
+        self.timeout = timeout
+        self.client = AsyncOpenAI(api_key=self.api_key, timeout=timeout)
         self.model = "gpt-4o"  # 최신 모델 사용
         
         # MSL 언어 기본 정보
         self.msl_system_prompt = self._build_msl_system_prompt()
         
+    def _request_timeout(self) -> float:
+        """API 요청 타임아웃 (도구 호출의 마감 토큰이 있으면 남은 시간)"""
+        token = current_token()
+        remaining = token.remaining() if token is not None else None
+        if remaining is None:
+            return self.timeout
+        token.check()
+        return remaining
+        
     def _build_msl_system_prompt(self) -> str:
         """MSL 언어 시스템 프롬프트 구성"""
         return """
@@ -122,7 +139,8 @@ class OpenAIIntegration:
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=0.7,
-                max_tokens=1000
+                max_tokens=1000,
+                timeout=self._request_timeout()
             )
             
             content = response.choices[0].message.content
@@ -198,7 +216,8 @@ class OpenAIIntegration:
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=0.3,  # 최적화는 더 결정적으로
-                max_tokens=1200
+                max_tokens=1200,
+                timeout=self._request_timeout()
             )
             
             content = response.choices[0].message.content
@@ -274,7 +293,8 @@ class OpenAIIntegration:
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=0.5,
-                max_tokens=1500
+                max_tokens=1500,
+                timeout=self._request_timeout()
             )
             
             content = response.choices[0].message.content
@@ -346,7 +366,8 @@ class OpenAIIntegration:
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=0.2,  # 검증은 엄격하게
-                max_tokens=1000
+                max_tokens=1000,
+                timeout=self._request_timeout()
             )
             
             content = response.choices[0].message.content
@@ -411,7 +432,8 @@ class OpenAIIntegration:
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=0.8,  # 예제는 다양하게
-                max_tokens=1500
+                max_tokens=1500,
+                timeout=self._request_timeout()
             )
             
             content = response.choices[0].message.content
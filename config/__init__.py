@@ -4,13 +4,7 @@ Configuration package for MSL MCP Server
 This package provides configuration management and settings for the MSL MCP Server.
 """
 
-from .settings import (
-    MSLSettings,
-    ConfigManager,
-    config_manager,
-    get_settings,
-    get_config_manager
-)
+import importlib
 
 __all__ = [
     'MSLSettings',
@@ -18,4 +12,11 @@ __all__ = [
     'config_manager',
     'get_settings',
     'get_config_manager'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import the settings module (which depends on pydantic) on first access."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module('.settings', __name__), name)
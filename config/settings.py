@@ -6,7 +6,8 @@ MSL MCP 서버 설정
 
 import os
 from typing import Optional, Dict, Any
-from pydantic import BaseSettings, Field
+from pydantic import Field
+from pydantic_settings import BaseSettings
 
 
 class MSLSettings(BaseSettings):
@@ -25,7 +26,7 @@ class MSLSettings(BaseSettings):
     
     # MSL 파서 설정
     msl_max_script_length: int = Field(default=10000, description="최대 스크립트 길이")
-    msl_timeout_seconds: int = Field(default=30, description="스크립트 처리 타임아웃")
+    msl_timeout_seconds: int = Field(default=30, description="스크립트 처리 타임아웃 (초, CPU 도구에 적용)")
     
     # 로깅 설정
     log_level: str = Field(default="INFO", description="로그 레벨")
@@ -40,8 +41,13 @@ class MSLSettings(BaseSettings):
     enable_examples_tool: bool = Field(default=True, description="예제 도구 활성화")
     
     # 성능 설정
-    max_concurrent_requests: int = Field(default=10, description="최대 동시 요청 수")
-    request_timeout: int = Field(default=60, description="요청 타임아웃 (초)")
+    max_concurrent_requests: int = Field(default=10, description="도구별 최대 동시 요청 수")
+    max_queued_requests: int = Field(default=50, description="도구별 최대 대기 요청 수")
+    ai_max_concurrent_requests: int = Field(default=2, description="AI 도구별 최대 동시 요청 수")
+    ai_max_queued_requests: int = Field(default=4, description="AI 도구별 최대 대기 요청 수")
+    worker_processes: int = Field(default=2, description="CPU 도구 작업자 프로세스 수 (0이면 사용 안 함)")
+    worker_inline_max_cost: int = Field(default=2000, description="작업자 없이 바로 처리할 최대 추정 비용 (스크립트 길이 x 반복 횟수)")
+    request_timeout: int = Field(default=60, description="요청 타임아웃 (초, 0이면 제한 없음)")
     
     class Config:
         env_file = ".env"
@@ -82,6 +88,32 @@ class ConfigManager:
             "timeout_seconds": settings.msl_timeout_seconds
         }
     
+    def get_concurrency_config(self) -> Dict[str, int]:
+        """도구 호출 동시 실행 한도 및 대기열 설정 반환"""
+        settings = self.settings
+        return {
+            "max_concurrent": settings.max_concurrent_requests,
+            "max_queued": settings.max_queued_requests,
+            "ai_max_concurrent": settings.ai_max_concurrent_requests,
+            "ai_max_queued": settings.ai_max_queued_requests
+        }
+    
+    def get_timeout_config(self) -> Dict[str, int]:
+        """도구 호출 마감 시간 설정 반환"""
+        settings = self.settings
+        return {
+            "request_timeout": settings.request_timeout,
+            "script_timeout": settings.msl_timeout_seconds
+        }
+    
+    def get_worker_config(self) -> Dict[str, int]:
+        """CPU 도구 작업자 풀 설정 반환"""
+        settings = self.settings
+        return {
+            "max_workers": settings.worker_processes,
+            "inline_max_cost": settings.worker_inline_max_cost
+        }
+    
     def get_enabled_tools(self) -> Dict[str, bool]:
         """활성화된 도구 목록 반환"""
         settings = self.settings
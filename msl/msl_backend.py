@@ -0,0 +1,233 @@
+"""
+MSL (Macro Scripting Language) 입력 백엔드 (Input Backend)
+인터프리터가 실제 키보드/마우스 입력을 내보내는 방식을 추상화합니다.
+
+제공 백엔드:
+- PyAutoGUIBackend: PyAutoGUI를 사용한 실제 입력 (디스플레이 필요)
+- NullBackend: 아무 입력도 내보내지 않는 백엔드 (헤드리스 실행)
+- RecordingBackend: 입력을 타임스탬프와 함께 메모리에 기록 (벤치마크, 타이밍 테스트)
+
+같은 시각의 입력은 send_batch()로 한 번에 전달되며, 백엔드는 이를 가능한 한
+동시에 (입력 사이 지연 없이) 내보내야 합니다.
+
+pyautogui는 PyAutoGUIBackend를 생성할 때에만 import되므로
+디스플레이가 없는 환경에서도 인터프리터를 import할 수 있습니다.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Any, NamedTuple, Tuple, Sequence
+
+
+# 일괄 입력 하나: (동작 이름, 인자) - 동작 이름은 key_down / key_up / move / scroll
+BatchInput = Tuple[str, Tuple[Any, ...]]
+
+
+class BackendError(Exception):
+    """입력 백엔드 오류"""
+    pass
+
+
+class InputBackend(ABC):
+    """입력 백엔드 인터페이스"""
+    
+    name = "base"
+    
+    @abstractmethod
+    def key_down(self, key: str):
+        """키 누름"""
+        pass
+    
+    @abstractmethod
+    def key_up(self, key: str):
+        """키 뗌"""
+        pass
+    
+    @abstractmethod
+    def move(self, x: int, y: int):
+        """마우스를 절대 좌표로 이동"""
+        pass
+    
+    @abstractmethod
+    def scroll(self, amount: int):
+        """휠 스크롤 (위쪽이 양수)"""
+        pass
+    
+    def press(self, key: str):
+        """키 누르고 떼기"""
+        self.key_down(key)
+        self.key_up(key)
+    
+    def hotkey(self, *keys: str):
+        """여러 키를 순서대로 누르고 역순으로 떼기"""
+        for key in keys:
+            self.key_down(key)
+        for key in reversed(keys):
+            self.key_up(key)
+    
+    def send_batch(self, inputs: Sequence[BatchInput]):
+        """
+        같은 시각의 입력들을 순서대로 한 번에 내보냅니다.
+        
+        기본 구현은 각 동작 메서드를 차례로 호출하며, 백엔드는 더 효율적인
+        일괄 처리 방식이 있으면 재정의합니다.
+        
+        Args:
+            inputs (Sequence[BatchInput]): (동작 이름, 인자) 목록
+        """
+        for action, args in inputs:
+            getattr(self, action)(*args)
+    
+    def now(self) -> int:
+        """백엔드 기준 현재 시각 (나노초)"""
+        return time.perf_counter_ns()
+    
+    def close(self):
+        """백엔드 자원 정리"""
+        pass
+
+
+class PyAutoGUIBackend(InputBackend):
+    """PyAutoGUI를 사용한 실제 입력 백엔드"""
+    
+    name = "pyautogui"
+    
+    def __init__(self, failsafe: bool = True):
+        """
+        PyAutoGUI Backend 초기화
+        
+        Args:
+            failsafe (bool): 마우스를 화면 모서리로 이동하면 중단할지 여부
+        """
+        try:
+            import pyautogui
+        except Exception as e:
+            # 디스플레이가 없으면 ImportError 외의 예외도 발생할 수 있음
+            raise BackendError(f"PyAutoGUI를 사용할 수 없습니다: {e}")
+        
+        pyautogui.FAILSAFE = failsafe
+        pyautogui.PAUSE = 0  # 타이밍은 스케줄러가 전담 (호출마다 지연이 누적되지 않도록)
+        self._pyautogui = pyautogui
+    
+    def key_down(self, key: str):
+        self._pyautogui.keyDown(key)
+    
+    def key_up(self, key: str):
+        self._pyautogui.keyUp(key)
+    
+    def move(self, x: int, y: int):
+        self._pyautogui.moveTo(x, y)
+    
+    def scroll(self, amount: int):
+        self._pyautogui.scroll(amount)
+    
+    def press(self, key: str):
+        self._pyautogui.press(key)
+    
+    def hotkey(self, *keys: str):
+        self._pyautogui.hotkey(*keys)
+    
+    def send_batch(self, inputs: Sequence[BatchInput]):
+        # 일괄 입력 중에는 호출 사이 PAUSE 지연을 명시적으로 끔
+        gui = self._pyautogui
+        for action, args in inputs:
+            if action == 'key_down':
+                gui.keyDown(args[0], _pause=False)
+            elif action == 'key_up':
+                gui.keyUp(args[0], _pause=False)
+            elif action == 'move':
+                gui.moveTo(args[0], args[1], _pause=False)
+            elif action == 'scroll':
+                gui.scroll(args[0], _pause=False)
+            else:
+                raise BackendError(f"알 수 없는 입력 동작: {action}")
+
+
+class NullBackend(InputBackend):
+    """입력을 내보내지 않는 백엔드"""
+    
+    name = "null"
+    
+    def key_down(self, key: str):
+        pass
+    
+    def key_up(self, key: str):
+        pass
+    
+    def move(self, x: int, y: int):
+        pass
+    
+    def scroll(self, amount: int):
+        pass
+    
+    def send_batch(self, inputs: Sequence[BatchInput]):
+        pass
+
+
+class RecordedInput(NamedTuple):
+    """기록된 입력 하나"""
+    timestamp_ns: int        # 백엔드 now() 기준 시각
+    action: str              # key_down / key_up / move / scroll
+    args: Tuple[Any, ...]    # 동작 인자
+
+
+class RecordingBackend(InputBackend):
+    """입력을 타임스탬프와 함께 메모리에 기록하는 백엔드"""
+    
+    name = "recording"
+    
+    def __init__(self):
+        """Recording Backend 초기화"""
+        self.events: List[RecordedInput] = []
+    
+    def key_down(self, key: str):
+        self.events.append(RecordedInput(self.now(), 'key_down', (key,)))
+    
+    def key_up(self, key: str):
+        self.events.append(RecordedInput(self.now(), 'key_up', (key,)))
+    
+    def move(self, x: int, y: int):
+        self.events.append(RecordedInput(self.now(), 'move', (x, y)))
+    
+    def scroll(self, amount: int):
+        self.events.append(RecordedInput(self.now(), 'scroll', (amount,)))
+    
+    def send_batch(self, inputs: Sequence[BatchInput]):
+        # 일괄 입력은 모두 같은 타임스탬프로 기록
+        timestamp = self.now()
+        self.events.extend(RecordedInput(timestamp, action, tuple(args)) for action, args in inputs)
+    
+    def clear(self):
+        """기록 초기화"""
+        self.events.clear()
+    
+    def relative_events(self) -> List[RecordedInput]:
+        """첫 입력 기준 상대 시각으로 변환한 기록"""
+        if not self.events:
+            return []
+        base = self.events[0].timestamp_ns
+        return [event._replace(timestamp_ns=event.timestamp_ns - base) for event in self.events]
+
+
+# 이름으로 생성 가능한 백엔드
+BACKENDS = {
+    PyAutoGUIBackend.name: PyAutoGUIBackend,
+    NullBackend.name: NullBackend,
+    RecordingBackend.name: RecordingBackend,
+}
+
+
+def create_backend(name: str = "pyautogui", **kwargs) -> InputBackend:
+    """
+    이름으로 입력 백엔드를 생성합니다.
+    
+    Args:
+        name (str): 백엔드 이름 (pyautogui, null, recording)
+    
+    Returns:
+        InputBackend: 생성된 백엔드
+    """
+    backend_class = BACKENDS.get(name)
+    if backend_class is None:
+        raise BackendError(f"알 수 없는 입력 백엔드: {name} (사용 가능: {', '.join(BACKENDS)})")
+    return backend_class(**kwargs)
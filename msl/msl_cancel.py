@@ -0,0 +1,119 @@
+"""
+MSL (Macro Scripting Language) 취소 토큰 (Cancellation)
+도구 요청의 마감 시각을 어휘 분석, 파싱, 분석 루프까지 전달합니다.
+
+- 디스패처가 요청마다 CancellationToken을 만들어 현재 컨텍스트(contextvars)에 설정
+- 루프는 check_cancelled()를 주기적으로 호출하고, 마감이 지났으면 DeadlineExceeded로 중단
+- 토큰이 없으면(직접 호출, 데모 등) check_cancelled()는 아무 일도 하지 않음
+
+asyncio 태스크와 run_in_executor는 생성 시점의 컨텍스트를 복사하므로 토큰이 자동으로 전파됩니다.
+작업자 프로세스에는 절대 마감 시각(wall_deadline, time.time 기준)을 넘겨 같은 마감 시각의 토큰을 다시 만듭니다.
+(time.monotonic의 기준점은 프로세스 간에 같다고 보장되지 않으므로 프로세스 경계에서는 벽시계를 사용)
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Iterator
+
+
+class DeadlineExceeded(Exception):
+    """요청 마감 시각이 지났거나 요청이 취소된 경우"""
+    pass
+
+
+class CancellationToken:
+    """
+    요청 하나의 마감 시각과 취소 상태
+    
+    cancel()로 명시적으로 취소하거나, 마감 시각(time.monotonic 기준)이 지나면 취소된 것으로 봅니다.
+    """
+    
+    __slots__ = ('timeout_seconds', 'deadline', '_cancelled')
+    
+    def __init__(self, timeout_seconds: Optional[float] = None):
+        """
+        Cancellation Token 초기화
+        
+        Args:
+            timeout_seconds (float, optional): 지금부터 마감까지의 시간 (초). None이면 마감 없음
+        """
+        self.timeout_seconds = timeout_seconds
+        self.deadline = time.monotonic() + timeout_seconds if timeout_seconds is not None else None
+        self._cancelled = False
+    
+    def cancel(self):
+        """요청 취소"""
+        self._cancelled = True
+    
+    @property
+    def cancelled(self) -> bool:
+        """취소되었거나 마감 시각이 지났는지 여부"""
+        if not self._cancelled and self.deadline is not None and time.monotonic() >= self.deadline:
+            self._cancelled = True
+        return self._cancelled
+    
+    @classmethod
+    def from_wall_deadline(cls, wall_deadline: Optional[float],
+                           timeout_seconds: Optional[float] = None) -> 'CancellationToken':
+        """
+        다른 프로세스에서 넘겨받은 절대 마감 시각으로 토큰 생성
+        
+        Args:
+            wall_deadline (float, optional): 마감 시각 (time.time 기준, None이면 마감 없음)
+            timeout_seconds (float, optional): 원래 요청의 제한 시간 (오류 메시지용)
+        """
+        token = cls(None if wall_deadline is None else wall_deadline - time.time())
+        token.timeout_seconds = timeout_seconds
+        return token
+    
+    def wall_deadline(self) -> Optional[float]:
+        """다른 프로세스로 넘길 마감 시각 (time.time 기준, 마감이 없으면 None)"""
+        remaining = self.remaining()
+        return None if remaining is None else time.time() + remaining
+    
+    def remaining(self) -> Optional[float]:
+        """마감까지 남은 시간 (초, 마감이 없으면 None)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+    
+    def check(self):
+        """
+        취소 여부 확인
+        
+        Raises:
+            DeadlineExceeded: 취소되었거나 마감 시각이 지난 경우
+        """
+        if self.cancelled:
+            raise DeadlineExceeded(f"처리 시간 제한({self.timeout_seconds}초)을 초과했습니다")
+
+
+_current_token: ContextVar[Optional[CancellationToken]] = ContextVar('msl_cancellation_token', default=None)
+
+
+def current_token() -> Optional[CancellationToken]:
+    """현재 컨텍스트의 취소 토큰 (없으면 None)"""
+    return _current_token.get()
+
+
+def check_cancelled():
+    """
+    현재 컨텍스트의 취소 토큰 확인 (토큰이 없으면 아무 일도 하지 않음)
+    
+    Raises:
+        DeadlineExceeded: 취소되었거나 마감 시각이 지난 경우
+    """
+    token = _current_token.get()
+    if token is not None:
+        token.check()
+
+
+@contextmanager
+def cancellation_scope(token: Optional[CancellationToken]) -> Iterator[Optional[CancellationToken]]:
+    """with 블록 동안 현재 컨텍스트의 취소 토큰을 설정"""
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
@@ -0,0 +1,767 @@
+"""
+MSL (Macro Scripting Language) 컴파일러 (Compiler)
+AST를 타임스탬프가 붙은 평탄한 이벤트 프로그램으로 변환합니다.
+
+컴파일 결과:
+- (시작 기준 오프셋, 연산, 인자) 형태의 시간순 이벤트 스트림
+- 반복, 홀드, 홀드 연결, 병렬, 연속 입력의 모든 타이밍을 컴파일 시점에 계산
+- 키 이름은 키 코드(키 테이블 인덱스)로 변환
+- 병렬 분기는 스레드 없이 힙 병합으로 하나의 시간순 스트림에 결정적으로 섞음
+- 반복/연속 입력은 본문을 한 번만 컴파일하고 재생 시 절대 시각으로 펼치므로
+  반복 횟수와 무관하게 메모리 사용량이 일정
+- 페이드(<ms>) 안의 마우스 이동은 미리 계산한 경로 샘플 배열로 부드럽게 이동
+
+인터프리터는 노드를 매번 방문하는 대신 컴파일된 프로그램을 하나의 루프로 재생하며,
+프로그램은 불변이므로 여러 번의 실행에 재사용할 수 있습니다.
+"""
+
+import sys
+import os
+import heapq
+from abc import ABC, abstractmethod
+from operator import itemgetter
+from enum import IntEnum
+from typing import Dict, List, Optional, Any, NamedTuple, Set, Tuple, Iterator, Iterable
+from dataclasses import dataclass
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from msl_ast import *
+from .msl_motion import compute_path, DEFAULT_MOTION_CURVE, DEFAULT_MOTION_TICK_US
+from .msl_cancel import check_cancelled
+
+
+# 홀드 연결(>)에서 각 후속 동작 뒤에 두는 간격 (밀리초)
+HOLD_CHAIN_STEP_MS = 50
+# 연속 입력(&)의 최대 실행 시간 (밀리초)
+CONTINUOUS_MAX_DURATION_MS = 10000
+# 같은 일괄 입력으로 묶을 이벤트 간 최대 시각 차이 기본값 (마이크로초)
+DEFAULT_COALESCE_EPSILON_US = 1000
+# 연속 입력(&)의 최소 반복 주기 (밀리초) - 주기가 0이면 이벤트가 무한히 생성되므로 제한
+CONTINUOUS_MIN_PERIOD_MS = 10
+# 반복 스트림을 펼칠 때 요청 마감을 확인하는 반복 간격 (2의 거듭제곱 - 1 마스크)
+CANCEL_CHECK_MASK = 0x3FF
+
+
+class EventOp(IntEnum):
+    """컴파일된 이벤트 연산 종류"""
+    KEY_DOWN = 1     # 키 누름 (arg0: 키 코드)
+    KEY_UP = 2       # 키 뗌 (arg0: 키 코드)
+    MOUSE_MOVE = 3   # 마우스 이동 (arg0: x, arg1: y)
+    WHEEL = 4        # 휠 스크롤 (arg0: 스크롤 양, 위쪽이 양수)
+    WAIT = 5         # 대기 종료 지점 (입력 없음)
+
+
+class ProgramEvent(NamedTuple):
+    """컴파일된 단일 이벤트"""
+    offset_us: int   # 프로그램 시작 기준 오프셋 (마이크로초)
+    op: EventOp      # 연산 종류
+    arg0: int = 0    # 키 코드 / x 좌표 / 스크롤 양
+    arg1: int = 0    # y 좌표
+    source: Optional[NodeType] = None  # 이벤트를 만든 노드 타입 (메트릭 집계용)
+
+
+# 이벤트 병합 시 정렬 키 (오프셋)
+_event_offset = itemgetter(0)
+
+
+class EventStream(ABC):
+    """
+    시간순 이벤트 스트림 (불변, 반복 순회 가능)
+    
+    순회할 때마다 이벤트를 처음부터 새로 만들어 내며, len()과 op_counts()는 이벤트를 펼치지 않고 계산합니다.
+    stored_count는 실제로 메모리에 보관된 이벤트 수입니다 (반복 스트림은 본문만 보관).
+    """
+    
+    __slots__ = ('length', 'action_count', 'stored_count')
+    
+    @abstractmethod
+    def __iter__(self) -> Iterator[ProgramEvent]:
+        """이벤트를 시간순으로 처음부터 새로 만들어 냄"""
+        pass
+    
+    @abstractmethod
+    def op_counts(self) -> Dict[EventOp, int]:
+        """연산 종류별 이벤트 수 (보관된 이벤트만 훑으므로 반복 횟수와 무관)"""
+        pass
+    
+    def __len__(self) -> int:
+        return self.length
+
+
+class EventList(EventStream):
+    """이미 펼쳐진 이벤트 목록"""
+    
+    __slots__ = ('events',)
+    
+    def __init__(self, events: Tuple[ProgramEvent, ...]):
+        self.events = events
+        self.length = len(events)
+        self.action_count = sum(1 for event in events if event.op != EventOp.WAIT)
+        self.stored_count = len(events)
+    
+    def __iter__(self) -> Iterator[ProgramEvent]:
+        return iter(self.events)
+
+    def op_counts(self) -> Dict[EventOp, int]:
+        counts: Dict[EventOp, int] = {}
+        for event in self.events:
+            counts[event.op] = counts.get(event.op, 0) + 1
+        return counts
+
+
+class ConcatStream(EventStream):
+    """시간상 차례로 이어지는 스트림들"""
+    
+    __slots__ = ('parts',)
+    
+    def __init__(self, parts: Tuple[EventStream, ...]):
+        self.parts = parts
+        self.length = sum(len(part) for part in parts)
+        self.action_count = sum(part.action_count for part in parts)
+        self.stored_count = sum(part.stored_count for part in parts)
+    
+    def __iter__(self) -> Iterator[ProgramEvent]:
+        for part in self.parts:
+            yield from part
+
+    def op_counts(self) -> Dict[EventOp, int]:
+        return _sum_op_counts(self.parts)
+
+
+class MergedStream(EventStream):
+    """같은 시각에 시작하는 병렬 분기 스트림들 (재생 시 힙 병합, 같은 시각은 분기 순서)"""
+    
+    __slots__ = ('branches',)
+    
+    def __init__(self, branches: Tuple[EventStream, ...]):
+        self.branches = branches
+        self.length = sum(len(branch) for branch in branches)
+        self.action_count = sum(branch.action_count for branch in branches)
+        self.stored_count = sum(branch.stored_count for branch in branches)
+    
+    def __iter__(self) -> Iterator[ProgramEvent]:
+        return heapq.merge(*self.branches, key=_event_offset)
+    
+    def op_counts(self) -> Dict[EventOp, int]:
+        return _sum_op_counts(self.branches)
+
+
+class MotionStream(EventStream):
+    """
+    마우스 이동 경로 스트림 - 미리 계산한 (t, x, y) 샘플을 MOUSE_MOVE 이벤트로 재생
+    
+    샘플은 배열 하나로 보관되며 (msl_motion.compute_path 결과), 단계별 좌표 계산 없이 그대로 내보냅니다.
+    """
+    
+    __slots__ = ('samples', 'start_us', 'source')
+    
+    def __init__(self, samples, start_us: int, source: Optional[NodeType] = None):
+        self.samples = samples
+        self.start_us = start_us
+        self.source = source
+        self.length = self.action_count = self.stored_count = len(samples)
+    
+    def __iter__(self) -> Iterator[ProgramEvent]:
+        samples = self.samples
+        if hasattr(samples, 'tolist'):
+            samples = samples.tolist()  # NumPy 배열 -> Python 정수
+        start_us = self.start_us
+        source = self.source
+        for t, x, y in samples:
+            yield ProgramEvent(start_us + t, EventOp.MOUSE_MOVE, x, y, source)
+    
+    def op_counts(self) -> Dict[EventOp, int]:
+        return {EventOp.MOUSE_MOVE: self.length}
+
+
+class LoopStream(EventStream):
+    """
+    반복 스트림 - 본문(0 기준 오프셋)을 일정 주기로 count번 재생
+    
+    i번째 반복의 이벤트 시각은 start_us + i * period_us + 본문 오프셋으로 재생 시 계산되므로
+    반복 횟수와 무관하게 본문 크기만큼의 메모리만 사용합니다.
+    """
+    
+    __slots__ = ('body', 'start_us', 'period_us', 'count')
+    
+    def __init__(self, body: EventStream, start_us: int, period_us: int, count: int):
+        self.body = body
+        self.start_us = start_us
+        self.period_us = period_us
+        self.count = count
+        self.length = len(body) * count
+        self.action_count = body.action_count * count
+        self.stored_count = body.stored_count
+    
+    def __iter__(self) -> Iterator[ProgramEvent]:
+        body = self.body
+        base_us = self.start_us
+        period_us = self.period_us
+        
+        for iteration in range(self.count):
+            # 요청 마감 확인 (1024 반복마다, 토큰이 없으면 비용 거의 없음)
+            if not iteration & CANCEL_CHECK_MASK:
+                check_cancelled()
+            for offset_us, op, arg0, arg1, source in body:
+                yield ProgramEvent(base_us + offset_us, op, arg0, arg1, source)
+            base_us += period_us
+    
+    def op_counts(self) -> Dict[EventOp, int]:
+        return {op: count * self.count for op, count in self.body.op_counts().items()}
+
+
+def _sum_op_counts(streams: Iterable[EventStream]) -> Dict[EventOp, int]:
+    """여러 스트림의 연산 종류별 이벤트 수 합계"""
+    counts: Dict[EventOp, int] = {}
+    for stream in streams:
+        for op, count in stream.op_counts().items():
+            counts[op] = counts.get(op, 0) + count
+    return counts
+
+
+@dataclass(frozen=True)
+class CompiledProgram:
+    """컴파일된 실행 프로그램 (불변, 재사용 가능)"""
+    events: EventStream          # 시간순 이벤트 스트림 (순회할 때마다 처음부터)
+    key_names: Tuple[str, ...]   # 키 코드 -> 백엔드 키 이름
+    duration_us: int             # 전체 실행 시간 (마이크로초)
+    
+    def __len__(self) -> int:
+        return len(self.events)
+    
+    def key_name(self, key_code: int) -> str:
+        """키 코드를 백엔드 키 이름으로 변환"""
+        return self.key_names[key_code]
+    
+    @property
+    def action_count(self) -> int:
+        """실제 입력을 발생시키는 이벤트 수 (WAIT 제외)"""
+        return self.events.action_count
+    
+    def batches(self, epsilon_us: int = DEFAULT_COALESCE_EPSILON_US) -> Iterator[Tuple[int, Tuple[ProgramEvent, ...]]]:
+        """
+        시각이 가까운 이벤트들을 일괄 입력 단위로 묶어 차례로 내어줍니다 (coalesce_events 참고).
+        
+        Args:
+            epsilon_us (int): 같은 묶음으로 볼 최대 시각 차이 (0이면 같은 시각만)
+        
+        Yields:
+            Tuple[int, Tuple[ProgramEvent, ...]]: (묶음 오프셋, 이벤트들)
+        """
+        return coalesce_events(self.events, epsilon_us)
+
+
+def coalesce_events(events: Iterable[ProgramEvent],
+                    epsilon_us: int = DEFAULT_COALESCE_EPSILON_US) -> Iterator[Tuple[int, Tuple[ProgramEvent, ...]]]:
+    """
+    시간순 이벤트들을 일괄 입력 단위로 묶어 차례로 내어줍니다.
+    
+    각 묶음은 첫 이벤트의 오프셋부터 epsilon_us 이내의 연속된 이벤트로 구성되며,
+    묶음 안의 순서는 입력 순서를 그대로 유지합니다. 스트림을 따라가며
+    만들어 내므로 전체 묶음 목록을 메모리에 두지 않습니다.
+    
+    Args:
+        events (Iterable[ProgramEvent]): 시간순 이벤트
+        epsilon_us (int): 같은 묶음으로 볼 최대 시각 차이 (0이면 같은 시각만)
+    
+    Yields:
+        Tuple[int, Tuple[ProgramEvent, ...]]: (묶음 오프셋, 이벤트들)
+    """
+    batch: List[ProgramEvent] = []
+    batch_offset = 0
+    
+    for event in events:
+        if batch and event.offset_us - batch_offset > epsilon_us:
+            yield batch_offset, tuple(batch)
+            batch = []
+        if not batch:
+            batch_offset = event.offset_us
+        batch.append(event)
+    
+    if batch:
+        yield batch_offset, tuple(batch)
+
+
+class CompileError(Exception):
+    """컴파일 오류"""
+    pass
+
+
+def _ms_to_us(milliseconds: float) -> int:
+    """밀리초를 마이크로초 정수로 변환"""
+    return int(round(milliseconds * 1000))
+
+
+def _number(value: Any, default: float) -> float:
+    """숫자 값이면 그대로, 아니면 기본값을 반환"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return default
+
+
+def _is_node(node: Any, node_class: type) -> bool:
+    """노드 클래스 확인 (불변 노드는 원본 노드 클래스로 판단)"""
+    if isinstance(node, PersistentNode):
+        return issubclass(node.node_class, node_class)
+    return isinstance(node, node_class)
+
+
+class MSLCompiler(MSLVisitor):
+    """
+    MSL 컴파일러 - AST를 CompiledProgram으로 변환
+    
+    각 visit 메서드는 현재 시각 커서(_time_us)에 이벤트를 기록하고
+    노드가 차지하는 시간만큼 커서를 앞으로 이동시킵니다.
+    
+    이벤트는 펼쳐진 목록(_events)에 쌓이다가 병렬/반복/이동 경로 스트림이 끼어들면
+    구간(_segments)으로 잘려 시간순으로 이어 붙여집니다.
+    """
+    
+    def __init__(self, motion_curve: str = DEFAULT_MOTION_CURVE,
+                 motion_tick_us: int = DEFAULT_MOTION_TICK_US,
+                 move_duration_ms: float = 0):
+        """
+        MSL Compiler 초기화
+        
+        Args:
+            motion_curve (str): 부드러운 마우스 이동의 경로 곡선 (linear, ease, bezier)
+            motion_tick_us (int): 이동 경로 샘플 간격 (마이크로초)
+            move_duration_ms (float): 페이드 밖의 @(x,y) 이동 시간 (0이면 즉시 이동)
+        """
+        self.motion_curve = motion_curve
+        self.motion_tick_us = motion_tick_us
+        self.move_duration_ms = move_duration_ms
+        
+        self._events: List[ProgramEvent] = []
+        self._segments: List[EventStream] = []
+        self._key_codes: Dict[str, int] = {}
+        self._time_us = 0
+        self._variables: Dict[str, Any] = {}
+        self._mouse_position: Optional[Tuple[int, int]] = None  # 마지막 이동 좌표 (모르면 None)
+        self._fade_ms: Optional[float] = None  # 진행 중인 페이드 시간
+        self._expanding: Set[str] = set()  # 인라인하는 중인 변수 이름 (순환 참조 검출용)
+        
+        # 키 매핑 (MSL 키 이름 -> 백엔드 키 이름)
+        self.key_mapping = {
+            # 기본 키
+            'Space': 'space',
+            'Enter': 'enter',
+            'Tab': 'tab',
+            'Escape': 'escape',
+            'Backspace': 'backspace',
+            'Delete': 'delete',
+            
+            # 방향키
+            'Up': 'up',
+            'Down': 'down',
+            'Left': 'left',
+            'Right': 'right',
+            
+            # 기능키
+            'F1': 'f1', 'F2': 'f2', 'F3': 'f3', 'F4': 'f4',
+            'F5': 'f5', 'F6': 'f6', 'F7': 'f7', 'F8': 'f8',
+            'F9': 'f9', 'F10': 'f10', 'F11': 'f11', 'F12': 'f12',
+            
+            # 수정자 키
+            'Shift': 'shift',
+            'Ctrl': 'ctrl',
+            'Alt': 'alt',
+            'Win': 'win',
+            
+            # 특수 키
+            'CapsLock': 'capslock',
+            'NumLock': 'numlock',
+            'ScrollLock': 'scrolllock',
+            
+            # 숫자 키패드
+            'Num0': 'num0', 'Num1': 'num1', 'Num2': 'num2',
+            'Num3': 'num3', 'Num4': 'num4', 'Num5': 'num5',
+            'Num6': 'num6', 'Num7': 'num7', 'Num8': 'num8', 'Num9': 'num9',
+        }
+    
+    def compile(self, ast: MSLNode, variables: Dict[str, Any] = None) -> CompiledProgram:
+        """
+        AST를 실행 프로그램으로 컴파일합니다.
+        
+        Args:
+            ast (MSLNode): 컴파일할 AST
+            variables (Dict[str, Any], optional): 변수 딕셔너리 (값이 MSLNode이면 인라인)
+        
+        Returns:
+            CompiledProgram: 컴파일된 프로그램
+        
+        Raises:
+            CompileError: 정의되지 않은 변수 등 컴파일 오류 발생 시
+        """
+        self._events = []
+        self._segments = []
+        self._key_codes = {}
+        self._time_us = 0
+        self._variables = variables or {}
+        self._mouse_position = None
+        self._fade_ms = None
+        self._expanding = set()
+        
+        ast.accept(self)
+        
+        # 모든 이벤트는 커서 시각에 기록되고 구간은 시간순으로 이어지므로 스트림은 이미 시간순
+        events = self._take_stream()
+        key_names = tuple(sorted(self._key_codes, key=self._key_codes.get))
+        
+        return CompiledProgram(events=events, key_names=key_names, duration_us=self._time_us)
+    
+    # Visitor 패턴 구현
+    
+    def visit_key_node(self, node: KeyNode):
+        """키 입력: 누름과 뗌을 같은 시각에 기록"""
+        self._press(node.node_type, self._key_code(node))
+    
+    def visit_number_node(self, node: NumberNode):
+        """숫자 노드 (실행되지 않음)"""
+        pass
+    
+    def visit_variable_node(self, node: VariableNode):
+        """
+        변수 참조: 값이 AST 노드이면 그 자리에 인라인
+        
+        값의 AST가 (다른 변수를 거쳐서라도) 자기 자신을 참조하면 CompileError로 중단합니다.
+        """
+        name = getattr(node, 'name', None)
+        if not isinstance(name, str):
+            name = node.variable_name
+        
+        if name not in self._variables:
+            raise CompileError(f"정의되지 않은 변수: ${name}")
+        
+        value = self._variables[name]
+        if isinstance(value, (MSLNode, PersistentNode)):
+            if name in self._expanding:
+                raise CompileError(f"순환 변수 참조: ${name}")
+            self._expanding.add(name)
+            try:
+                value.accept(self)
+            finally:
+                self._expanding.discard(name)
+    
+    def visit_mouse_coord_node(self, node: MouseCoordNode):
+        """
+        마우스 이동: 페이드 안이면 (또는 move_duration_ms가 있으면) 직전 좌표에서 경로를 따라 부드럽게 이동
+        
+        직전 좌표를 컴파일 시점에 알 수 없으면 (스크립트의 첫 이동) 즉시 이동합니다.
+        """
+        target = (int(node.x), int(node.y))
+        origin = self._mouse_position
+        duration_ms = self._fade_ms if self._fade_ms is not None else self.move_duration_ms
+        duration_us = _ms_to_us(_number(duration_ms, 0))
+        self._mouse_position = target
+        
+        if duration_us <= 0 or origin is None or origin == target:
+            self._emit(node.node_type, EventOp.MOUSE_MOVE, target[0], target[1])
+            return
+        
+        samples = compute_path(origin, target, duration_us, self.motion_curve, self.motion_tick_us)
+        self._append_stream(MotionStream(samples, self._time_us, node.node_type))
+        self._time_us += duration_us
+    
+    def visit_wheel_node(self, node: WheelNode):
+        """휠 스크롤 (+ 방향이 양수)"""
+        amount = int(node.amount)
+        if node.direction in ('-', -1):
+            amount = -amount
+        self._emit(node.node_type, EventOp.WHEEL, amount)
+    
+    def visit_sequential_node(self, node: SequentialNode):
+        """순차 실행"""
+        for child in node.children:
+            child.accept(self)
+    
+    def visit_simultaneous_node(self, node: SimultaneousNode):
+        """동시 실행: 키들은 동시에 누르고 역순으로 떼며, 나머지 동작은 이어서 순차 실행"""
+        key_codes = []
+        others = []
+        
+        for child in node.children:
+            key_child = child
+            if _is_node(child, GroupNode) and len(child.children) == 1:
+                key_child = child.children[0]
+            if _is_node(key_child, KeyNode):
+                key_codes.append(self._key_code(key_child))
+            else:
+                others.append(child)
+        
+        for key_code in key_codes:
+            self._emit(node.node_type, EventOp.KEY_DOWN, key_code)
+        for key_code in reversed(key_codes):
+            self._emit(node.node_type, EventOp.KEY_UP, key_code)
+        
+        for child in others:
+            child.accept(self)
+    
+    def visit_hold_chain_node(self, node: HoldChainNode):
+        """홀드 연결: 첫 키를 누른 채 나머지 동작을 순서대로 실행한 뒤 뗌"""
+        if not node.children or not _is_node(node.children[0], KeyNode):
+            # 첫 번째가 키가 아닌 경우 순차 실행으로 대체
+            self.visit_sequential_node(node)
+            return
+        
+        first_key = self._key_code(node.children[0])
+        self._emit(node.node_type, EventOp.KEY_DOWN, first_key)
+        for child in node.children[1:]:
+            child.accept(self)
+            self._time_us += _ms_to_us(HOLD_CHAIN_STEP_MS)
+        self._emit(node.node_type, EventOp.KEY_UP, first_key)
+    
+    def visit_parallel_node(self, node: ParallelNode):
+        """
+        병렬 실행: 모든 분기를 같은 시각에 시작하고 가장 긴 분기가 끝날 때 종료
+        
+        각 분기를 별도의 시간순 이벤트 스트림으로 컴파일한 뒤 재생 시 힙으로 병합하므로
+        분기마다 스레드가 필요 없고, 같은 시각의 이벤트는 분기 순서대로 결정적으로 섞입니다.
+        
+        모든 분기는 병렬 노드 직전의 마우스 좌표에서 출발하며, 분기들의 마지막 좌표가 서로 다르면
+        이후 좌표는 알 수 없는 것으로 봅니다 (다음 이동은 즉시 이동).
+        """
+        start_us = self._time_us
+        end_us = start_us
+        start_position = self._mouse_position
+        end_positions = set()
+        branches = []
+        
+        for child in node.children:
+            self._mouse_position = start_position
+            branch, branch_end_us = self._compile_sub(child, start_us)
+            branches.append(branch)
+            end_us = max(end_us, branch_end_us)
+            end_positions.add(self._mouse_position)
+        
+        self._mouse_position = end_positions.pop() if len(end_positions) == 1 else None
+        self._append_stream(MergedStream(tuple(branches)))
+        self._time_us = end_us
+    
+    def visit_toggle_node(self, node: ToggleNode):
+        """토글 실행 (대상이 키이면 한 번 누름)"""
+        if not node.children:
+            return
+        self.visit_sequential_node(node)
+    
+    def visit_repeat_node(self, node: RepeatNode):
+        """
+        반복 실행: 반복 사이에만 간격을 둠
+        
+        본문은 한 번만 컴파일하고 (본문 길이 + 간격) 주기의 반복 스트림으로 기록하므로
+        컴파일 시간과 메모리는 반복 횟수와 무관합니다.
+        본문이 마우스 좌표를 바꾸면 두 번째 반복부터는 첫 반복이 끝난 좌표에서 출발하므로
+        그 좌표 기준으로 본문을 한 번 더 컴파일합니다 (_compile_loop_body 참고).
+        """
+        interval_ms = _number(getattr(node, 'interval', None), 0)
+        action_node = None
+        
+        for child in node.children:
+            if _is_node(child, IntervalNode):
+                interval_ms = child.duration
+            else:
+                action_node = child
+        
+        if action_node is None:
+            return
+        
+        count = int(node.count)
+        if count <= 0:
+            return
+        
+        interval_us = max(0, _ms_to_us(interval_ms))
+        (body, body_end_us), rest = self._compile_loop_body(action_node, count > 1)
+        period_us = body_end_us + interval_us
+        
+        if rest is None:
+            self._append_stream(LoopStream(body, self._time_us, period_us, count))
+            self._time_us += period_us * count - interval_us
+            return
+        
+        # 첫 반복과 나머지 반복의 시작 좌표가 다름
+        self._append_stream(LoopStream(body, self._time_us, period_us, 1))
+        self._time_us += period_us
+        rest_body, rest_end_us = rest
+        rest_period_us = rest_end_us + interval_us
+        self._append_stream(LoopStream(rest_body, self._time_us, rest_period_us, count - 1))
+        self._time_us += rest_period_us * (count - 1) - interval_us
+    
+    def visit_continuous_node(self, node: ContinuousNode):
+        """
+        연속 입력: 최대 실행 시간 동안 (동작, 간격)을 반복
+        
+        반복 실행과 마찬가지로 본문을 한 번만 컴파일하며 (마우스 좌표가 바뀌는 본문은 두 번),
+        주기는 최소 주기 이상으로 제한됩니다.
+        """
+        if not node.children:
+            return
+        
+        action_node = node.children[0]
+        interval_us = _ms_to_us(_number(node.interval, 0))
+        max_duration_ms = min(_number(getattr(node, 'duration', None), CONTINUOUS_MAX_DURATION_MS),
+                              CONTINUOUS_MAX_DURATION_MS)
+        max_duration_us = _ms_to_us(max_duration_ms)
+        
+        if max_duration_us > 0:
+            min_period_us = _ms_to_us(CONTINUOUS_MIN_PERIOD_MS)
+            (body, body_end_us), rest = self._compile_loop_body(action_node, True)
+            period_us = max(body_end_us + interval_us, min_period_us)
+            
+            if rest is None:
+                count = -(-max_duration_us // period_us)  # 올림 나눗셈
+                self._append_stream(LoopStream(body, self._time_us, period_us, count))
+                self._time_us += period_us * count
+            else:
+                # 첫 반복과 나머지 반복의 시작 좌표가 다름
+                self._append_stream(LoopStream(body, self._time_us, period_us, 1))
+                self._time_us += period_us
+                remaining_us = max_duration_us - period_us
+                if remaining_us > 0:
+                    rest_body, rest_end_us = rest
+                    rest_period_us = max(rest_end_us + interval_us, min_period_us)
+                    count = -(-remaining_us // rest_period_us)  # 올림 나눗셈
+                    self._append_stream(LoopStream(rest_body, self._time_us, rest_period_us, count))
+                    self._time_us += rest_period_us * count
+        
+        self._emit(node.node_type, EventOp.WAIT)
+    
+    def visit_delay_node(self, node: DelayNode):
+        """지연: (대상 동작이 있으면 먼저 실행한 뒤) 지정 시간 대기"""
+        for child in node.children:
+            child.accept(self)
+        self._time_us += _ms_to_us(node.duration)
+        self._emit(node.node_type, EventOp.WAIT)
+    
+    def visit_hold_node(self, node: HoldNode):
+        """홀드: 키를 지정 시간 동안 누른 상태로 유지"""
+        if not node.children:
+            return
+        
+        action_node = node.children[0]
+        if not _is_node(action_node, KeyNode):
+            action_node.accept(self)
+            return
+        
+        key_code = self._key_code(action_node)
+        self._emit(node.node_type, EventOp.KEY_DOWN, key_code)
+        self._time_us += _ms_to_us(node.duration)
+        self._emit(node.node_type, EventOp.KEY_UP, key_code)
+    
+    def visit_interval_node(self, node: IntervalNode):
+        """간격 노드 (반복 노드에서 처리)"""
+        pass
+    
+    def visit_fade_node(self, node: FadeNode):
+        """페이드: 대상 동작 안의 마우스 이동을 페이드 시간에 걸쳐 부드럽게 실행 (그 외 동작은 그대로)"""
+        outer_fade_ms = self._fade_ms
+        self._fade_ms = _number(node.duration, 0)
+        try:
+            self.visit_sequential_node(node)
+        finally:
+            self._fade_ms = outer_fade_ms
+    
+    def visit_group_node(self, node: GroupNode):
+        """그룹 실행"""
+        self.visit_sequential_node(node)
+    
+    # 헬퍼 메서드들
+    
+    def _emit(self, source: NodeType, op: EventOp, arg0: int = 0, arg1: int = 0):
+        """현재 시각에 이벤트 기록 (source: 이벤트를 만든 노드 타입)"""
+        self._events.append(ProgramEvent(self._time_us, op, arg0, arg1, source))
+    
+    def _flush(self):
+        """쌓인 펼쳐진 이벤트를 구간으로 확정"""
+        if self._events:
+            self._segments.append(EventList(tuple(self._events)))
+            self._events = []
+    
+    def _take_stream(self) -> EventStream:
+        """지금까지 기록된 이벤트를 하나의 스트림으로 꺼냄"""
+        self._flush()
+        segments = self._segments
+        self._segments = []
+        if not segments:
+            return EventList(())
+        if len(segments) == 1:
+            return segments[0]
+        return ConcatStream(tuple(segments))
+    
+    def _append_stream(self, stream: EventStream):
+        """현재 커서 이후에 스트림을 이어 붙임"""
+        if len(stream):
+            self._flush()
+            self._segments.append(stream)
+    
+    def _compile_sub(self, node: MSLNode, start_us: int) -> Tuple[EventStream, int]:
+        """
+        노드를 별도의 스트림으로 컴파일합니다 (현재 기록 상태는 보존).
+        
+        Args:
+            node (MSLNode): 컴파일할 노드
+            start_us (int): 노드의 시작 시각
+        
+        Returns:
+            Tuple[EventStream, int]: (노드의 이벤트 스트림, 노드가 끝나는 시각)
+        """
+        check_cancelled()
+        outer = (self._events, self._segments, self._time_us)
+        self._events, self._segments, self._time_us = [], [], start_us
+        
+        node.accept(self)
+        stream = self._take_stream()
+        end_us = self._time_us
+        
+        self._events, self._segments, self._time_us = outer
+        return stream, end_us
+    
+    def _compile_loop_body(self, node: MSLNode, repeats: bool) -> Tuple[Tuple[EventStream, int],
+                                                                          Optional[Tuple[EventStream, int]]]:
+        """
+        반복 본문을 0 기준 스트림으로 컴파일합니다.
+        
+        마우스 이동 경로는 직전 좌표에서 출발하므로, 본문이 끝난 좌표가 시작 좌표와 다르면
+        두 번째 반복부터는 경로의 출발점이 달라집니다. 이 경우 본문이 끝난 좌표를 출발점으로
+        본문을 한 번 더 컴파일하여 나머지 반복용으로 돌려줍니다 (좌표는 절대값이므로 이후 반복은 모두 같음).
+        
+        Args:
+            node (MSLNode): 반복 본문
+            repeats (bool): 두 번 이상 반복되는지 여부 (아니면 두 번째 컴파일 생략)
+        
+        Returns:
+            Tuple: ((첫 반복 스트림, 끝 시각), (나머지 반복 스트림, 끝 시각) 또는 None)
+        """
+        start_position = self._mouse_position
+        first = self._compile_sub(node, 0)
+        if not repeats or self._mouse_position == start_position:
+            return first, None
+        return first, self._compile_sub(node, 0)
+    
+    def _press(self, source: NodeType, key_code: int):
+        """키 한 번 누르기 (누름 + 뗌)"""
+        self._emit(source, EventOp.KEY_DOWN, key_code)
+        self._emit(source, EventOp.KEY_UP, key_code)
+    
+    def _key_code(self, node: KeyNode) -> int:
+        """키 노드의 백엔드 키 이름을 키 코드로 변환 (처음 보는 키는 테이블에 추가)"""
+        # 파서는 키 이름을 key 속성에 기록하므로 우선 사용
+        msl_key = getattr(node, 'key', None)
+        if not isinstance(msl_key, str):
+            msl_key = node.key_name
+        
+        key_name = self._map_key_name(msl_key)
+        key_code = self._key_codes.get(key_name)
+        if key_code is None:
+            key_code = len(self._key_codes)
+            self._key_codes[key_name] = key_code
+        return key_code
+    
+    def _map_key_name(self, msl_key: str) -> str:
+        """MSL 키 이름을 백엔드 키 이름으로 변환"""
+        if msl_key in self.key_mapping:
+            return self.key_mapping[msl_key]
+        
+        # 그 외에는 소문자로 변환 (단일 문자 포함)
+        return msl_key.lower()
@@ -0,0 +1,463 @@
+"""
+MSL (Macro Scripting Language) 프로세스 외부 입력 주입기 (Out-of-Process Injector)
+컴파일된 이벤트 프로그램을 공유 메모리 링 버퍼로 전용 주입 프로세스에 넘겨 실행합니다.
+
+서버 프로세스 안에서 실행하면 요청 처리와 GIL을 다투느라 키 타이밍이 흔들리므로,
+대기와 입력 전달은 자체 스케줄러를 가진 별도 프로세스에서 수행합니다.
+
+구조:
+- SharedRingBuffer: multiprocessing.shared_memory 위의 고정 크기 레코드 링 버퍼
+  (생산자 하나 / 소비자 하나, 읽기/쓰기 위치만 공유하므로 잠금 없음)
+- InjectorProcess (서버 쪽): 시작 레코드, 이벤트 레코드, 끝 레코드를 차례로 기록
+  (링이 가득 차면 주입기가 소비하는 대로 이어서 기록하므로 긴 프로그램도 메모리 일정)
+- 주입 프로세스: 링의 이벤트를 일괄 입력으로 묶고 DeadlineScheduler로 시각을 맞춰 백엔드로 내보냄
+- 키 테이블과 실행 결과는 파이프로, 중단 요청은 프로세스 간 이벤트로 전달
+
+링 레코드 (32바이트): offset_us, program_id, x, y, key_code, op, kind
+"""
+
+import os
+import time
+import struct
+import threading
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Any, Iterable, Iterator, Callable
+
+from .msl_compiler import ProgramEvent, EventOp, CompiledProgram, DEFAULT_COALESCE_EPSILON_US, coalesce_events
+
+
+# 링 레코드 형식: offset_us, program_id, x, y, key_code, op, kind (+ 패딩)
+RING_RECORD = struct.Struct('<qqiiHBB4x')
+RING_RECORD_SIZE = RING_RECORD.size
+# 링 헤더 형식: 쓰기 위치, 읽기 위치 (누적 레코드 수)
+RING_HEADER = struct.Struct('<qq')
+RING_HEADER_SIZE = 64  # 캐시 라인 하나
+_POSITION = struct.Struct('<q')
+
+# 레코드 종류
+RECORD_EVENT = 1      # 이벤트 하나
+RECORD_BEGIN = 2      # 프로그램 시작 (키 테이블은 파이프로 먼저 전달됨)
+RECORD_END = 3        # 프로그램 끝
+RECORD_SHUTDOWN = 4   # 주입 프로세스 종료
+
+# 기본 링 크기 (레코드 수)
+DEFAULT_RING_CAPACITY = 16384
+# 링이 비었거나 가득 찼을 때 다시 확인하기까지의 대기 (초)
+RING_POLL_SECONDS = 0.0005
+# 주입 프로세스 시작 대기 제한 (초)
+INJECTOR_START_TIMEOUT = 10.0
+# 결과를 기다리는 동안 주입 프로세스 생존을 확인하는 간격 (초)
+INJECTOR_POLL_SECONDS = 0.01
+
+
+class InjectorError(Exception):
+    """입력 주입기 오류"""
+    pass
+
+
+class SharedRingBuffer:
+    """
+    공유 메모리 링 버퍼 (생산자 하나 / 소비자 하나)
+    
+    쓰기 위치는 생산자만, 읽기 위치는 소비자만 갱신하므로 잠금이 필요 없습니다.
+    레코드를 먼저 기록한 뒤 위치를 갱신하므로 상대편은 완성된 레코드만 보게 됩니다.
+    """
+    
+    def __init__(self, capacity: int = DEFAULT_RING_CAPACITY, name: Optional[str] = None):
+        """
+        Shared Ring Buffer 초기화
+        
+        Args:
+            capacity (int): 링 크기 (레코드 수)
+            name (str, optional): 연결할 공유 메모리 이름 (지정하지 않으면 새로 생성)
+        """
+        self.capacity = capacity
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=RING_HEADER_SIZE + capacity * RING_RECORD_SIZE)
+            RING_HEADER.pack_into(self.shm.buf, 0, 0, 0)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.name = self.shm.name
+        self._buf = self.shm.buf
+    
+    def __len__(self) -> int:
+        write_pos, read_pos = RING_HEADER.unpack_from(self._buf, 0)
+        return write_pos - read_pos
+    
+    def try_write(self, kind: int, program_id: int, offset_us: int = 0, op: int = 0,
+                  key_code: int = 0, x: int = 0, y: int = 0) -> bool:
+        """레코드 하나 기록 (가득 차 있으면 False)"""
+        buf = self._buf
+        write_pos, read_pos = RING_HEADER.unpack_from(buf, 0)
+        if write_pos - read_pos >= self.capacity:
+            return False
+        RING_RECORD.pack_into(buf, RING_HEADER_SIZE + (write_pos % self.capacity) * RING_RECORD_SIZE,
+                              offset_us, program_id, x, y, key_code, op, kind)
+        _POSITION.pack_into(buf, 0, write_pos + 1)
+        return True
+    
+    def write(self, kind: int, program_id: int, offset_us: int = 0, op: int = 0,
+              key_code: int = 0, x: int = 0, y: int = 0, abort: Optional[threading.Event] = None,
+              alive: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        레코드 하나 기록 (가득 차 있으면 자리가 날 때까지 대기)
+        
+        Args:
+            abort (threading.Event, optional): 설정되면 기다리지 않고 포기
+            alive (Callable[[], bool], optional): 소비자 생존 확인 함수 (기다리는 동안 매번 확인)
+        
+        Returns:
+            bool: 기록했으면 True, 기다리는 동안 abort가 설정되어 포기했으면 False
+        
+        Raises:
+            InjectorError: 기다리는 동안 소비자가 종료된 경우
+        """
+        while not self.try_write(kind, program_id, offset_us, op, key_code, x, y):
+            if abort is not None and abort.is_set():
+                return False
+            if alive is not None and not alive():
+                raise InjectorError("링 버퍼 소비자(입력 주입 프로세스)가 종료되었습니다")
+            time.sleep(RING_POLL_SECONDS)
+        return True
+    
+    def try_read(self):
+        """레코드 하나 읽기 (비어 있으면 None) - (offset_us, program_id, x, y, key_code, op, kind)"""
+        buf = self._buf
+        write_pos, read_pos = RING_HEADER.unpack_from(buf, 0)
+        if read_pos == write_pos:
+            return None
+        record = RING_RECORD.unpack_from(buf, RING_HEADER_SIZE + (read_pos % self.capacity) * RING_RECORD_SIZE)
+        _POSITION.pack_into(buf, 8, read_pos + 1)
+        return record
+    
+    def read(self):
+        """레코드 하나 읽기 (비어 있으면 기록될 때까지 대기)"""
+        record = self.try_read()
+        while record is None:
+            time.sleep(RING_POLL_SECONDS)
+            record = self.try_read()
+        return record
+    
+    def close(self):
+        """공유 메모리 연결 해제 (생성한 쪽이면 삭제)"""
+        self._buf = None
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+# 주입 프로세스
+
+def _program_events(ring: SharedRingBuffer, program_id: int) -> Iterator[ProgramEvent]:
+    """링에서 프로그램 하나의 이벤트를 끝 레코드까지 차례로 읽어 내어줌"""
+    while True:
+        offset_us, record_program, x, y, key_code, op, kind = ring.read()
+        if kind == RECORD_END:
+            return
+        if kind != RECORD_EVENT or record_program != program_id:
+            continue
+        if op == EventOp.KEY_DOWN or op == EventOp.KEY_UP:
+            yield ProgramEvent(offset_us, op, key_code, 0, None)
+        else:
+            yield ProgramEvent(offset_us, op, x, y, None)
+
+
+def _drain_program(ring: SharedRingBuffer):
+    """중단된 프로그램의 남은 레코드를 끝 레코드까지 버림"""
+    while ring.read()[6] != RECORD_END:
+        pass
+
+
+def _run_program(ring: SharedRingBuffer, conn, stop_event, backend, program_id: int,
+                 key_names, epsilon_us: int, spin_threshold_ns: int):
+    """주입 프로세스에서 프로그램 하나를 실행하고 결과를 파이프로 보고"""
+    from .msl_scheduler import DeadlineScheduler
+    from .msl_input_state import InputStateTracker
+    
+    scheduler = DeadlineScheduler(spin_threshold_ns, stop_event)
+    input_state = InputStateTracker()
+    executed_actions = 0
+    error = None
+    ended = False
+    started = time.time()
+    scheduler.start()
+    
+    try:
+        for offset_us, batch in coalesce_events(_program_events(ring, program_id), epsilon_us):
+            if scheduler.wait_until_offset(offset_us) is None:
+                break  # 중단 요청
+            
+            inputs = []
+            for _, op, arg0, arg1, _ in batch:
+                if op == EventOp.KEY_DOWN:
+                    if input_state.press(arg0):
+                        inputs.append(('key_down', (key_names[arg0],)))
+                elif op == EventOp.KEY_UP:
+                    if input_state.release(arg0):
+                        inputs.append(('key_up', (key_names[arg0],)))
+                elif op == EventOp.MOUSE_MOVE:
+                    inputs.append(('move', (arg0, arg1)))
+                elif op == EventOp.WHEEL:
+                    inputs.append(('scroll', (arg0,)))
+            if inputs:
+                backend.send_batch(inputs)
+                executed_actions += len(inputs)
+        else:
+            ended = True
+    
+    except Exception as e:
+        error = str(e)
+    
+    finally:
+        held = input_state.release_all()
+        if held:
+            try:
+                backend.send_batch([('key_up', (key_names[key_code],)) for key_code in held])
+            except Exception as e:
+                error = error or f"키 해제 실패: {e}"
+        if not ended:
+            _drain_program(ring)
+    
+    timing = scheduler.get_statistics()
+    timing['input_state'] = input_state.to_dict()
+    conn.send({
+        'program_id': program_id,
+        'executed_actions': executed_actions,
+        'execution_time': time.time() - started,
+        'stopped': stop_event.is_set(),
+        'completed': ended,
+        'error': error,
+        'timing': timing
+    })
+
+
+def _injector_main(ring_name: str, capacity: int, conn, stop_event, backend_name: str,
+                   backend_options: Dict[str, Any], epsilon_us: int):
+    """주입 프로세스 진입점: 시작 레코드를 기다렸다가 프로그램을 하나씩 실행"""
+    from .msl_backend import create_backend
+    from .msl_scheduler import DeadlineScheduler
+    
+    ring = SharedRingBuffer(capacity, name=ring_name)
+    try:
+        backend = create_backend(backend_name, **backend_options)
+        spin_threshold_ns = DeadlineScheduler().calibrate()
+    except Exception as e:
+        conn.send({'ready': False, 'error': str(e)})
+        ring.close()
+        return
+    conn.send({'ready': True, 'pid': os.getpid(), 'spin_threshold_ns': spin_threshold_ns})
+    
+    try:
+        while True:
+            _, program_id, _, _, _, _, kind = ring.read()
+            if kind == RECORD_SHUTDOWN:
+                break
+            if kind != RECORD_BEGIN:
+                continue
+            
+            key_names = conn.recv()
+            _run_program(ring, conn, stop_event, backend, program_id, key_names, epsilon_us, spin_threshold_ns)
+    finally:
+        backend.close()
+        ring.close()
+
+
+# 서버 쪽
+
+class InjectorProcess:
+    """
+    입력 주입 프로세스 관리자 (서버 프로세스 쪽)
+    
+    start()로 주입 프로세스를 띄우고 run()으로 프로그램을 넘겨 결과를 받습니다.
+    주입 프로세스는 프로그램을 하나씩 차례로 실행하므로 run() 호출은 잠금으로 직렬화됩니다.
+    """
+    
+    def __init__(self, backend_name: str = "pyautogui", backend_options: Optional[Dict[str, Any]] = None,
+                 capacity: int = DEFAULT_RING_CAPACITY,
+                 coalesce_epsilon_us: int = DEFAULT_COALESCE_EPSILON_US):
+        """
+        Injector Process 초기화
+        
+        Args:
+            backend_name (str): 주입 프로세스에서 만들 입력 백엔드 이름 (pyautogui, null, recording)
+            backend_options (Dict[str, Any], optional): 백엔드 생성 인자
+            capacity (int): 공유 메모리 링 크기 (레코드 수)
+            coalesce_epsilon_us (int): 하나의 일괄 입력으로 묶을 이벤트 간 최대 시각 차이
+        """
+        self.backend_name = backend_name
+        self.backend_options = backend_options or {}
+        self.capacity = capacity
+        self.coalesce_epsilon_us = coalesce_epsilon_us
+        self.pid: Optional[int] = None
+        
+        self._ring: Optional[SharedRingBuffer] = None
+        self._conn = None
+        self._process = None
+        self._stop_event = None                           # 프로세스 간 중단 이벤트 (서버 쪽에서만 설정/해제)
+        self._current: Optional[threading.Event] = None   # 실행 중인 프로그램의 중단 토큰
+        self._lock = threading.Lock()
+        self._program_ids = 0
+    
+    @property
+    def is_alive(self) -> bool:
+        """주입 프로세스 실행 여부"""
+        return self._process is not None and self._process.is_alive()
+    
+    def start(self):
+        """
+        주입 프로세스 시작 (이미 실행 중이면 아무 일도 하지 않음)
+        
+        Raises:
+            InjectorError: 주입 프로세스가 준비되지 못한 경우
+        """
+        if self.is_alive:
+            return
+        
+        context = multiprocessing.get_context('spawn')
+        self._ring = SharedRingBuffer(self.capacity)
+        self._conn, child_conn = context.Pipe()
+        self._stop_event = context.Event()
+        self._process = context.Process(
+            target=_injector_main,
+            args=(self._ring.name, self.capacity, child_conn, self._stop_event,
+                  self.backend_name, self.backend_options, self.coalesce_epsilon_us),
+            name='MSLInjector',
+            daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        
+        if not self._conn.poll(INJECTOR_START_TIMEOUT):
+            self.close()
+            raise InjectorError("입력 주입 프로세스가 응답하지 않습니다")
+        ready = self._conn.recv()
+        if not ready.get('ready'):
+            self.close()
+            raise InjectorError(f"입력 주입 프로세스 시작 실패: {ready.get('error')}")
+        self.pid = ready['pid']
+    
+    def run(self, program: CompiledProgram, events: Optional[Iterable[ProgramEvent]] = None,
+            stop_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        """
+        프로그램을 주입 프로세스에서 실행하고 결과를 기다립니다.
+        
+        이벤트는 링이 허용하는 만큼 앞서 기록되며, 나머지는 주입기가 소비하는 대로 이어서 기록됩니다.
+        다른 프로그램이 실행 중이면 끝날 때까지 기다린 뒤 실행합니다.
+        
+        Args:
+            program (CompiledProgram): 실행할 프로그램 (키 테이블 제공)
+            events (Iterable[ProgramEvent], optional): 보낼 이벤트 (기본: program.events,
+                속도 제한 등으로 조정한 스트림을 넘길 수 있음)
+            stop_event (threading.Event, optional): 이 실행의 중단 토큰 (stop()에 같은 토큰을 넘겨 중단)
+        
+        Returns:
+            Dict[str, Any]: executed_actions, execution_time, stopped, completed, error, timing
+        
+        Raises:
+            InjectorError: 주입 프로세스가 실행 중이 아니거나 도중에 종료된 경우
+        """
+        abort = stop_event if stop_event is not None else threading.Event()
+        
+        with self._lock:
+            if not self.is_alive:
+                raise InjectorError("입력 주입 프로세스가 실행 중이 아닙니다")
+            
+            # 주입기는 직전 프로그램의 결과를 보낸 뒤 쉬고 있으므로 여기서 중단 이벤트를 해제해도 안전
+            self._stop_event.clear()
+            self._current = abort
+            try:
+                if abort.is_set():
+                    return {'program_id': 0, 'executed_actions': 0, 'execution_time': 0.0,
+                            'stopped': True, 'error': None, 'timing': {}}
+                return self._run_locked(program, events, abort)
+            finally:
+                self._current = None
+    
+    def _run_locked(self, program: CompiledProgram, events: Optional[Iterable[ProgramEvent]],
+                    abort: threading.Event) -> Dict[str, Any]:
+        """
+        run()의 본체 (잠금 안에서 호출)
+        
+        주입 프로세스가 도중에 종료되면 공유 메모리와 프로세스 간 동기화 객체를 정리하고 InjectorError를 발생시킵니다.
+        """
+        self._program_ids += 1
+        program_id = self._program_ids
+        write = self._ring.write
+        alive = self._process.is_alive
+        
+        try:
+            # 시작 레코드를 기록한 뒤에 키 테이블을 보냄 (주입기는 시작 레코드를 읽은 뒤 키 테이블을 받음)
+            if write(RECORD_BEGIN, program_id, abort=abort, alive=alive):
+                self._conn.send(tuple(program.key_names))
+                for offset_us, op, arg0, arg1, _ in (program.events if events is None else events):
+                    if op == EventOp.KEY_DOWN or op == EventOp.KEY_UP:
+                        written = write(RECORD_EVENT, program_id, offset_us, op, key_code=arg0,
+                                        abort=abort, alive=alive)
+                    else:
+                        written = write(RECORD_EVENT, program_id, offset_us, op, x=arg0, y=arg1,
+                                        abort=abort, alive=alive)
+                    if not written:
+                        break  # 중단 요청 - 남은 이벤트는 보내지 않음
+                
+                # 끝 레코드: 중단되었으면 주입기가 끝 레코드까지 링을 비우므로 자리가 날 때까지 생존만 확인하며 기록
+                if not write(RECORD_END, program_id, abort=abort, alive=alive):
+                    write(RECORD_END, program_id, alive=alive)
+            else:
+                # 시작 레코드를 기록하기 전에 중단됨 - 주입기는 이 프로그램을 모르므로 빈 결과로 끝냄
+                return {'program_id': program_id, 'executed_actions': 0, 'execution_time': 0.0,
+                        'stopped': True, 'error': None, 'timing': {}}
+        
+            while not self._conn.poll(INJECTOR_POLL_SECONDS):
+                if not alive():
+                    raise InjectorError("입력 주입 프로세스가 종료되었습니다")
+            return self._conn.recv()
+        
+        except (InjectorError, OSError, EOFError):
+            if not alive():
+                self.close()
+                raise InjectorError("입력 주입 프로세스가 종료되었습니다")
+            raise
+    
+    def stop(self, stop_event: Optional[threading.Event] = None):
+        """
+        실행 중인 프로그램 중단 요청 (다른 스레드에서 호출 가능)
+        
+        Args:
+            stop_event (threading.Event, optional): run()에 넘긴 중단 토큰.
+                지정하면 그 토큰의 실행이 진행 중일 때만 중단하고, 지정하지 않으면 무조건 중단
+        """
+        current = self._current
+        if stop_event is not None:
+            if current is not stop_event:
+                return
+            stop_event.set()
+        elif current is not None:
+            current.set()
+        if self._stop_event is not None:
+            self._stop_event.set()
+    
+    def close(self):
+        """주입 프로세스 종료 및 공유 메모리 정리"""
+        if self._process is not None:
+            if self._process.is_alive() and self._ring is not None:
+                self.stop()
+                self._ring.try_write(RECORD_SHUTDOWN, 0)
+                self._process.join(INJECTOR_START_TIMEOUT)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+            self._process = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
+        self._stop_event = None
+        self._current = None
@@ -0,0 +1,95 @@
+"""
+MSL (Macro Scripting Language) 입력 상태 추적기 (Input State Tracker)
+실행 중 눌린 키/버튼을 참조 카운트로 추적하여 중복 입력을 걸러내고 해제를 보장합니다.
+
+동작:
+- 키 누름은 참조 카운트를 올리며, 0 -> 1일 때만 실제 key_down을 내보냄
+- 키 뗌은 참조 카운트를 내리며, 1 -> 0일 때만 실제 key_up을 내보냄
+  (다른 홀드나 병렬 분기가 아직 누르고 있으면 뗌을 미룸)
+- 눌려 있지 않은 키의 뗌은 무시
+- 중단/오류 시 남은 키를 한 번에 해제할 수 있도록 목록으로 꺼냄
+
+예) Shift>(Shift+W)에서 안쪽 Shift 누름/뗌은 바깥 홀드가 이미 누르고 있으므로 생략됩니다.
+"""
+
+from typing import Dict, List, Any
+
+
+class InputStateTracker:
+    """
+    키/버튼 참조 카운트 추적기
+    
+    키 코드(CompiledProgram 키 테이블 인덱스) 단위로 동작하며, 한 세션(한 스레드/태스크)에서만 사용합니다.
+    """
+    
+    __slots__ = ('_counts', 'suppressed_downs', 'suppressed_ups')
+    
+    def __init__(self):
+        """Input State Tracker 초기화"""
+        self._counts: Dict[int, int] = {}
+        self.suppressed_downs = 0  # 이미 눌린 키에 대해 생략한 key_down 수
+        self.suppressed_ups = 0    # 아직 누르고 있거나 눌리지 않은 키에 대해 생략한 key_up 수
+    
+    @property
+    def suppressed(self) -> int:
+        """생략한 (백엔드로 보내지 않은) 이벤트 수"""
+        return self.suppressed_downs + self.suppressed_ups
+    
+    @property
+    def held(self) -> List[int]:
+        """현재 눌려 있는 키 코드 목록 (누른 순서)"""
+        return list(self._counts)
+    
+    def is_held(self, key_code: int) -> bool:
+        """키가 눌려 있는지 여부"""
+        return key_code in self._counts
+    
+    def press(self, key_code: int) -> bool:
+        """
+        키 누름 기록
+        
+        Returns:
+            bool: 실제로 key_down을 내보내야 하면 True
+        """
+        count = self._counts.get(key_code, 0)
+        self._counts[key_code] = count + 1
+        if count:
+            self.suppressed_downs += 1
+            return False
+        return True
+    
+    def release(self, key_code: int) -> bool:
+        """
+        키 뗌 기록
+        
+        Returns:
+            bool: 실제로 key_up을 내보내야 하면 True
+        """
+        count = self._counts.get(key_code, 0)
+        if count > 1:
+            self._counts[key_code] = count - 1
+        elif count == 1:
+            del self._counts[key_code]
+            return True
+        self.suppressed_ups += 1
+        return False
+    
+    def release_all(self) -> List[int]:
+        """
+        모든 키를 뗀 상태로 초기화하고, 해제해야 할 키 코드를 누른 역순으로 반환합니다.
+        
+        Returns:
+            List[int]: 아직 눌려 있던 키 코드 목록
+        """
+        held = list(reversed(list(self._counts)))
+        self._counts.clear()
+        return held
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """보고용 딕셔너리"""
+        return {
+            'held_keys': len(self._counts),
+            'suppressed_downs': self.suppressed_downs,
+            'suppressed_ups': self.suppressed_ups,
+            'suppressed_events': self.suppressed
+        }
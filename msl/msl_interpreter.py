@@ -3,21 +3,59 @@ MSL (Macro Scripting Language) 인터프리터 (Interpreter)
 AST를 받아서 실제 키보드/마우스 입력을 실행하는 실행 엔진입니다.
 
 실행 환경:
-- PyAutoGUI를 사용한 실제 입력 제어
-- 멀티스레딩을 통한 병렬 실행 지원
+- 교체 가능한 입력 백엔드를 통한 입력 제어 (기본: PyAutoGUI)
+- AST를 평탄한 이벤트 프로그램으로 컴파일한 뒤 단일 루프로 재생
+- 절대 마감 시각 기반 스케줄러로 이벤트 타이밍 제어
+- asyncio 이벤트 루프에서 여러 프로그램을 동시에 실행하는 비동기 모드
+- 중단 이벤트로 모든 대기를 즉시 깨우는 중단 처리 및 중단 지연 측정
+- 참조 카운트 기반 입력 상태 추적 (중복 누름/뗌 생략, 중단/오류 시 남은 키 일괄 해제)
+- 장치 종류별 토큰 버킷 속도 제한 (이벤트를 버리지 않고 일정을 최소한으로 늘림)
+- 공유 타이머 휠 기반 감시 타이머로 최대 실행 시간 강제 (초과 시 중단, 키 해제, 시간 초과 결과)
 - 안전성 검사 및 오류 처리
-- 실행 로그 및 성능 측정
+- 실행 로그 및 성능 측정 (스레드별 샤드 기반 메트릭, 히스토그램)
+- 실제로 내보낸 입력의 바이너리 실행 추적 (trace_dir 지정 시 세션마다 파일로 기록)
+- 공유 메모리 링 버퍼로 프로그램을 넘기는 프로세스 외부 입력 주입 (injector 지정 시,
+  서버 프로세스의 GIL 경합과 무관하게 전용 프로세스가 대기와 입력 전달을 수행)
+
+구조:
+- MSLInterpreter: 백엔드, 컴파일 캐시, 스케줄러 보정값, 통계 등 공유 자원을 소유하는 엔진
+  (컴파일 캐시는 기본적으로 프로세스 전체에서 공유되어 같은 스크립트는 한 번만 파싱/컴파일)
+- ExecutionSession: 실행 한 번의 컨텍스트, 중단 토큰, 카운터, 결과를 독립적으로 보유
+  (여러 세션이 동시에 실행되어도 서로의 상태를 건드리지 않음)
 """
 
+import sys
+import os
 import time
+import asyncio
+import itertools
 import threading
-import pyautogui
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, Future
 import logging
 
-from backend.parsers.msl_ast import *
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from msl_ast import *
+from .msl_compiler import (MSLCompiler, CompiledProgram, ProgramEvent, EventOp, CompileError,
+                           DEFAULT_COALESCE_EPSILON_US, coalesce_events)
+from .msl_scheduler import DeadlineScheduler, AsyncDeadlineScheduler
+from .msl_backend import InputBackend, PyAutoGUIBackend
+from .msl_metrics import ExecutionMetrics, MetricsShard
+from .msl_program_cache import ProgramCache, get_program_cache, make_key
+from .msl_input_state import InputStateTracker
+from .msl_trace import TraceRecorder, DEFAULT_TRACE_CAPACITY, TRACE_EXTENSION
+from .msl_rate_limit import RateLimit, RateShaper, DEFAULT_RATE_LIMITS
+from .msl_watchdog import TimerHandle, get_timer_wheel
+from .msl_injector import InjectorProcess
+
+# 노드 타입별 입력 전달 지연 메트릭 이름
+_DISPATCH_METRICS = {node_type: f"dispatch_us.{node_type.value}" for node_type in NodeType}
+_DISPATCH_METRIC_UNKNOWN = "dispatch_us.UNKNOWN"
+
+# 세션 최대 실행 시간 기본값 (초)
+DEFAULT_MAX_EXECUTION_TIME = 30.0
 
 
 @dataclass
@@ -28,10 +66,10 @@ class ExecutionContext:
     start_time: float
     logger: logging.Logger
     safety_enabled: bool = True
-    max_execution_time: float = 30.0  # 최대 실행 시간 (초)
+    max_execution_time: float = DEFAULT_MAX_EXECUTION_TIME  # 최대 실행 시간 (초, 0이면 제한 없음)
 
 
-@dataclass 
+@dataclass
 class ExecutionResult:
     """실행 결과"""
     success: bool
@@ -39,6 +77,7 @@ class ExecutionResult:
     error_message: Optional[str] = None
     executed_actions: int = 0
     performance_metrics: Dict[str, Any] = None
+    timed_out: bool = False  # 최대 실행 시간 초과로 중단되었는지 여부
 
 
 class ExecutionError(Exception):
@@ -46,526 +85,825 @@ class ExecutionError(Exception):
     pass
 
 
-class MSLInterpreter(MSLVisitor):
-    """MSL 인터프리터"""
+class ExecutionSession:
+    """
+    실행 세션 - 컴파일된 프로그램 한 번의 실행
     
-    def __init__(self):
-        """MSL Interpreter 초기화"""
-        # PyAutoGUI 설정
-        pyautogui.FAILSAFE = True  # 마우스를 화면 모서리로 이동하면 중단
-        pyautogui.PAUSE = 0.01     # 기본 지연 시간
+    컨텍스트, 중단 토큰(threading.Event), 입력 상태, 실행 카운터, 결과를 세션마다 따로 가지므로
+    같은 엔진에서 여러 세션을 스레드나 태스크로 동시에 실행해도 안전합니다.
+    세션은 한 번만 실행할 수 있습니다.
+    """
+    
+    def __init__(self, engine: 'MSLInterpreter', program: CompiledProgram,
+                 variables: Dict[str, Any], session_id: str):
+        """
+        Execution Session 초기화
         
-        # 실행 환경
-        self.context: Optional[ExecutionContext] = None
+        Args:
+            engine (MSLInterpreter): 공유 자원을 제공하는 엔진
+            program (CompiledProgram): 실행할 프로그램
+            variables (Dict[str, Any]): 변수 딕셔너리 (컨텍스트 기록용)
+            session_id (str): 세션(실행) ID
+        """
+        self.engine = engine
+        self.program = program
+        self.session_id = session_id
+        self.context = ExecutionContext(
+            variables=variables,
+            execution_id=session_id,
+            start_time=0.0,
+            logger=engine.logger,
+            safety_enabled=True,
+            max_execution_time=engine.max_execution_time
+        )
+        
+        # 세션 상태
+        self.stop_event = threading.Event()  # 설정되면 이 세션의 모든 대기가 즉시 깨어남
         self.is_running = False
-        self.thread_pool = ThreadPoolExecutor(max_workers=10)
-        
-        # 통계
-        self.execution_stats = {
-            'total_executions': 0,
-            'successful_executions': 0,
-            'failed_executions': 0,
-            'average_execution_time': 0.0
-        }
+        self.executed_actions = 0
+        self.input_state = InputStateTracker()
+        self.rate_shaper = RateShaper(engine.rate_limits)
+        self.timing: Dict[str, Any] = {}
+        self.result: Optional[ExecutionResult] = None
+        self.stop_requested_ns: Optional[int] = None
+        self.stop_latency_ns: Optional[int] = None
+        self.trace: Optional[TraceRecorder] = None
+        self.timed_out = False
+        self._completed = False  # 모든 이벤트를 내보냈는지 여부 (감시 타이머와 _state_lock으로 동기화)
+        self._state_lock = threading.Lock()
+        self._watchdog: Optional[TimerHandle] = None
+        self._start_ns = 0  # 실행 기준 시각 (time.perf_counter_ns)
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def stopped(self) -> bool:
+        """중단 요청 여부"""
+        return self.stop_event.is_set()
+    
+    def stop(self):
+        """
+        세션 중단 (다른 스레드에서 호출 가능)
         
-        # 키 매핑 (MSL 키 이름 -> PyAutoGUI 키 이름)
-        self.key_mapping = {
-            # 기본 키
-            'Space': 'space',
-            'Enter': 'enter',
-            'Tab': 'tab',
-            'Escape': 'escape',
-            'Backspace': 'backspace',
-            'Delete': 'delete',
-            
-            # 방향키
-            'Up': 'up',
-            'Down': 'down',
-            'Left': 'left',
-            'Right': 'right',
-            
-            # 기능키
-            'F1': 'f1', 'F2': 'f2', 'F3': 'f3', 'F4': 'f4',
-            'F5': 'f5', 'F6': 'f6', 'F7': 'f7', 'F8': 'f8',
-            'F9': 'f9', 'F10': 'f10', 'F11': 'f11', 'F12': 'f12',
-            
-            # 수정자 키
-            'Shift': 'shift',
-            'Ctrl': 'ctrl',
-            'Alt': 'alt',
-            'Win': 'win',
-            
-            # 특수 키
-            'CapsLock': 'capslock',
-            'NumLock': 'numlock',
-            'ScrollLock': 'scrolllock',
-            
-            # 숫자 키패드
-            'Num0': 'num0', 'Num1': 'num1', 'Num2': 'num2',
-            'Num3': 'num3', 'Num4': 'num4', 'Num5': 'num5',
-            'Num6': 'num6', 'Num7': 'num7', 'Num8': 'num8', 'Num9': 'num9',
-        }
+        동기 실행은 대기 중이던 지점에서 즉시 깨어나고, 비동기 실행은 태스크가 취소됩니다.
+        취소는 루프 스레드에서 세션이 아직 그 태스크에서 실행 중인지 확인한 뒤에만 요청하므로
+        실행이 끝난 뒤 도착한 중단이 호출자의 다음 await를 취소하지 않습니다.
+        """
+        if self.stop_requested_ns is None:
+            self.stop_requested_ns = time.perf_counter_ns()
+        self.stop_event.set()
         
-        # 로거 설정
-        self.logger = logging.getLogger('MSLInterpreter')
-        self.logger.setLevel(logging.INFO)
+        injector = self.engine.injector
+        if injector is not None:
+            injector.stop(self.stop_event)
+        
+        task = self._task
+        if task is not None:
+            task.get_loop().call_soon_threadsafe(self._cancel_task, task)
     
-    def execute(self, ast: MSLNode, variables: Dict[str, Any] = None) -> ExecutionResult:
+    def _cancel_task(self, task: asyncio.Task):
+        """루프 스레드에서 실행: 세션이 아직 task에서 실행 중일 때만 취소"""
+        if self._task is task and self.is_running and not self._completed:
+            task.cancel()
+    
+    def run(self) -> ExecutionResult:
         """
-        AST를 실행합니다.
+        현재 스레드에서 프로그램을 실행합니다.
         
-        Args:
-            ast (MSLNode): 실행할 AST
-            variables (Dict[str, Any], optional): 변수 딕셔너리
-            
         Returns:
             ExecutionResult: 실행 결과
         """
-        if variables is None:
-            variables = {}
+        self._begin()
         
-        # 실행 컨텍스트 생성
-        execution_id = f"exec_{int(time.time() * 1000)}"
-        self.context = ExecutionContext(
-            variables=variables,
-            execution_id=execution_id,
-            start_time=time.time(),
-            logger=self.logger,
-            safety_enabled=True
-        )
+        try:
+            self.engine.logger.info(f"MSL 실행 시작: {self.session_id}, 이벤트 {len(self.program)}개")
+            if self.engine.injector is not None:
+                self._run_remote()
+            else:
+                self._run_events()
+            if self.timed_out and not self._completed:
+                return self._finish_timeout()
+            return self._finish_success()
         
-        # 실행 상태 설정
-        self.is_running = True
+        except Exception as e:
+            return self._finish_failure(str(e))
+        
+        finally:
+            self._end()
+    
+    async def run_async(self) -> ExecutionResult:
+        """
+        현재 이벤트 루프에서 프로그램을 실행합니다.
+        
+        태스크가 취소되면 눌린 키를 모두 뗀 뒤 asyncio.CancelledError를 그대로 전파합니다.
+        최대 실행 시간 초과로 인한 취소는 전파하지 않고 시간 초과 결과를 반환합니다.
+        
+        Returns:
+            ExecutionResult: 실행 결과
+        """
+        self._task = asyncio.current_task()
+        self._begin()
         
         try:
-            self.logger.info(f"MSL 실행 시작: {execution_id}")
-            
-            # AST 실행
-            result = ast.accept(self)
-            
-            # 실행 시간 계산
-            execution_time = time.time() - self.context.start_time
-            
-            # 성공 결과 반환
-            execution_result = ExecutionResult(
-                success=True,
-                execution_time=execution_time,
-                executed_actions=getattr(self.context, 'action_count', 0),
-                performance_metrics={
-                    'start_time': self.context.start_time,
-                    'end_time': time.time(),
-                    'execution_id': execution_id
-                }
-            )
-            
-            # 통계 업데이트
-            self.execution_stats['total_executions'] += 1
-            self.execution_stats['successful_executions'] += 1
-            self._update_average_execution_time(execution_time)
-            
-            self.logger.info(f"MSL 실행 완료: {execution_id}, 시간: {execution_time:.3f}s")
-            
-            return execution_result
-            
+            self.engine.logger.info(f"MSL 비동기 실행 시작: {self.session_id}, 이벤트 {len(self.program)}개")
+            if self.engine.injector is not None:
+                await self._run_remote_async()
+            else:
+                await self._run_events_async()
+            return self._finish_success()
+        
+        except asyncio.CancelledError:
+            # 눌린 키는 _run_events_async에서 이미 해제됨
+            if self.stop_requested_ns is not None:
+                self._record_stop_latency()
+            if self.timed_out:
+                # 감시 타이머가 요청한 취소는 여기서 끝냄. Task.uncancel은 Python 3.11+에만 있으며,
+                # 그 이전 버전은 취소 요청 수를 세지 않으므로 CancelledError를 잡는 것만으로 취소가 끝남
+                uncancel = getattr(self._task, 'uncancel', None)
+                if uncancel is not None:
+                    uncancel()
+                return self._finish_timeout()
+            self._finish_failure("실행이 취소되었습니다")
+            raise
+        
         except Exception as e:
-            # 실행 오류 처리
-            execution_time = time.time() - self.context.start_time
-            error_message = str(e)
-            
-            self.logger.error(f"MSL 실행 오류: {execution_id}, 오류: {error_message}")
-            
-            # 실패 결과 반환
-            execution_result = ExecutionResult(
-                success=False,
-                execution_time=execution_time,
-                error_message=error_message,
-                executed_actions=getattr(self.context, 'action_count', 0)
-            )
-            
-            # 통계 업데이트
-            self.execution_stats['total_executions'] += 1
-            self.execution_stats['failed_executions'] += 1
-            self._update_average_execution_time(execution_time)
-            
-            return execution_result
-            
+            return self._finish_failure(str(e))
+        
         finally:
-            self.is_running = False
-            self.context = None
-    
-    def stop_execution(self):
-        """실행 중단"""
-        self.is_running = False
-        self.logger.info("MSL 실행 중단 요청")
+            self._end()
     
-    # Visitor 패턴 구현
+    # 프로그램 실행 루프
     
-    def visit_key_node(self, node: KeyNode):
-        """키 입력 실행"""
-        if not self.is_running:
-            return
+    def _run_events(self):
+        """
+        이벤트를 오프셋 시각에 맞춰 차례로 디스패치합니다.
         
-        key_name = self._map_key_name(node.key_name)
+        모든 이벤트의 마감 시각은 실행 시작 기준 절대 시각으로 계산되므로
+        개별 대기의 오차가 누적되지 않으며, 이벤트별 지연은 timing에 기록됩니다.
+        시각이 coalesce_epsilon_us 이내인 이벤트들은 하나의 일괄 입력으로 내보냅니다.
+        중단되거나 오류가 발생하면 아직 눌려 있는 키를 모두 뗍니다.
+        """
+        scheduler = self.engine._create_scheduler(self.stop_event)
+        metrics = self.engine.metrics.shard()
+        scheduler.start()
+        self._start_ns = scheduler.start_ns
         
         try:
-            self.logger.debug(f"키 입력: {node.key_name} -> {key_name}")
-            pyautogui.press(key_name)
-            self._increment_action_count()
-            
-        except Exception as e:
-            raise ExecutionError(f"키 입력 실패: {node.key_name}, 오류: {e}")
+            for offset_us, batch in self._batches():
+                lateness_ns = scheduler.wait_until_offset(offset_us)
+                if lateness_ns is None:
+                    break  # 중단 요청
+                
+                metrics.observe('jitter_us', lateness_ns / 1000)
+                self._dispatch_batch(offset_us, batch, metrics)
+            else:
+                self._mark_completed()
+        
+        finally:
+            self._release_keys()
+            self.timing = scheduler.get_statistics()
+            self._record_run_state(metrics, self.input_state.suppressed, self.input_state.to_dict())
+            if self.stopped:
+                self.timing['stopped'] = True
+                self.timing['stop_latency_us'] = self._record_stop_latency()
+    
+    async def _run_events_async(self):
+        """_run_events의 비동기 버전 (취소 시에도 눌린 키를 모두 뗌)"""
+        scheduler = AsyncDeadlineScheduler()
+        metrics = self.engine.metrics.shard()  # 루프 스레드의 샤드 (같은 루프의 태스크끼리 공유)
+        scheduler.start()
+        self._start_ns = time.perf_counter_ns()
+        
+        try:
+            for offset_us, batch in self._batches():
+                lateness_ns = await scheduler.wait_until_offset(offset_us)
+                metrics.observe('jitter_us', lateness_ns / 1000)
+                self._dispatch_batch(offset_us, batch, metrics)
+            self._mark_completed()
+        
+        finally:
+            self._release_keys()
+            self.timing = scheduler.get_statistics()
+            self._record_run_state(metrics, self.input_state.suppressed, self.input_state.to_dict())
     
-    def visit_number_node(self, node: NumberNode):
-        """숫자 노드 (일반적으로 직접 실행되지 않음)"""
-        return node.number
+    def _run_remote(self):
+        """
+        _run_events의 프로세스 외부 버전: 속도 제한으로 조정한 이벤트를 주입 프로세스로 넘기고
+        주입 프로세스가 보고한 실행 결과(입력 수, 타이밍, 입력 상태)를 세션에 반영합니다.
+        대기와 입력 전달, 중단/오류 시 키 해제는 주입 프로세스에서 수행됩니다.
+        """
+        metrics = self.engine.metrics.shard()
+        self._start_ns = time.perf_counter_ns()
+        report = self.engine.injector.run(self.program, self.rate_shaper.shape(self.program.events),
+                                          self.stop_event)
+        if report.get('completed'):
+            self._mark_completed()
+        
+        self.executed_actions = report['executed_actions']
+        self.timing = report['timing']
+        remote_state = self.timing.get('input_state', {})
+        self._record_run_state(metrics, remote_state.get('suppressed_events', 0), remote_state)
+        if self.stopped:
+            self.timing['stopped'] = True
+            if self._task is None:  # 비동기 실행은 run_async에서 기록
+                self.timing['stop_latency_us'] = self._record_stop_latency()
+        if report['error']:
+            raise ExecutionError(f"입력 주입 실패: {report['error']}")
+    
+    async def _run_remote_async(self):
+        """_run_remote의 비동기 버전 (취소되면 주입 프로세스의 실행도 중단하고 끝날 때까지 기다림)"""
+        future = asyncio.get_running_loop().run_in_executor(None, self._run_remote)
+        try:
+            await asyncio.shield(future)
+        except asyncio.CancelledError:
+            self.engine.injector.stop(self.stop_event)
+            await asyncio.wait([future])
+            raise
+    
+    def _batches(self):
+        """속도 제한으로 일정을 조정한 뒤 일괄 입력 단위로 묶은 이벤트"""
+        events = self.rate_shaper.shape(self.program.events)
+        return coalesce_events(events, self.engine.coalesce_epsilon_us)
     
-    def visit_variable_node(self, node: VariableNode):
-        """변수 참조 실행"""
-        if node.variable_name not in self.context.variables:
-            raise ExecutionError(f"정의되지 않은 변수: ${node.variable_name}")
+    def _dispatch_batch(self, offset_us: int, batch: Tuple[ProgramEvent, ...], metrics: MetricsShard):
+        """
+        이벤트 묶음을 하나의 일괄 입력으로 백엔드에 내보내고 노드 타입별 전달 지연을 기록합니다.
         
-        variable_value = self.context.variables[node.variable_name]
+        키 누름/뗌은 입력 상태 추적기를 거치므로 이미 눌린 키의 누름과
+        다른 동작이 아직 누르고 있는 키의 뗌은 내보내지 않습니다.
+        추적 중이면 실제로 내보낸 입력마다 (보낸 시각, 예정 시각) 레코드를 남깁니다.
+        """
+        key_names = self.program.key_names
+        input_state = self.input_state
+        trace = self.trace
+        inputs = []
+        traced = [] if trace is not None else None  # 추적할 (연산, 인자0, 인자1)
+        source = None  # 첫 입력 이벤트를 만든 노드 타입
+        
+        for _, op, arg0, arg1, event_source in batch:
+            if op == EventOp.KEY_DOWN:
+                if not input_state.press(arg0):
+                    continue
+                inputs.append(('key_down', (key_names[arg0],)))
+            elif op == EventOp.KEY_UP:
+                if not input_state.release(arg0):
+                    continue
+                inputs.append(('key_up', (key_names[arg0],)))
+            elif op == EventOp.MOUSE_MOVE:
+                inputs.append(('move', (arg0, arg1)))
+            elif op == EventOp.WHEEL:
+                inputs.append(('scroll', (arg0,)))
+            else:
+                continue
+            
+            if source is None:
+                source = event_source
+            if traced is not None:
+                traced.append((op, arg0, arg1))
         
-        # 변수 값이 AST 노드인 경우 실행
-        if isinstance(variable_value, MSLNode):
-            return variable_value.accept(self)
-        else:
-            return variable_value
-    
-    def visit_mouse_coord_node(self, node: MouseCoordNode):
-        """마우스 이동 실행"""
-        if not self.is_running:
+        if not inputs:
             return
         
+        dispatch_start = time.perf_counter_ns()
         try:
-            self.logger.debug(f"마우스 이동: ({node.x}, {node.y})")
-            pyautogui.moveTo(node.x, node.y)
-            self._increment_action_count()
-            
+            self.engine.backend.send_batch(inputs)
         except Exception as e:
-            raise ExecutionError(f"마우스 이동 실패: ({node.x}, {node.y}), 오류: {e}")
-    
-    def visit_wheel_node(self, node: WheelNode):
-        """휠 제어 실행"""
-        if not self.is_running:
+            actions = ', '.join(action for action, _ in inputs)
+            raise ExecutionError(f"입력 실행 실패: [{actions}], 오류: {e}")
+        
+        if traced is not None:
+            scheduled_ns = self._start_ns + offset_us * 1000
+            for op, arg0, arg1 in traced:
+                if op == EventOp.KEY_DOWN or op == EventOp.KEY_UP:
+                    trace.record(dispatch_start, op, arg0, 0, 0, scheduled_ns)
+                else:
+                    trace.record(dispatch_start, op, 0, arg0, arg1, scheduled_ns)
+        
+        metrics.observe(_DISPATCH_METRICS.get(source, _DISPATCH_METRIC_UNKNOWN),
+                        (time.perf_counter_ns() - dispatch_start) / 1000)
+        self.executed_actions += len(inputs)
+    
+    def _release_keys(self):
+        """
+        중단/오류 시에도 아직 눌린 키를 하나의 일괄 입력으로 해제합니다.
+        
+        일괄 해제가 실패하면 키마다 따로 해제를 시도하여 가능한 한 많은 키를 뗍니다.
+        """
+        held = self.input_state.release_all()
+        if not held:
             return
         
+        key_names = self.program.key_names
+        backend = self.engine.backend
         try:
-            scroll_amount = node.amount if node.direction == '+' else -node.amount
-            self.logger.debug(f"휠 스크롤: {scroll_amount}")
-            pyautogui.scroll(scroll_amount)
-            self._increment_action_count()
-            
-        except Exception as e:
-            raise ExecutionError(f"휠 제어 실패: {node.direction}{node.amount}, 오류: {e}")
-    
-    def visit_sequential_node(self, node: SequentialNode):
-        """순차 실행"""
-        if not self.is_running:
+            backend.send_batch([('key_up', (key_names[key_code],)) for key_code in held])
             return
+        except Exception:
+            self.engine.logger.warning(f"일괄 키 해제 실패, 개별 해제 시도: {len(held)}개")
+        
+        for key_code in held:
+            try:
+                backend.key_up(key_names[key_code])
+            except Exception:
+                self.engine.logger.warning(f"키 해제 실패: {key_names[key_code]}")
+    
+    def _record_run_state(self, metrics: MetricsShard, suppressed: int, input_state: Dict[str, Any]):
+        """실행 카운터, 입력 상태, 속도 제한 통계를 기록"""
+        metrics.increment('actions', self.executed_actions)
+        if suppressed:
+            metrics.increment('input.suppressed', suppressed)
+        self.timing['input_state'] = input_state
+        
+        shaper = self.rate_shaper
+        if shaper.delayed_events:
+            metrics.increment('rate_limit.delayed', shaper.delayed_events)
+            metrics.observe('rate_limit.stretch_us', shaper.stretch_us)
+        self.timing['rate_limit'] = shaper.to_dict()
+    
+    # 헬퍼 메서드들
+    
+    def _begin(self):
+        """실행 시작 처리"""
+        if self.context.start_time:
+            raise ExecutionError(f"이미 실행된 세션입니다: {self.session_id}")
         
-        self.logger.debug(f"순차 실행 시작: {len(node.children)}개 액션")
+        self.context.start_time = time.time()
+        self.is_running = True
+        self.trace = self.engine._create_trace(self)
+        self.engine._register_session(self)
         
-        for child in node.children:
-            if not self.is_running:
-                break
-            child.accept(self)
+        if self.context.max_execution_time > 0:
+            self._watchdog = get_timer_wheel().schedule(self.context.max_execution_time, self._on_timeout)
     
-    def visit_simultaneous_node(self, node: SimultaneousNode):
-        """동시 실행"""
-        if not self.is_running:
-            return
+    def _end(self):
+        """실행 종료 처리"""
+        self.is_running = False
+        self._task = None
+        if self._watchdog is not None:
+            self._watchdog.cancel()
+            self._watchdog = None
+        if self.trace is not None:
+            try:
+                self.trace.close()
+            except OSError as e:
+                self.engine.logger.warning(f"실행 추적 기록 실패: {self.session_id}, 오류: {e}")
+        self.engine._unregister_session(self)
+    
+    def _mark_completed(self):
+        """모든 이벤트를 내보냈음을 기록 (이후의 감시 타이머 콜백은 아무 일도 하지 않음)"""
+        with self._state_lock:
+            self._completed = True
+    
+    def _on_timeout(self):
+        """
+        감시 타이머 콜백 (타이머 휠 스레드): 최대 실행 시간이 지나면 세션 중단
         
-        self.logger.debug(f"동시 실행 시작: {len(node.children)}개 액션")
+        완료 기록과 같은 잠금 안에서 확인하므로 모든 이벤트를 내보낸 뒤 도착한 콜백은
+        끝난 실행을 시간 초과로 보고하지 않습니다.
+        """
+        with self._state_lock:
+            if not self.is_running or self._completed:
+                return
+            self.timed_out = True
+        self.engine.logger.warning(
+            f"MSL 실행 시간 초과: {self.session_id}, 제한 {self.context.max_execution_time}초")
+        self.stop()
+    
+    def _record_stop_latency(self) -> Optional[float]:
+        """
+        중단 요청부터 지금(키 해제 완료)까지의 지연을 기록합니다.
         
-        # 모든 키를 동시에 누름
-        keys_to_press = []
+        Returns:
+            Optional[float]: 중단 지연 (마이크로초), 중단 요청이 없었으면 None
+        """
+        if self.stop_requested_ns is None:
+            return None
+        
+        self.stop_latency_ns = time.perf_counter_ns() - self.stop_requested_ns
+        self.engine._record_stop_latency(self)
+        return round(self.stop_latency_ns / 1000, 3)
+    
+    def _finish_success(self) -> ExecutionResult:
+        """성공 결과 생성 및 통계 업데이트"""
+        start_time = self.context.start_time
+        end_time = time.time()
+        execution_time = end_time - start_time
+        
+        self.result = ExecutionResult(
+            success=True,
+            execution_time=execution_time,
+            executed_actions=self.executed_actions,
+            performance_metrics={
+                'start_time': start_time,
+                'end_time': end_time,
+                'execution_id': self.session_id,
+                'event_count': len(self.program),
+                'scheduled_duration_us': self.program.duration_us,
+                'timing': self.timing,
+                'trace_file': self.trace.path if self.trace is not None else None
+            }
+        )
         
-        # 키 노드들만 수집
-        for child in node.children:
-            if isinstance(child, KeyNode):
-                key_name = self._map_key_name(child.key_name)
-                keys_to_press.append(key_name)
-            elif isinstance(child, GroupNode) and len(child.children) == 1:
-                # 그룹 내의 키도 포함
-                inner_child = child.children[0]
-                if isinstance(inner_child, KeyNode):
-                    key_name = self._map_key_name(inner_child.key_name)
-                    keys_to_press.append(key_name)
+        self.engine._record_result(self.result)
+        self.engine.logger.info(f"MSL 실행 완료: {self.session_id}, 시간: {execution_time:.3f}s")
+        return self.result
+    
+    def _finish_timeout(self) -> ExecutionResult:
+        """시간 초과 결과 생성 및 통계 업데이트"""
+        self.engine.metrics.increment('executions.timed_out')
+        result = self._finish_failure(
+            f"최대 실행 시간({self.context.max_execution_time}초)을 초과하여 중단되었습니다")
+        result.timed_out = True
+        result.performance_metrics = {'execution_id': self.session_id, 'timing': self.timing}
+        return result
+    
+    def _finish_failure(self, error_message: str) -> ExecutionResult:
+        """실패 결과 생성 및 통계 업데이트"""
+        execution_time = time.time() - self.context.start_time
+        
+        self.result = ExecutionResult(
+            success=False,
+            execution_time=execution_time,
+            error_message=error_message,
+            executed_actions=self.executed_actions
+        )
         
-        try:
-            if keys_to_press:
-                # 여러 키 동시 입력
-                self.logger.debug(f"동시 키 입력: {', '.join(keys_to_press)}")
-                pyautogui.hotkey(*keys_to_press)
-                self._increment_action_count()
-            
-            # 키가 아닌 다른 액션들은 순차 실행
-            for child in node.children:
-                if not isinstance(child, KeyNode) and not self.is_running:
-                    break
-                if not isinstance(child, KeyNode):
-                    child.accept(self)
-                    
-        except Exception as e:
-            raise ExecutionError(f"동시 실행 실패: {e}")
-    
-    def visit_hold_chain_node(self, node: HoldChainNode):
-        """홀드 연결 실행"""
-        if not self.is_running:
-            return
+        self.engine._record_result(self.result)
+        self.engine.logger.error(f"MSL 실행 오류: {self.session_id}, 오류: {error_message}")
+        return self.result
+
+
+class MSLInterpreter:
+    """
+    MSL 인터프리터 (실행 엔진)
+    
+    입력 백엔드, 스크립트 컴파일 캐시, 스케줄러 보정값, 실행 통계를 공유 자원으로 소유하고
+    실행마다 ExecutionSession을 만들어 실행합니다. 모든 공유 상태는 잠금으로 보호되므로
+    여러 스레드/태스크에서 execute()를 동시에 호출할 수 있습니다.
+    """
+    
+    def __init__(self, backend: Optional[InputBackend] = None,
+                 coalesce_epsilon_us: int = DEFAULT_COALESCE_EPSILON_US,
+                 program_cache: Optional[ProgramCache] = None,
+                 trace_dir: Optional[str] = None,
+                 trace_capacity: int = DEFAULT_TRACE_CAPACITY,
+                 rate_limits: Optional[Dict[str, Optional[RateLimit]]] = None,
+                 max_execution_time: float = DEFAULT_MAX_EXECUTION_TIME,
+                 injector: Optional[InjectorProcess] = None):
+        """
+        MSL Interpreter 초기화
         
-        self.logger.debug(f"홀드 연결 실행: {len(node.children)}개 액션")
+        Args:
+            backend (InputBackend, optional): 입력 백엔드. 지정하지 않으면 PyAutoGUI 사용
+            coalesce_epsilon_us (int): 하나의 일괄 입력으로 묶을 이벤트 간 최대 시각 차이
+            program_cache (ProgramCache, optional): 스크립트 컴파일 캐시. 지정하지 않으면 프로세스 공유 캐시 사용
+            trace_dir (str, optional): 실행 추적 파일을 기록할 디렉토리. 지정하지 않으면 추적하지 않음
+            trace_capacity (int): 추적 링 버퍼 크기 (레코드 수, 가득 찰 때마다 파일로 내보냄)
+            rate_limits (Dict[str, RateLimit], optional): 장치 종류(keyboard, mouse, wheel)별 속도 한도.
+                지정하지 않으면 DEFAULT_RATE_LIMITS, 빈 딕셔너리이면 제한하지 않음
+            max_execution_time (float): 세션 최대 실행 시간 (초, 0이면 제한 없음)
+            injector (InjectorProcess, optional): 프로세스 외부 입력 주입기 (시작된 상태).
+                지정하면 세션은 프로그램을 주입 프로세스로 넘겨 실행하고 backend는 사용하지 않음
+                (실행 추적은 기록되지 않으며, 주입기는 프로그램을 하나씩 차례로 실행)
+        """
+        # 입력 백엔드 (헤드리스 환경에서는 NullBackend/RecordingBackend 사용)
+        self.backend = backend if backend is not None else PyAutoGUIBackend()
+        
+        # 공유 실행 자원
+        self.coalesce_epsilon_us = coalesce_epsilon_us
+        self.spin_threshold_ns: Optional[int] = None  # 첫 실행 시 보정
+        self.program_cache = program_cache if program_cache is not None else get_program_cache()
+        self.trace_dir = trace_dir
+        self.trace_capacity = trace_capacity
+        self.rate_limits = dict(DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits)
+        self.max_execution_time = max_execution_time or 0.0
+        self.injector = injector
+        self.sessions: Dict[str, ExecutionSession] = {}  # 진행 중인 세션
+        self.last_session: Optional[ExecutionSession] = None
+        self._session_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._parser = None
+        
+        # 통계 (스레드별 샤드에 잠금 없이 기록, 읽을 때 병합)
+        self.metrics = ExecutionMetrics()
+        self.last_stop_latency_ms: Optional[float] = None
         
-        # 첫 번째 키를 누르고 유지
-        if node.children and isinstance(node.children[0], KeyNode):
-            first_key = self._map_key_name(node.children[0].key_name)
-            
-            try:
-                self.logger.debug(f"홀드 시작: {first_key}")
-                pyautogui.keyDown(first_key)
-                
-                # 나머지 키들을 순차적으로 실행
-                for child in node.children[1:]:
-                    if not self.is_running:
-                        break
-                    child.accept(self)
-                    time.sleep(0.05)  # 짧은 지연
-                
-                # 첫 번째 키 해제
-                self.logger.debug(f"홀드 종료: {first_key}")
-                pyautogui.keyUp(first_key)
-                self._increment_action_count()
-                
-            except Exception as e:
-                # 오류 발생 시에도 키 해제
-                try:
-                    pyautogui.keyUp(first_key)
-                except:
-                    pass
-                raise ExecutionError(f"홀드 연결 실행 실패: {e}")
-        else:
-            # 첫 번째가 키가 아닌 경우 순차 실행으로 대체
-            for child in node.children:
-                if not self.is_running:
-                    break
-                child.accept(self)
-    
-    def visit_parallel_node(self, node: ParallelNode):
-        """병렬 실행 (멀티스레딩)"""
-        if not self.is_running:
-            return
+        # 로거 설정
+        self.logger = logging.getLogger('MSLInterpreter')
+        self.logger.setLevel(logging.INFO)
+    
+    @property
+    def is_running(self) -> bool:
+        """진행 중인 세션이 있는지 여부"""
+        return bool(self.sessions)
+    
+    @property
+    def last_timing(self) -> Dict[str, Any]:
+        """마지막으로 끝난 세션의 타이밍 통계"""
+        return self.last_session.timing if self.last_session else {}
+    
+    @property
+    def last_stop_latency_ns(self) -> Optional[int]:
+        """마지막으로 끝난 세션의 중단 지연"""
+        return self.last_session.stop_latency_ns if self.last_session else None
+    
+    def compile(self, ast: MSLNode, variables: Dict[str, Any] = None) -> CompiledProgram:
+        """
+        AST를 실행 프로그램으로 컴파일합니다.
         
-        self.logger.debug(f"병렬 실행 시작: {len(node.children)}개 스레드")
+        컴파일된 프로그램은 불변이므로 execute_program()으로 여러 번 재생할 수 있습니다.
+        컴파일러는 호출마다 새로 만들어지므로 동시에 호출해도 안전합니다.
         
-        # 스레드풀을 사용한 병렬 실행
-        futures = []
+        Args:
+            ast (MSLNode): 컴파일할 AST
+            variables (Dict[str, Any], optional): 변수 딕셔너리
         
-        for child in node.children:
-            if not self.is_running:
-                break
-            
-            # 각 자식을 별도 스레드에서 실행
-            future = self.thread_pool.submit(self._execute_in_thread, child)
-            futures.append(future)
-        
-        # 모든 스레드 완료 대기
-        for future in futures:
-            if not self.is_running:
-                break
-            try:
-                future.result(timeout=10.0)  # 10초 타임아웃
-            except Exception as e:
-                self.logger.error(f"병렬 실행 오류: {e}")
+        Returns:
+            CompiledProgram: 컴파일된 프로그램
+        """
+        return MSLCompiler().compile(ast, variables)
     
-    def visit_toggle_node(self, node: ToggleNode):
-        """토글 실행"""
-        if not self.is_running:
-            return
+    def compile_script(self, script: str, variables: Dict[str, Any] = None) -> CompiledProgram:
+        """
+        MSL 스크립트를 파싱/컴파일하고 결과를 캐시합니다.
         
-        # 토글 대상 실행 (보통 키)
-        if node.children:
-            child = node.children[0]
-            if isinstance(child, KeyNode):
-                key_name = self._map_key_name(child.key_name)
-                
-                try:
-                    self.logger.debug(f"토글: {key_name}")
-                    pyautogui.press(key_name)
-                    self._increment_action_count()
-                    
-                except Exception as e:
-                    raise ExecutionError(f"토글 실행 실패: {key_name}, 오류: {e}")
-            else:
-                child.accept(self)
-    
-    def visit_repeat_node(self, node: RepeatNode):
-        """반복 실행"""
-        if not self.is_running:
-            return
+        캐시 키는 정규화된 스크립트와 변수 바인딩이므로 같은 매크로를 다시 실행하면
+        파싱과 컴파일을 모두 건너뜁니다.
         
-        self.logger.debug(f"반복 실행: {node.count}회")
+        Args:
+            script (str): MSL 스크립트
+            variables (Dict[str, Any], optional): 변수 딕셔너리
         
-        # 간격 시간 찾기
-        interval_time = 0
-        action_node = None
+        Returns:
+            CompiledProgram: 컴파일된 프로그램
         
-        for child in node.children:
-            if isinstance(child, IntervalNode):
-                interval_time = child.interval_time
-            else:
-                action_node = child
+        Raises:
+            CompileError: 정의되지 않은 변수 등 컴파일 오류 발생 시 (오류는 캐시하지 않음)
+        """
+        key = make_key(script, variables)
+        program = self.program_cache.get(key)
+        if program is not None:
+            return program
         
-        if action_node is None:
-            return
+        program = self.compile(self._get_parser().parse(script), variables)
+        self.program_cache.put(key, program)
+        return program
+    
+    def create_session(self, program: CompiledProgram, variables: Dict[str, Any] = None) -> ExecutionSession:
+        """
+        프로그램 실행 세션을 만듭니다 (실행은 run()/run_async() 호출 시 시작).
         
-        # 반복 실행
-        for i in range(node.count):
-            if not self.is_running:
-                break
-            
-            self.logger.debug(f"반복 {i+1}/{node.count}")
-            action_node.accept(self)
-            
-            # 마지막 반복이 아니면 간격 대기
-            if i < node.count - 1 and interval_time > 0:
-                time.sleep(interval_time / 1000.0)  # ms -> seconds
+        Args:
+            program (CompiledProgram): 실행할 프로그램
+            variables (Dict[str, Any], optional): 변수 딕셔너리 (컨텍스트 기록용)
         
-        self._increment_action_count()
+        Returns:
+            ExecutionSession: 새 세션
+        """
+        return ExecutionSession(self, program, variables or {}, self._next_execution_id())
     
-    def visit_continuous_node(self, node: ContinuousNode):
-        """연속 입력 실행"""
-        if not self.is_running:
-            return
+    def execute(self, ast: MSLNode, variables: Dict[str, Any] = None) -> ExecutionResult:
+        """
+        AST를 실행합니다.
         
-        if not node.children:
-            return
+        Args:
+            ast (MSLNode): 실행할 AST
+            variables (Dict[str, Any], optional): 변수 딕셔너리
+        
+        Returns:
+            ExecutionResult: 실행 결과
+        """
+        if variables is None:
+            variables = {}
         
-        action_node = node.children[0]
-        interval = node.interval / 1000.0  # ms -> seconds
+        try:
+            program = self.compile(ast, variables)
+        except CompileError as e:
+            return self._compile_failure(e)
         
-        self.logger.debug(f"연속 입력: {interval*1000}ms 간격")
+        return self.execute_program(program, variables)
+    
+    def execute_script(self, script: str, variables: Dict[str, Any] = None) -> ExecutionResult:
+        """
+        MSL 스크립트를 실행합니다 (컴파일 캐시 사용).
         
-        # 연속 입력 (중단 조건: 특정 키 입력 또는 시간 제한)
-        start_time = time.time()
-        max_duration = 10.0  # 최대 10초
+        Args:
+            script (str): 실행할 MSL 스크립트
+            variables (Dict[str, Any], optional): 변수 딕셔너리
         
-        while self.is_running and (time.time() - start_time) < max_duration:
-            action_node.accept(self)
-            time.sleep(interval)
-            
-            # ESC 키가 눌렸는지 확인 (안전장치)
-            if pyautogui.position() == (0, 0):  # Failsafe 조건
-                break
+        Returns:
+            ExecutionResult: 실행 결과
+        """
+        if variables is None:
+            variables = {}
         
-        self._increment_action_count()
+        try:
+            program = self.compile_script(script, variables)
+        except CompileError as e:
+            return self._compile_failure(e)
+        
+        return self.execute_program(program, variables)
     
-    def visit_delay_node(self, node: DelayNode):
-        """지연 실행"""
-        if not self.is_running:
-            return
+    def execute_program(self, program: CompiledProgram, variables: Dict[str, Any] = None) -> ExecutionResult:
+        """
+        컴파일된 프로그램을 새 세션에서 실행합니다.
         
-        delay_seconds = node.delay_time / 1000.0  # ms -> seconds
-        self.logger.debug(f"지연: {node.delay_time}ms")
-        time.sleep(delay_seconds)
+        Args:
+            program (CompiledProgram): 실행할 프로그램
+            variables (Dict[str, Any], optional): 변수 딕셔너리 (컨텍스트 기록용)
+        
+        Returns:
+            ExecutionResult: 실행 결과
+        """
+        return self.create_session(program, variables).run()
     
-    def visit_hold_node(self, node: HoldNode):
-        """홀드 실행"""
-        if not self.is_running:
-            return
+    async def execute_async(self, ast: MSLNode, variables: Dict[str, Any] = None) -> ExecutionResult:
+        """
+        AST를 이벤트 루프를 막지 않고 실행합니다.
         
-        if not node.children:
-            return
+        Args:
+            ast (MSLNode): 실행할 AST
+            variables (Dict[str, Any], optional): 변수 딕셔너리
         
-        action_node = node.children[0]
-        hold_time = node.hold_time / 1000.0  # ms -> seconds
+        Returns:
+            ExecutionResult: 실행 결과
+        """
+        if variables is None:
+            variables = {}
         
-        if isinstance(action_node, KeyNode):
-            key_name = self._map_key_name(action_node.key_name)
-            
-            try:
-                self.logger.debug(f"홀드: {key_name}, {node.hold_time}ms")
-                pyautogui.keyDown(key_name)
-                time.sleep(hold_time)
-                pyautogui.keyUp(key_name)
-                self._increment_action_count()
-                
-            except Exception as e:
-                # 오류 발생 시에도 키 해제
-                try:
-                    pyautogui.keyUp(key_name)
-                except:
-                    pass
-                raise ExecutionError(f"홀드 실행 실패: {key_name}, 오류: {e}")
-    
-    def visit_interval_node(self, node: IntervalNode):
-        """간격 노드 (일반적으로 다른 노드와 함께 사용됨)"""
-        pass
-    
-    def visit_fade_node(self, node: FadeNode):
-        """페이드 실행 (점진적 전환)"""
-        if not self.is_running:
-            return
+        try:
+            program = self.compile(ast, variables)
+        except CompileError as e:
+            return self._compile_failure(e)
         
-        # 페이드는 복잡한 구현이 필요하므로 일단 일반 실행으로 대체
-        self.logger.debug(f"페이드 (단순 실행): {node.fade_time}ms")
-        for child in node.children:
-            if not self.is_running:
-                break
-            child.accept(self)
+        return await self.execute_program_async(program, variables)
     
-    def visit_group_node(self, node: GroupNode):
-        """그룹 실행"""
-        if not self.is_running:
-            return
+    async def execute_script_async(self, script: str, variables: Dict[str, Any] = None) -> ExecutionResult:
+        """
+        MSL 스크립트를 이벤트 루프를 막지 않고 실행합니다 (컴파일 캐시 사용).
+        
+        Args:
+            script (str): 실행할 MSL 스크립트
+            variables (Dict[str, Any], optional): 변수 딕셔너리
+        
+        Returns:
+            ExecutionResult: 실행 결과
+        """
+        if variables is None:
+            variables = {}
         
-        self.logger.debug("그룹 실행")
-        for child in node.children:
-            if not self.is_running:
-                break
-            child.accept(self)
+        try:
+            program = self.compile_script(script, variables)
+        except CompileError as e:
+            return self._compile_failure(e)
+        
+        return await self.execute_program_async(program, variables)
     
-    # 헬퍼 메서드들
+    async def execute_program_async(self, program: CompiledProgram,
+                                    variables: Dict[str, Any] = None) -> ExecutionResult:
+        """
+        컴파일된 프로그램을 현재 이벤트 루프에서 새 세션으로 실행합니다.
+        
+        태스크가 취소되면 눌린 키를 모두 뗀 뒤 asyncio.CancelledError를 그대로 전파합니다.
+        
+        Args:
+            program (CompiledProgram): 실행할 프로그램
+            variables (Dict[str, Any], optional): 변수 딕셔너리 (컨텍스트 기록용)
+        
+        Returns:
+            ExecutionResult: 실행 결과
+        """
+        return await self.create_session(program, variables).run_async()
     
-    def _map_key_name(self, msl_key: str) -> str:
-        """MSL 키 이름을 PyAutoGUI 키 이름으로 변환"""
-        if msl_key in self.key_mapping:
-            return self.key_mapping[msl_key]
+    def stop_execution(self, session_id: Optional[str] = None):
+        """
+        실행 중단 (다른 스레드에서 호출 가능)
+        
+        Args:
+            session_id (str, optional): 중단할 세션 ID. 지정하지 않으면 진행 중인 모든 세션
+        """
+        with self._lock:
+            if session_id is None:
+                targets = list(self.sessions.values())
+            else:
+                targets = [self.sessions[session_id]] if session_id in self.sessions else []
         
-        # 단일 문자는 그대로 사용
-        if len(msl_key) == 1:
-            return msl_key.lower()
+        for session in targets:
+            session.stop()
+        self.logger.info(f"MSL 실행 중단 요청: {len(targets)}개 세션")
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        실행 통계 반환
+        
+        히스토그램 단위는 마이크로초입니다.
+        - run_duration_us: 실행 시간
+        - jitter_us: 예정 시각 대비 실제 실행 지연
+        - dispatch_us.<노드 타입>: 입력 전달(백엔드 호출) 시간
+        - stop_latency_us: 중단 요청부터 키 해제까지의 시간
+        - rate_limit.stretch_us: 속도 제한으로 늘어난 실행 시간 (제한된 실행만)
+        """
+        snapshot = self.metrics.snapshot()
+        counters = snapshot['counters']
+        histograms = snapshot['histograms']
+        run_duration = histograms.get('run_duration_us')
+        stop_latency = histograms.get('stop_latency_us')
+        
+        stats = {
+            'total_executions': counters.get('executions.total', 0),
+            'successful_executions': counters.get('executions.successful', 0),
+            'failed_executions': counters.get('executions.failed', 0),
+            'average_execution_time': run_duration['mean'] / 1_000_000 if run_duration else 0.0,
+            'total_actions': counters.get('actions', 0),
+            'suppressed_events': counters.get('input.suppressed', 0),
+            'rate_limited_events': counters.get('rate_limit.delayed', 0),
+            'stopped_executions': counters.get('executions.stopped', 0),
+            'timed_out_executions': counters.get('executions.timed_out', 0),
+            'last_stop_latency_ms': self.last_stop_latency_ms,
+            'max_stop_latency_ms': stop_latency['max'] / 1000 if stop_latency else None,
+            'histograms': histograms
+        }
         
-        # 기본적으로 소문자로 변환
-        return msl_key.lower()
+        with self._lock:
+            stats['active_sessions'] = len(self.sessions)
+        stats['cached_programs'] = len(self.program_cache)
+        stats['program_cache'] = self.program_cache.get_statistics()
+        return stats
     
-    def _increment_action_count(self):
-        """액션 카운트 증가"""
-        if self.context:
-            if not hasattr(self.context, 'action_count'):
-                self.context.action_count = 0
-            self.context.action_count += 1
+    # 세션 관리 (ExecutionSession에서 호출)
     
-    def _execute_in_thread(self, node: MSLNode):
-        """스레드에서 노드 실행"""
-        try:
-            return node.accept(self)
-        except Exception as e:
-            self.logger.error(f"스레드 실행 오류: {e}")
-            raise
+    def _register_session(self, session: ExecutionSession):
+        """진행 중인 세션 등록"""
+        with self._lock:
+            self.sessions[session.session_id] = session
+    
+    def _unregister_session(self, session: ExecutionSession):
+        """끝난 세션 제거"""
+        with self._lock:
+            self.sessions.pop(session.session_id, None)
+            self.last_session = session
     
-    def _update_average_execution_time(self, execution_time: float):
-        """평균 실행 시간 업데이트"""
-        total = self.execution_stats['total_executions']
-        current_avg = self.execution_stats['average_execution_time']
+    def _record_result(self, result: ExecutionResult):
+        """실행 결과를 통계에 반영"""
+        metrics = self.metrics.shard()
+        metrics.increment('executions.total')
+        metrics.increment('executions.successful' if result.success else 'executions.failed')
+        metrics.observe('run_duration_us', result.execution_time * 1_000_000)
+    
+    def _record_stop_latency(self, session: ExecutionSession):
+        """세션의 중단 지연을 통계에 반영"""
+        latency_ms = session.stop_latency_ns / 1_000_000
+        
+        metrics = self.metrics.shard()
+        metrics.increment('executions.stopped')
+        metrics.observe('stop_latency_us', session.stop_latency_ns / 1000)
+        self.last_stop_latency_ms = latency_ms
         
-        # 누적 평균 계산
-        new_avg = ((current_avg * (total - 1)) + execution_time) / total
-        self.execution_stats['average_execution_time'] = new_avg
+        self.logger.info(f"MSL 실행 중단 완료: {session.session_id}, 지연 {latency_ms:.3f}ms")
     
-    def get_statistics(self) -> Dict[str, Any]:
-        """실행 통계 반환"""
-        return self.execution_stats.copy()
+    # 헬퍼 메서드들
+    
+    def _compile_failure(self, error: CompileError) -> ExecutionResult:
+        """컴파일 실패 결과 생성 및 통계 업데이트"""
+        self.logger.error(f"MSL 컴파일 오류: {error}")
+        result = ExecutionResult(success=False, execution_time=0.0, error_message=str(error))
+        self._record_result(result)
+        return result
+    
+    def _next_execution_id(self) -> str:
+        """실행 ID 생성 (동시 실행 시에도 겹치지 않도록 일련번호 포함)"""
+        return f"exec_{int(time.time() * 1000)}_{next(self._session_ids)}"
+    
+    def _get_parser(self):
+        """스크립트 파서 (처음 사용할 때 생성)"""
+        if self._parser is None:
+            with self._lock:
+                if self._parser is None:
+                    from .msl_parser import MSLParser
+                    self._parser = MSLParser()
+        return self._parser
+    
+    def _create_trace(self, session: ExecutionSession) -> Optional[TraceRecorder]:
+        """세션용 실행 추적 기록기 생성 (추적이 꺼져 있거나 파일을 만들 수 없으면 None)"""
+        if self.trace_dir is None or self.injector is not None:
+            return None
+        
+        path = os.path.join(self.trace_dir, session.session_id + TRACE_EXTENSION)
+        try:
+            os.makedirs(self.trace_dir, exist_ok=True)
+            return TraceRecorder(path, self.trace_capacity, session.program.key_names,
+                                 {'session_id': session.session_id,
+                                  'duration_us': session.program.duration_us})
+        except OSError as e:
+            self.logger.warning(f"실행 추적 파일 생성 실패: {path}, 오류: {e}")
+            return None
+    
+    def _create_scheduler(self, stop_event: threading.Event) -> DeadlineScheduler:
+        """세션용 스케줄러 생성 (스핀 구간은 엔진 전체에서 최초 1회만 보정)"""
+        if self.spin_threshold_ns is None:
+            with self._lock:
+                if self.spin_threshold_ns is None:
+                    self.spin_threshold_ns = DeadlineScheduler().calibrate()
+        return DeadlineScheduler(self.spin_threshold_ns, stop_event)
 
 
 def test_interpreter():
@@ -573,7 +911,7 @@ def test_interpreter():
     print("=== MSL Interpreter 테스트 ===")
     
     # 간단한 AST 생성 및 테스트
-    from backend.parsers.msl_parser import MSLParser
+    from msl.msl_parser import MSLParser
     
     parser = MSLParser()
     interpreter = MSLInterpreter()
@@ -598,7 +936,7 @@ def test_interpreter():
                 print(f"  실행 성공: {result.execution_time:.3f}s, {result.executed_actions}개 액션")
             else:
                 print(f"  실행 실패: {result.error_message}")
-                
+        
         except Exception as e:
             print(f"  오류: {e}")
         
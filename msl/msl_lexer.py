@@ -22,6 +22,8 @@ from enum import Enum
 from typing import List, Optional, Union, Tuple, NamedTuple
 from dataclasses import dataclass
 
+from .msl_cancel import check_cancelled
+
 
 class TokenType(Enum):
     """토큰 타입 정의"""
@@ -312,8 +314,14 @@ class MSLLexer:
     def tokenize(self) -> List[Token]:
         """텍스트를 토큰으로 분해"""
         self.tokens = []
+        steps = 0
         
         while self.position < len(self.text):
+            # 요청 마감 확인 (256 글자 단위마다)
+            steps += 1
+            if not steps & 0xFF:
+                check_cancelled()
+            
             char = self.current_char()
             
             if char is None:
@@ -0,0 +1,247 @@
+"""
+MSL (Macro Scripting Language) 실행 메트릭 (Metrics)
+실행 엔진의 카운터와 히스토그램을 스레드 안전하고 가볍게 집계합니다.
+
+구조:
+- Histogram: 고정 로그 스케일(1-2-5) 버킷 히스토그램 (메모리 일정, 기록 O(log 버킷))
+- MetricsShard: 스레드 하나가 단독으로 기록하는 카운터/히스토그램 묶음 (잠금 없음)
+- ExecutionMetrics: 스레드별 샤드를 관리하고 읽을 때 병합
+  (종료된 스레드의 샤드는 은퇴 샤드 하나에 합쳐 버리므로 스레드가 바뀌어도 샤드 수는 살아 있는 스레드 수 + 1)
+
+기록 경로에는 잠금이 없으므로 운영 환경에서도 항상 켜 둘 수 있습니다.
+"""
+
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, Optional, Any, Tuple
+
+
+# 기본 히스토그램 버킷 상한 (1-2-5 로그 스케일, 1 ~ 5e8)
+DEFAULT_BUCKETS: Tuple[float, ...] = tuple(
+    float(mantissa * 10 ** exponent) for exponent in range(0, 9) for mantissa in (1, 2, 5)
+)
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램
+    
+    값은 버킷 상한 기준으로 집계되며, 마지막 버킷 상한을 넘는 값은 넘침 버킷에 기록됩니다.
+    백분위수는 해당 버킷의 상한으로 근사합니다 (넘침 버킷은 최댓값).
+    """
+    
+    __slots__ = ('bounds', 'counts', 'count', 'total', 'min', 'max')
+    
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+    
+    def record(self, value: float):
+        """값 하나 기록"""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+    
+    def merge(self, other: 'Histogram'):
+        """다른 히스토그램을 이 히스토그램에 합침 (버킷 경계가 같아야 함)"""
+        if other.bounds != self.bounds:
+            raise ValueError("버킷 경계가 다른 히스토그램은 병합할 수 없습니다")
+        
+        for index, bucket_count in enumerate(other.counts):
+            self.counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+    
+    def copy(self) -> 'Histogram':
+        """복사본 생성"""
+        histogram = Histogram(self.bounds)
+        histogram.merge(self)
+        return histogram
+    
+    @property
+    def mean(self) -> float:
+        """평균값"""
+        return self.total / self.count if self.count else 0.0
+    
+    def percentile(self, percent: float) -> float:
+        """백분위수 근사값 (예: 99.0)"""
+        if not self.count:
+            return 0.0
+        
+        target = self.count * percent / 100
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target and bucket_count:
+                if index >= len(self.bounds):
+                    return self.max
+                return min(self.bounds[index], self.max)
+        return self.max
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """요약 딕셔너리"""
+        return {
+            'count': self.count,
+            'mean': round(self.mean, 3),
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(50.0),
+            'p90': self.percentile(90.0),
+            'p99': self.percentile(99.0)
+        }
+
+
+class MetricsShard:
+    """스레드 하나가 단독으로 기록하는 메트릭 묶음"""
+    
+    __slots__ = ('counters', 'histograms')
+    
+    def __init__(self):
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.histograms: Dict[str, Histogram] = {}
+    
+    def increment(self, name: str, amount: int = 1):
+        self.counters[name] += amount
+    
+    def observe(self, name: str, value: float):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.record(value)
+
+    def merge(self, other: 'MetricsShard'):
+        """다른 샤드의 값을 이 샤드에 합침 (other는 더 이상 기록되지 않아야 함)"""
+        for name, value in other.counters.items():
+            self.counters[name] += value
+        for name, histogram in other.histograms.items():
+            if name in self.histograms:
+                self.histograms[name].merge(histogram)
+            else:
+                self.histograms[name] = histogram.copy()
+
+
+class ExecutionMetrics:
+    """
+    실행 메트릭 집계기
+    
+    기록은 호출 스레드 전용 샤드에만 하므로 잠금이 필요 없고,
+    snapshot()이 모든 샤드를 병합하여 읽습니다. 같은 이벤트 루프의 태스크들은
+    한 스레드에서 실행되므로 하나의 샤드를 공유합니다.
+    
+    샤드는 소유 스레드와 함께 등록되며, 새 샤드를 만들거나 읽을 때 종료된 스레드의 샤드를
+    은퇴 샤드에 합치고 목록에서 제거합니다. 은퇴 샤드는 합칠 때마다 새로 만들어 교체하므로
+    읽는 쪽은 잠금 밖에서도 변하지 않는 샤드를 보게 됩니다.
+    """
+    
+    def __init__(self):
+        """Execution Metrics 초기화"""
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, MetricsShard]] = []
+        self._retired = MetricsShard()  # 종료된 스레드들의 샤드 합계
+        self._lock = threading.Lock()  # 샤드 목록 보호용 (기록 경로에서는 사용하지 않음)
+    
+    @property
+    def shard_count(self) -> int:
+        """등록된 스레드 샤드 수 (은퇴 샤드 제외)"""
+        with self._lock:
+            return len(self._shards)
+    
+    def shard(self) -> MetricsShard:
+        """현재 스레드의 샤드 (처음 호출 시 생성)"""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = MetricsShard()
+            with self._lock:
+                self._prune_locked()
+                self._shards.append((threading.current_thread(), shard))
+            self._local.shard = shard
+            return shard
+    
+    def _prune_locked(self):
+        """종료된 스레드의 샤드를 은퇴 샤드에 합치고 제거 (잠금 안에서 호출)"""
+        dead = [shard for thread, shard in self._shards if not thread.is_alive()]
+        if not dead:
+            return
+        
+        retired = MetricsShard()
+        retired.merge(self._retired)
+        for shard in dead:
+            retired.merge(shard)
+        self._retired = retired
+        self._shards = [(thread, shard) for thread, shard in self._shards if thread.is_alive()]
+    
+    def _all_shards(self) -> List[MetricsShard]:
+        """살아 있는 스레드의 샤드와 은퇴 샤드"""
+        with self._lock:
+            self._prune_locked()
+            return [shard for _, shard in self._shards] + [self._retired]
+    
+    def increment(self, name: str, amount: int = 1):
+        """카운터 증가"""
+        self.shard().increment(name, amount)
+    
+    def observe(self, name: str, value: float):
+        """히스토그램에 값 기록"""
+        self.shard().observe(name, value)
+    
+    def counter(self, name: str) -> int:
+        """카운터 값 (모든 샤드 합계)"""
+        shards = self._all_shards()
+        return sum(shard.counters.get(name, 0) for shard in shards)
+    
+    def histogram(self, name: str) -> Histogram:
+        """히스토그램 (모든 샤드 병합본)"""
+        merged = Histogram()
+        shards = self._all_shards()
+        for shard in shards:
+            histogram = shard.histograms.get(name)
+            if histogram is not None:
+                merged.merge(histogram)
+        return merged
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        모든 샤드를 병합한 메트릭 스냅샷
+        
+        Returns:
+            Dict[str, Any]: {'counters': {...}, 'histograms': {이름: 요약}}
+        """
+        counters: Dict[str, int] = defaultdict(int)
+        histograms: Dict[str, Histogram] = {}
+        
+        shards = self._all_shards()
+        
+        for shard in shards:
+            for name, value in list(shard.counters.items()):
+                counters[name] += value
+            for name, histogram in list(shard.histograms.items()):
+                if name in histograms:
+                    histograms[name].merge(histogram)
+                else:
+                    histograms[name] = histogram.copy()
+        
+        return {
+            'counters': dict(counters),
+            'histograms': {name: histogram.to_dict() for name, histogram in sorted(histograms.items())}
+        }
+    
+    def reset(self):
+        """모든 메트릭 초기화 (기존 샤드는 버려지고 스레드별로 새로 생성됨)"""
+        with self._lock:
+            self._shards = []
+            self._retired = MetricsShard()
+            self._local = threading.local()
@@ -0,0 +1,145 @@
+"""
+MSL (Macro Scripting Language) 마우스 이동 경로 (Motion)
+페이드(<ms>)와 마우스 이동(@(x,y))의 부드러운 이동 경로를 미리 계산합니다.
+
+경로 곡선:
+- linear: 일정한 속도의 직선 이동
+- ease: 천천히 출발해 천천히 멈추는 직선 이동 (smoothstep)
+- bezier: 이동 방향의 옆으로 휘어지는 3차 베지어 곡선 + ease 속도
+
+경로는 고정 틱 간격의 (t, x, y) 샘플 배열로 한 번에 계산됩니다.
+NumPy가 설치되어 있으면 벡터 연산으로 계산하고, 없으면 같은 수식을 순수 Python으로 계산합니다.
+재생 시에는 샘플을 그대로 마우스 이동 이벤트로 내보내므로 이동 단계마다 계산이 필요 없습니다.
+"""
+
+from typing import List, Tuple, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy는 선택 의존성
+    np = None
+
+
+# 경로 샘플 간격 기본값 (마이크로초, 100Hz)
+DEFAULT_MOTION_TICK_US = 10_000
+# 기본 경로 곡선
+DEFAULT_MOTION_CURVE = 'ease'
+# 베지어 곡선이 이동 방향 옆으로 휘어지는 정도 (이동 거리 대비 비율)
+BEZIER_BEND_RATIO = 0.2
+
+MOTION_CURVES = ('linear', 'ease', 'bezier')
+
+# 경로 샘플: (시작 기준 시각 us, x, y)
+MotionSample = Tuple[int, int, int]
+
+
+class MotionError(ValueError):
+    """이동 경로 계산 오류"""
+    pass
+
+
+def compute_path(start: Tuple[int, int], end: Tuple[int, int], duration_us: int,
+                 curve: str = DEFAULT_MOTION_CURVE,
+                 tick_us: int = DEFAULT_MOTION_TICK_US) -> Sequence[MotionSample]:
+    """
+    시작점에서 끝점까지의 이동 경로 샘플을 계산합니다.
+    
+    샘플 시각은 tick_us, 2*tick_us, ... 이며 마지막 샘플은 항상 (duration_us, 끝점)입니다.
+    좌표가 바로 앞 샘플과 같은 샘플은 제외되므로 이동 거리가 짧으면 샘플 수도 줄어듭니다.
+    
+    Args:
+        start (Tuple[int, int]): 시작 좌표
+        end (Tuple[int, int]): 끝 좌표
+        duration_us (int): 이동 시간 (마이크로초)
+        curve (str): 경로 곡선 (linear, ease, bezier)
+        tick_us (int): 샘플 간격 (마이크로초)
+    
+    Returns:
+        Sequence[MotionSample]: (시각, x, y) 샘플 (NumPy 사용 시 (n, 3) 정수 배열)
+    
+    Raises:
+        MotionError: 알 수 없는 곡선이거나 간격이 0 이하인 경우
+    """
+    if curve not in MOTION_CURVES:
+        raise MotionError(f"알 수 없는 이동 곡선: {curve} (사용 가능: {', '.join(MOTION_CURVES)})")
+    if tick_us <= 0:
+        raise MotionError(f"샘플 간격은 0보다 커야 합니다: {tick_us}")
+    if duration_us <= 0:
+        return [(0, int(end[0]), int(end[1]))]
+    
+    if np is not None:
+        return _compute_path_numpy(start, end, duration_us, curve, tick_us)
+    return _compute_path_python(start, end, duration_us, curve, tick_us)
+
+
+def _bezier_controls(start: Tuple[int, int], end: Tuple[int, int]) -> Tuple[float, float, float, float]:
+    """이동 방향의 왼쪽으로 휘어지는 두 제어점 (x1, y1, x2, y2)"""
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+    # 이동 벡터를 90도 회전한 법선 방향으로 BEZIER_BEND_RATIO만큼 띄움
+    nx = -dy * BEZIER_BEND_RATIO
+    ny = dx * BEZIER_BEND_RATIO
+    return (start[0] + dx / 3 + nx, start[1] + dy / 3 + ny,
+            start[0] + dx * 2 / 3 + nx, start[1] + dy * 2 / 3 + ny)
+
+
+def _compute_path_numpy(start, end, duration_us, curve, tick_us):
+    """NumPy 벡터 연산으로 경로 계산"""
+    t = np.arange(tick_us, duration_us + tick_us, tick_us, dtype=np.int64)
+    t[-1] = duration_us
+    u = t / duration_us
+    
+    if curve != 'linear':
+        u = u * u * (3.0 - 2.0 * u)  # smoothstep
+    
+    if curve == 'bezier':
+        x1, y1, x2, y2 = _bezier_controls(start, end)
+        v = 1.0 - u
+        b0, b1, b2, b3 = v * v * v, 3.0 * v * v * u, 3.0 * v * u * u, u * u * u
+        x = b0 * start[0] + b1 * x1 + b2 * x2 + b3 * end[0]
+        y = b0 * start[1] + b1 * y1 + b2 * y2 + b3 * end[1]
+    else:
+        x = start[0] + (end[0] - start[0]) * u
+        y = start[1] + (end[1] - start[1]) * u
+    
+    samples = np.empty((len(t), 3), dtype=np.int64)
+    samples[:, 0] = t
+    samples[:, 1] = np.rint(x)
+    samples[:, 2] = np.rint(y)
+    samples[-1, 1:] = end
+    
+    # 바로 앞 샘플과 좌표가 같은 샘플 제외 (마지막 샘플은 항상 유지)
+    keep = np.ones(len(samples), dtype=bool)
+    keep[1:] = np.any(samples[1:, 1:] != samples[:-1, 1:], axis=1)
+    keep[-1] = True
+    return samples[keep]
+
+
+def _compute_path_python(start, end, duration_us, curve, tick_us) -> List[MotionSample]:
+    """순수 Python으로 경로 계산 (NumPy가 없을 때)"""
+    if curve == 'bezier':
+        x1, y1, x2, y2 = _bezier_controls(start, end)
+    
+    samples: List[MotionSample] = []
+    previous = None
+    for t in range(tick_us, duration_us + tick_us, tick_us):
+        t = min(t, duration_us)
+        u = t / duration_us
+        if curve != 'linear':
+            u = u * u * (3.0 - 2.0 * u)
+        
+        if t == duration_us:
+            point = (int(end[0]), int(end[1]))
+        elif curve == 'bezier':
+            v = 1.0 - u
+            b0, b1, b2, b3 = v * v * v, 3.0 * v * v * u, 3.0 * v * u * u, u * u * u
+            point = (int(round(b0 * start[0] + b1 * x1 + b2 * x2 + b3 * end[0])),
+                     int(round(b0 * start[1] + b1 * y1 + b2 * y2 + b3 * end[1])))
+        else:
+            point = (int(round(start[0] + (end[0] - start[0]) * u)),
+                     int(round(start[1] + (end[1] - start[1]) * u)))
+        
+        if point != previous or t == duration_us:
+            samples.append((t,) + point)
+            previous = point
+    return samples
@@ -28,6 +28,7 @@ from typing import List, Optional, Union, Dict
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from .msl_lexer import MSLLexer, Token, TokenType
+from .msl_cancel import check_cancelled
 from msl_ast import *
 
 
@@ -118,6 +119,9 @@ class MSLParser:
         if self.current_position < len(self.tokens) - 1:
             self.current_position += 1
             self.current_token = self.tokens[self.current_position]
+            # 요청 마감 확인 (256 토큰 단위마다)
+            if not self.current_position & 0xFF:
+                check_cancelled()
         else:
             self.current_token = None
         return self.current_token
@@ -467,31 +471,24 @@ class MSLParser:
             }
     
     def _analyze_ast_statistics(self, ast: MSLNode) -> Dict[str, int]:
-        """AST 통계 분석"""
-        stats = {
-            'total_nodes': 0,
-            'key_nodes': 0,
-            'timing_nodes': 0,
-            'operator_nodes': 0,
-            'max_depth': 0
+        """AST 통계 분석 (한 번의 순회로 모든 항목 집계)"""
+        results = MultiAnalysisWalker([
+            NodeCountAnalysis(),
+            MaxDepthAnalysis(),
+            NodeTypeCountAnalysis(),
+        ]).run(ast)
+        type_counts = results['node_types']
+        
+        def count_of(*node_types: NodeType) -> int:
+            return sum(type_counts.get(node_type, 0) for node_type in node_types)
+        
+        return {
+            'total_nodes': results['node_count'],
+            'key_nodes': count_of(NodeType.KEY),
+            'timing_nodes': count_of(NodeType.DELAY, NodeType.HOLD, NodeType.FADE),
+            'operator_nodes': count_of(NodeType.SEQUENTIAL, NodeType.SIMULTANEOUS, NodeType.PARALLEL),
+            'max_depth': results['max_depth']
         }
-        
-        def count_nodes(node: MSLNode, depth: int = 0):
-            stats['total_nodes'] += 1
-            stats['max_depth'] = max(stats['max_depth'], depth)
-            
-            if isinstance(node, KeyNode):
-                stats['key_nodes'] += 1
-            elif isinstance(node, (DelayNode, HoldNode, FadeNode)):
-                stats['timing_nodes'] += 1
-            elif isinstance(node, (SequentialNode, SimultaneousNode, ParallelNode)):
-                stats['operator_nodes'] += 1
-            
-            for child in node.children:
-                count_nodes(child, depth + 1)
-        
-        count_nodes(ast)
-        return stats
 
 
 def demo_parser():
@@ -0,0 +1,201 @@
+"""
+MSL (Macro Scripting Language) 컴파일 프로그램 캐시 (Program Cache)
+같은 매크로가 반복 실행될 때 파싱과 컴파일을 건너뛰도록 컴파일된 프로그램을 보관합니다.
+
+특징:
+- 캐시 키는 정규화된 스크립트 텍스트의 해시와 변수 바인딩으로 구성
+- 항목 수와 추정 메모리 크기 두 가지 한도로 제한되며, 넘치면 가장 오래 쓰지 않은 항목부터 제거 (LRU)
+- 잠금으로 보호되므로 여러 스레드/인터프리터가 하나의 캐시를 공유 가능
+- 적중/미스/제거 횟수를 통계로 보고
+
+컴파일된 프로그램은 불변이므로 캐시에서 꺼낸 프로그램을 여러 세션이 동시에 재생해도 안전합니다.
+"""
+
+import re
+import sys
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Any, Tuple
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from msl_ast import MSLNode, freeze
+from .msl_compiler import CompiledProgram, ProgramEvent
+
+
+# 기본 최대 항목 수
+DEFAULT_MAX_ENTRIES = 128
+# 기본 최대 추정 메모리 크기 (바이트)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 보관된 이벤트 하나의 추정 크기 (ProgramEvent 튜플 + 정수 필드)
+_EVENT_SIZE_BYTES = sys.getsizeof(ProgramEvent(0, 0)) + 3 * sys.getsizeof(1_000_000)
+# 프로그램 하나의 고정 오버헤드 추정치 (프로그램 객체, 스트림 노드, 캐시 키)
+_PROGRAM_OVERHEAD_BYTES = 1024
+
+# 토큰 사이의 공백 (줄바꿈은 의미가 있으므로 유지)
+_INLINE_WHITESPACE = re.compile(r'[ \t]+')
+
+# 캐시 키: (정규화된 스크립트 해시, 변수 바인딩)
+CacheKey = Tuple[str, Tuple]
+
+
+def normalize_script(script: str) -> str:
+    """
+    캐시 키용 스크립트 정규화
+    
+    렉서가 무시하는 차이(줄 끝 형식, 연속 공백, 줄 앞뒤 공백, 빈 줄)만 제거하므로
+    정규화 결과가 같은 스크립트는 같은 프로그램으로 컴파일됩니다.
+    """
+    lines = script.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    normalized = (_INLINE_WHITESPACE.sub(' ', line).strip() for line in lines)
+    return '\n'.join(line for line in normalized if line)
+
+
+def variables_key(variables: Optional[Dict[str, Any]]) -> Tuple:
+    """캐시 키용 변수 표현 (AST 값은 구조적으로 비교, 해시할 수 없는 값은 repr 사용)"""
+    if not variables:
+        return ()
+    
+    items = []
+    for name, value in sorted(variables.items()):
+        if isinstance(value, MSLNode):
+            value = freeze(value)
+        try:
+            hash(value)
+        except TypeError:
+            value = repr(value)
+        items.append((name, value))
+    return tuple(items)
+
+
+def make_key(script: str, variables: Optional[Dict[str, Any]] = None) -> CacheKey:
+    """스크립트와 변수로 캐시 키 생성"""
+    digest = hashlib.blake2b(normalize_script(script).encode('utf-8'), digest_size=16).hexdigest()
+    return digest, variables_key(variables)
+
+
+def estimate_program_size(program: CompiledProgram) -> int:
+    """프로그램이 차지하는 메모리 추정치 (바이트, 반복 스트림은 본문만 계산)"""
+    key_names_size = sum(sys.getsizeof(name) for name in program.key_names)
+    return (_PROGRAM_OVERHEAD_BYTES + key_names_size
+            + program.events.stored_count * _EVENT_SIZE_BYTES)
+
+
+class ProgramCache:
+    """
+    컴파일된 프로그램의 LRU 캐시
+    
+    항목 수가 max_entries를 넘거나 추정 크기 합계가 max_bytes를 넘으면
+    가장 오래 사용하지 않은 항목부터 제거합니다. 크기 한도보다 큰 프로그램은 보관하지 않습니다.
+    """
+    
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Program Cache 초기화
+        
+        Args:
+            max_entries (int): 최대 항목 수
+            max_bytes (int): 최대 추정 메모리 크기 (바이트)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[CacheKey, Tuple[CompiledProgram, int]]' = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @property
+    def total_bytes(self) -> int:
+        """보관 중인 프로그램의 추정 크기 합계"""
+        return self._total_bytes
+    
+    def get(self, key: CacheKey) -> Optional[CompiledProgram]:
+        """
+        캐시된 프로그램 조회 (적중 시 최근 사용으로 표시)
+        
+        Args:
+            key (CacheKey): make_key()로 만든 캐시 키
+        
+        Returns:
+            Optional[CompiledProgram]: 캐시된 프로그램, 없으면 None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+    
+    def put(self, key: CacheKey, program: CompiledProgram):
+        """
+        프로그램 저장 후 한도를 넘는 오래된 항목 제거
+        
+        Args:
+            key (CacheKey): make_key()로 만든 캐시 키
+            program (CompiledProgram): 저장할 프로그램
+        """
+        size = estimate_program_size(program)
+        if size > self.max_bytes:
+            return
+        
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous[1]
+            
+            self._entries[key] = (program, size)
+            self._total_bytes += size
+            
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+                self.evictions += 1
+    
+    def clear(self):
+        """모든 항목 제거 (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+# 프로세스 전체에서 공유하는 기본 캐시
+_default_cache: Optional[ProgramCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_program_cache() -> ProgramCache:
+    """프로세스 전체에서 공유하는 기본 프로그램 캐시 반환 (처음 호출 시 생성)"""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = ProgramCache()
+    return _default_cache
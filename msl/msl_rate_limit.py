@@ -0,0 +1,169 @@
+"""
+MSL (Macro Scripting Language) 입력 속도 제한 (Rate Limit)
+장치 종류별 토큰 버킷으로 내보내는 입력의 초당 개수와 순간 묶음 크기를 제한합니다.
+
+동작:
+- 장치 종류(keyboard, mouse, wheel)마다 초당 이벤트 수(rate)와 버스트(burst) 한도를 가진 토큰 버킷
+- 토큰이 부족한 이벤트는 버리지 않고 토큰이 생기는 가장 이른 시각으로 미룸
+- 미뤄진 이벤트보다 뒤에 오는 이벤트는 순서를 지키기 위해 필요한 만큼만 함께 밀림
+  (한도 안의 이벤트는 원래 시각 그대로 유지)
+- 원래 일정 대비 늘어난 시간(stretch)과 미뤄진 이벤트 수를 보고
+
+예) 간격 없는 *1000 반복도 키보드 한도 안의 속도로 펼쳐져 운영체제 입력 큐가 넘치지 않습니다.
+"""
+
+import math
+from typing import Dict, Optional, Any, NamedTuple, Iterable, Iterator
+
+from .msl_compiler import ProgramEvent, EventOp
+
+
+class RateLimit(NamedTuple):
+    """장치 종류 하나의 속도 한도"""
+    events_per_sec: float    # 지속 가능한 초당 이벤트 수 (토큰 보충 속도)
+    burst: int               # 한 번에 연달아 보낼 수 있는 최대 이벤트 수 (버킷 크기)
+
+
+# 이벤트 연산 -> 장치 종류
+DEVICE_CLASSES = {
+    EventOp.KEY_DOWN: 'keyboard',
+    EventOp.KEY_UP: 'keyboard',
+    EventOp.MOUSE_MOVE: 'mouse',
+    EventOp.WHEEL: 'wheel',
+}
+
+# 기본 한도 (일반적인 매크로의 동시 입력과 100Hz 마우스 경로는 한도 안에 들어옴)
+DEFAULT_RATE_LIMITS: Dict[str, RateLimit] = {
+    'keyboard': RateLimit(events_per_sec=1000, burst=100),
+    'mouse': RateLimit(events_per_sec=2000, burst=200),
+    'wheel': RateLimit(events_per_sec=200, burst=20),
+}
+
+
+class _TokenBucket:
+    """토큰 버킷 하나 (시각 단위: 마이크로초)"""
+    
+    __slots__ = ('rate_per_us', 'burst', 'tokens', 'updated_us')
+    
+    def __init__(self, limit: RateLimit):
+        self.rate_per_us = limit.events_per_sec / 1_000_000
+        self.burst = limit.burst
+        self.tokens = float(limit.burst)
+        self.updated_us = 0
+    
+    def acquire(self, time_us: int) -> int:
+        """
+        time_us 이후 토큰 하나를 얻을 수 있는 가장 이른 시각을 구하고 토큰을 소비합니다.
+        
+        Returns:
+            int: 이벤트를 보낼 시각 (토큰이 충분하면 time_us 그대로)
+        """
+        tokens = min(self.burst, self.tokens + (time_us - self.updated_us) * self.rate_per_us)
+        if tokens < 1:
+            # 부족한 토큰이 보충될 때까지 미룸 (올림)
+            time_us += -int(-(1 - tokens) // self.rate_per_us)
+            tokens = 1.0
+        self.tokens = tokens - 1
+        self.updated_us = time_us
+        return time_us
+
+
+def estimate_stretch_us(limits: Dict[str, Optional[RateLimit]], op_counts: Dict[EventOp, int],
+                        duration_us: int) -> int:
+    """
+    이벤트를 펼치지 않고 속도 제한으로 늘어나는 시간을 계산합니다.
+    
+    토큰 버킷은 시각 t까지 최대 burst + rate * t개의 이벤트만 내보내므로,
+    장치 종류별로 n개의 이벤트를 모두 보내려면 적어도 (n - burst) / rate가 걸립니다.
+    원래 일정과 이 최소 시간 중 긴 쪽을 실행 시간으로 보며, 이벤트가 앞쪽에 몰린 경우
+    (간격 없는 반복 등)와 한도 안의 경우에는 RateShaper의 결과와 같고 그 외에는 하한입니다.
+    
+    Args:
+        limits (Dict[str, Optional[RateLimit]]): 장치 종류별 한도
+        op_counts (Dict[EventOp, int]): 연산 종류별 이벤트 수 (EventStream.op_counts())
+        duration_us (int): 원래 일정의 실행 시간
+    
+    Returns:
+        int: 늘어나는 시간 (마이크로초)
+    """
+    device_counts: Dict[str, int] = {}
+    for op, count in op_counts.items():
+        device = DEVICE_CLASSES.get(op)
+        if device is not None:
+            device_counts[device] = device_counts.get(device, 0) + count
+    
+    end_us = duration_us
+    for device, count in device_counts.items():
+        limit = limits.get(device)
+        if limit is None or limit.events_per_sec <= 0 or count <= limit.burst:
+            continue
+        # 버킷에 찬 burst개는 바로 나가고 나머지는 rate 속도로 나감
+        end_us = max(end_us, math.ceil((count - limit.burst) * 1_000_000 / limit.events_per_sec))
+    return end_us - duration_us
+
+
+class RateShaper:
+    """
+    실행 한 번의 이벤트 일정 조정기
+    
+    shape()에 시간순 이벤트 스트림을 넣으면 한도를 지키도록 시각을 조정한 스트림을 차례로 내어줍니다.
+    상태를 가지므로 실행(세션)마다 새로 만들어 사용합니다.
+    """
+    
+    def __init__(self, limits: Dict[str, Optional[RateLimit]]):
+        """
+        Rate Shaper 초기화
+        
+        Args:
+            limits (Dict[str, Optional[RateLimit]]): 장치 종류별 한도 (None이면 제한하지 않음)
+        """
+        self._buckets = {device: _TokenBucket(limit) for device, limit in limits.items()
+                         if limit is not None and limit.events_per_sec > 0}
+        self.delayed_events = 0     # 시각이 바뀐 이벤트 수
+        self.total_delay_us = 0     # 이벤트별 지연의 합
+        self.max_delay_us = 0       # 가장 많이 밀린 이벤트의 지연
+        self.stretch_us = 0         # 마지막 이벤트가 밀린 시간 (= 전체 일정이 늘어난 시간)
+    
+    def shape(self, events: Iterable[ProgramEvent]) -> Iterator[ProgramEvent]:
+        """
+        한도를 지키도록 조정한 이벤트를 순서대로 내어줍니다 (원래 순서는 유지).
+        
+        Args:
+            events (Iterable[ProgramEvent]): 시간순 이벤트
+        
+        Yields:
+            ProgramEvent: 시각이 조정된 이벤트
+        """
+        buckets = self._buckets
+        if not buckets:
+            yield from events
+            return
+        
+        last_us = 0
+        for event in events:
+            offset_us = event.offset_us
+            shaped_us = offset_us if offset_us > last_us else last_us
+            
+            bucket = buckets.get(DEVICE_CLASSES.get(event.op))
+            if bucket is not None:
+                shaped_us = bucket.acquire(shaped_us)
+            
+            last_us = shaped_us
+            delay_us = shaped_us - offset_us
+            self.stretch_us = delay_us
+            if delay_us:
+                self.delayed_events += 1
+                self.total_delay_us += delay_us
+                if delay_us > self.max_delay_us:
+                    self.max_delay_us = delay_us
+                event = event._replace(offset_us=shaped_us)
+            yield event
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """보고용 딕셔너리"""
+        return {
+            'delayed_events': self.delayed_events,
+            'stretch_ms': round(self.stretch_us / 1000, 3),
+            'max_delay_ms': round(self.max_delay_us / 1000, 3),
+            'total_delay_ms': round(self.total_delay_us / 1000, 3)
+        }
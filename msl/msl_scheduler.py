@@ -0,0 +1,253 @@
+"""
+MSL (Macro Scripting Language) 스케줄러 (Scheduler)
+컴파일된 이벤트를 절대 마감 시각에 맞춰 실행하기 위한 고정밀 타이머입니다.
+
+대기 방식:
+- 모든 마감 시각은 time.perf_counter_ns() 기준 절대 시각으로 계산 (오차 누적 없음)
+- 마감 시각 근처까지는 time.sleep()으로 거칠게 대기
+- 남은 짧은 구간은 보정된 스핀 대기로 정밀하게 맞춤
+- 이벤트별 지연(jitter)을 기록하여 통계로 보고
+- 모든 대기는 중단 이벤트(threading.Event)로 즉시 깨울 수 있음
+- 이벤트 루프용 AsyncDeadlineScheduler는 루프 시계와 asyncio.sleep으로 대기
+"""
+
+import time
+import asyncio
+import threading
+from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+
+from .msl_metrics import Histogram
+
+
+# 스핀 구간의 기본값 (나노초) - 보정 전에 사용
+DEFAULT_SPIN_THRESHOLD_NS = 2_000_000
+# 스핀 구간의 하한/상한 (나노초)
+MIN_SPIN_THRESHOLD_NS = 200_000
+MAX_SPIN_THRESHOLD_NS = 20_000_000
+# 보정 시 측정할 sleep 횟수
+CALIBRATION_SAMPLES = 20
+# 보정 시 요청할 sleep 길이 (초)
+CALIBRATION_SLEEP_SECONDS = 0.001
+# 이벤트 루프 스케줄러: 마감이 지난 대기가 이어질 때 양보하기까지의 최대 대기 횟수와 시간 (초)
+ASYNC_MAX_BURST_WAITS = 64
+ASYNC_MAX_BURST_SECONDS = 0.005
+
+
+@dataclass
+class JitterStats:
+    """이벤트별 지연 통계 (나노초 단위, 양수는 늦게 실행됨을 의미)"""
+    count: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+    histogram: Histogram = field(default_factory=Histogram)  # 마이크로초 단위 분포 (메모리 일정)
+    
+    def record(self, lateness_ns: int):
+        """이벤트 하나의 지연 기록"""
+        self.count += 1
+        self.total_ns += lateness_ns
+        if lateness_ns > self.max_ns:
+            self.max_ns = lateness_ns
+        self.histogram.record(lateness_ns / 1000)
+    
+    @property
+    def mean_ns(self) -> float:
+        """평균 지연"""
+        return self.total_ns / self.count if self.count else 0.0
+    
+    def percentile_ns(self, percent: float) -> int:
+        """지연 백분위수 근사값 (예: 99.0)"""
+        return int(self.histogram.percentile(percent) * 1000)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """보고용 딕셔너리 (마이크로초 단위)"""
+        return {
+            'events': self.count,
+            'mean_jitter_us': round(self.mean_ns / 1000, 3),
+            'p99_jitter_us': round(self.percentile_ns(99.0) / 1000, 3),
+            'max_jitter_us': round(self.max_ns / 1000, 3)
+        }
+
+
+class DeadlineScheduler:
+    """
+    절대 마감 시각 기반 스케줄러
+    
+    start()로 기준 시각을 잡은 뒤 wait_until_offset()에 프로그램 오프셋을 넘기면
+    해당 시각까지 대기하고 실제 지연을 기록합니다. 한 번의 실행에 하나의
+    인스턴스를 사용하며 스레드 간에 공유하지 않습니다.
+    
+    stop_event가 설정되면 거친 대기와 스핀 대기 모두 즉시 깨어나므로
+    중단 지연은 대기 길이와 무관하게 스레드 깨우기 시간 정도로 제한됩니다.
+    """
+    
+    def __init__(self, spin_threshold_ns: Optional[int] = None,
+                 stop_event: Optional[threading.Event] = None):
+        """
+        Deadline Scheduler 초기화
+        
+        Args:
+            spin_threshold_ns (int, optional): 스핀 대기로 전환할 남은 시간.
+                지정하지 않으면 calibrate()로 측정한 값 또는 기본값을 사용
+            stop_event (threading.Event, optional): 설정되면 대기를 중단하는 이벤트
+        """
+        self.spin_threshold_ns = spin_threshold_ns or DEFAULT_SPIN_THRESHOLD_NS
+        self.stop_event = stop_event or threading.Event()
+        self.start_ns = 0
+        self.jitter = JitterStats()
+    
+    def calibrate(self) -> int:
+        """
+        time.sleep()의 초과 수면(oversleep)을 측정하여 스핀 구간을 정합니다.
+        
+        운영체제 타이머 해상도에 따라 sleep은 요청보다 길게 잠들 수 있으므로,
+        관측된 최대 초과 시간보다 조금 넓게 스핀 구간을 잡습니다.
+        
+        Returns:
+            int: 보정된 스핀 구간 (나노초)
+        """
+        requested_ns = int(CALIBRATION_SLEEP_SECONDS * 1_000_000_000)
+        worst_ns = 0
+        
+        for _ in range(CALIBRATION_SAMPLES):
+            before = time.perf_counter_ns()
+            time.sleep(CALIBRATION_SLEEP_SECONDS)
+            oversleep = time.perf_counter_ns() - before - requested_ns
+            if oversleep > worst_ns:
+                worst_ns = oversleep
+        
+        threshold = int(worst_ns * 1.5)
+        self.spin_threshold_ns = max(MIN_SPIN_THRESHOLD_NS, min(MAX_SPIN_THRESHOLD_NS, threshold))
+        return self.spin_threshold_ns
+    
+    def start(self, start_ns: Optional[int] = None):
+        """기준 시각 설정 및 통계 초기화"""
+        self.start_ns = time.perf_counter_ns() if start_ns is None else start_ns
+        self.jitter = JitterStats()
+    
+    def deadline_ns(self, offset_us: int) -> int:
+        """프로그램 오프셋을 절대 마감 시각으로 변환"""
+        return self.start_ns + offset_us * 1000
+    
+    def wait_until_offset(self, offset_us: int) -> Optional[int]:
+        """
+        프로그램 오프셋에 해당하는 시각까지 대기합니다.
+        
+        Args:
+            offset_us (int): 실행 시작 기준 오프셋 (마이크로초)
+        
+        Returns:
+            Optional[int]: 마감 시각 대비 실제 지연 (나노초), 중단되면 None
+        """
+        return self.wait_until(self.deadline_ns(offset_us))
+    
+    def wait_until(self, deadline_ns: int) -> Optional[int]:
+        """
+        절대 마감 시각까지 대기하고 지연을 기록합니다.
+        
+        Args:
+            deadline_ns (int): time.perf_counter_ns() 기준 마감 시각
+        
+        Returns:
+            Optional[int]: 마감 시각 대비 실제 지연 (나노초), 중단되면 None
+        """
+        spin_threshold = self.spin_threshold_ns
+        stop_event = self.stop_event
+        
+        # 거친 대기: 스핀 구간 직전까지 중단 가능한 대기
+        remaining = deadline_ns - time.perf_counter_ns()
+        if remaining > spin_threshold:
+            if stop_event.wait((remaining - spin_threshold) / 1_000_000_000):
+                return None
+        
+        # 정밀 대기: 남은 구간은 스핀 (중단 이벤트도 함께 확인)
+        now = time.perf_counter_ns()
+        while now < deadline_ns:
+            if stop_event.is_set():
+                return None
+            now = time.perf_counter_ns()
+        
+        if stop_event.is_set():
+            return None
+        
+        lateness = now - deadline_ns
+        self.jitter.record(lateness)
+        return lateness
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """지연 통계 반환"""
+        stats = self.jitter.to_dict()
+        stats['spin_threshold_us'] = round(self.spin_threshold_ns / 1000, 3)
+        return stats
+
+
+class AsyncDeadlineScheduler:
+    """
+    asyncio 이벤트 루프용 절대 마감 시각 스케줄러
+    
+    루프 시계(loop.time())를 기준으로 asyncio.sleep으로 대기하므로 루프를 막지 않습니다.
+    스핀 대기를 하지 않는 대신 정밀도는 루프의 타이머 해상도에 따릅니다.
+    
+    마감이 지난 대기가 연달아 이어지면 (밀집된 프로그램, GC 멈춤 뒤 등) ASYNC_MAX_BURST_WAITS번 또는
+    ASYNC_MAX_BURST_SECONDS마다 한 번씩 루프에 양보하여 다른 태스크와 취소 요청이 처리되게 합니다.
+    """
+    
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Async Deadline Scheduler 초기화
+        
+        Args:
+            loop (asyncio.AbstractEventLoop, optional): 사용할 이벤트 루프 (기본: 실행 중인 루프)
+        """
+        self.loop = loop or asyncio.get_running_loop()
+        self.start_time = 0.0
+        self.jitter = JitterStats()
+        self._burst_waits = 0       # 마지막 양보 이후 마감이 지난 대기 횟수
+        self._burst_started = 0.0   # 마지막 양보 시각 (루프 시계)
+    
+    def start(self, start_time: Optional[float] = None):
+        """기준 시각 설정 및 통계 초기화"""
+        self.start_time = self.loop.time() if start_time is None else start_time
+        self.jitter = JitterStats()
+        self._burst_waits = 0
+        self._burst_started = self.loop.time()
+    
+    def deadline(self, offset_us: int) -> float:
+        """프로그램 오프셋을 루프 시계 기준 마감 시각으로 변환"""
+        return self.start_time + offset_us / 1_000_000
+    
+    async def wait_until_offset(self, offset_us: int) -> int:
+        """
+        프로그램 오프셋에 해당하는 시각까지 대기합니다.
+        
+        마감 시각이 이미 지났으면 바로 반환하되, 그런 대기가 일정 횟수나 시간 이상 이어지면
+        asyncio.sleep(0)으로 한 번 양보합니다 (취소는 이때 전달됨).
+        같은 시각의 이벤트들은 호출자가 한 번만 대기하도록 묶어야 합니다.
+        
+        Args:
+            offset_us (int): 실행 시작 기준 오프셋 (마이크로초)
+        
+        Returns:
+            int: 마감 시각 대비 실제 지연 (나노초)
+        """
+        deadline = self.deadline(offset_us)
+        now = self.loop.time()
+        remaining = deadline - now
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+            self._burst_waits = 0
+            self._burst_started = self.loop.time()
+        else:
+            self._burst_waits += 1
+            if self._burst_waits >= ASYNC_MAX_BURST_WAITS or now - self._burst_started >= ASYNC_MAX_BURST_SECONDS:
+                await asyncio.sleep(0)
+                self._burst_waits = 0
+                self._burst_started = self.loop.time()
+        
+        lateness = int((self.loop.time() - deadline) * 1_000_000_000)
+        self.jitter.record(lateness)
+        return lateness
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """지연 통계 반환"""
+        return self.jitter.to_dict()
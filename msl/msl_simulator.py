@@ -0,0 +1,272 @@
+"""
+MSL (Macro Scripting Language) 시뮬레이터 (Simulator)
+실제 입력이나 대기 없이 가상 시계로 MSL 스크립트를 실행하여 정확한 타임라인을 계산합니다.
+
+특징:
+- 인터프리터와 같은 컴파일러와 입력 상태 추적기를 사용하므로 홀드, 반복 간격, 병렬 병합,
+  연속 입력 제한, 중복 키 입력 생략, 입력 속도 제한 등 실행 의미가 실제 실행과 동일
+- 가상 시계를 사용하므로 sleep 없이 즉시 결과 반환
+- 마이크로초 단위의 이벤트 타임라인과 총 실행 시간 제공
+
+모든 도구의 실행 시간 추정은 이 시뮬레이터를 공유합니다.
+실행 시간만 필요하면 estimate_*()를 사용합니다. 이벤트를 펼치지 않고 프로그램 길이와
+속도 제한을 해석적으로 계산하므로 반복 횟수가 큰 스크립트도 즉시 끝납니다.
+타임라인이 필요한 simulate_*()는 이벤트 수에 비례하며 요청 마감 토큰을 주기적으로 확인합니다.
+"""
+
+import sys
+import os
+from typing import Dict, List, Optional, Any, NamedTuple, Tuple
+from dataclasses import dataclass
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from msl_ast import MSLNode
+from .msl_compiler import MSLCompiler, CompiledProgram, EventOp, CompileError
+from .msl_input_state import InputStateTracker
+from .msl_rate_limit import RateLimit, RateShaper, DEFAULT_RATE_LIMITS, estimate_stretch_us
+from .msl_cancel import check_cancelled
+
+
+# 이벤트 연산 -> 타임라인 동작 이름 (입력 백엔드의 메서드 이름과 동일)
+_EVENT_ACTIONS = {
+    EventOp.KEY_DOWN: 'key_down',
+    EventOp.KEY_UP: 'key_up',
+    EventOp.MOUSE_MOVE: 'move',
+    EventOp.WHEEL: 'scroll',
+}
+
+# 타임라인 시뮬레이션에서 요청 마감을 확인하는 이벤트 간격
+CANCEL_CHECK_EVENTS = 4096
+
+
+class VirtualClock:
+    """가상 시계 (마이크로초 단위, 앞으로만 진행)"""
+    
+    def __init__(self, start_us: int = 0):
+        self.now_us = start_us
+    
+    def advance_to(self, time_us: int):
+        """지정 시각까지 시계를 진행 (과거 시각이면 그대로 유지)"""
+        if time_us > self.now_us:
+            self.now_us = time_us
+    
+    def sleep(self, duration_us: int):
+        """지정 시간만큼 시계를 진행"""
+        self.now_us += max(0, duration_us)
+
+
+class TimelineEntry(NamedTuple):
+    """타임라인의 입력 하나"""
+    time_us: int             # 실행 시작 기준 시각 (마이크로초)
+    action: str              # key_down / key_up / move / scroll
+    args: Tuple[Any, ...]    # 동작 인자 (키 이름, 좌표, 스크롤 양)
+
+
+@dataclass
+class SimulationResult:
+    """시뮬레이션 결과"""
+    timeline: List[TimelineEntry]
+    duration_us: int
+    event_count: int
+    suppressed_count: int = 0  # 입력 상태 추적으로 생략된 중복 키 이벤트 수
+    stretch_us: int = 0        # 속도 제한으로 늘어난 시간
+    
+    @property
+    def duration_ms(self) -> float:
+        """총 실행 시간 (밀리초)"""
+        return self.duration_us / 1000
+    
+    @property
+    def action_count(self) -> int:
+        """실제 입력 수"""
+        return len(self.timeline)
+    
+    @property
+    def key_press_count(self) -> int:
+        """키 누름 횟수"""
+        return sum(1 for entry in self.timeline if entry.action == 'key_down')
+    
+    def to_dict(self, include_timeline: bool = False) -> Dict[str, Any]:
+        """결과를 딕셔너리로 변환"""
+        result = {
+            'duration_us': self.duration_us,
+            'duration_ms': self.duration_ms,
+            'event_count': self.event_count,
+            'action_count': self.action_count,
+            'key_press_count': self.key_press_count,
+            'suppressed_count': self.suppressed_count,
+            'stretch_us': self.stretch_us
+        }
+        if include_timeline:
+            result['timeline'] = [
+                {'time_us': entry.time_us, 'action': entry.action, 'args': list(entry.args)}
+                for entry in self.timeline
+            ]
+        return result
+
+
+@dataclass(frozen=True)
+class DurationEstimate:
+    """실행 시간 추정 결과 (타임라인 없음)"""
+    duration_us: int
+    event_count: int
+    action_count: int          # 입력 이벤트 수 (중복 키 입력 생략 전)
+    stretch_us: int = 0        # 속도 제한으로 늘어난 시간
+    
+    @property
+    def duration_ms(self) -> float:
+        """총 실행 시간 (밀리초)"""
+        return self.duration_us / 1000
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """결과를 딕셔너리로 변환"""
+        return {
+            'duration_us': self.duration_us,
+            'duration_ms': self.duration_ms,
+            'event_count': self.event_count,
+            'action_count': self.action_count,
+            'stretch_us': self.stretch_us
+        }
+
+
+class MSLSimulator:
+    """MSL 시뮬레이터 - 가상 시계로 프로그램을 재생"""
+    
+    def __init__(self, rate_limits: Optional[Dict[str, Optional[RateLimit]]] = None):
+        """
+        MSL Simulator 초기화
+        
+        Args:
+            rate_limits (Dict[str, RateLimit], optional): 장치 종류별 속도 한도
+                (기본: 인터프리터와 같은 DEFAULT_RATE_LIMITS, 빈 딕셔너리이면 제한하지 않음)
+        """
+        self.compiler = MSLCompiler()
+        self.rate_limits = dict(DEFAULT_RATE_LIMITS if rate_limits is None else rate_limits)
+        self._parser = None
+    
+    def simulate(self, ast: MSLNode, variables: Dict[str, Any] = None) -> SimulationResult:
+        """
+        AST를 가상 시계로 실행합니다.
+        
+        Args:
+            ast (MSLNode): 실행할 AST
+            variables (Dict[str, Any], optional): 변수 딕셔너리
+        
+        Returns:
+            SimulationResult: 시뮬레이션 결과
+        
+        Raises:
+            CompileError: 정의되지 않은 변수 등 컴파일 오류 발생 시
+        """
+        return self.simulate_program(self.compiler.compile(ast, variables))
+    
+    def simulate_script(self, script: str, variables: Dict[str, Any] = None) -> SimulationResult:
+        """
+        MSL 스크립트를 파싱한 뒤 가상 시계로 실행합니다.
+        
+        Args:
+            script (str): MSL 스크립트
+            variables (Dict[str, Any], optional): 변수 딕셔너리
+        
+        Returns:
+            SimulationResult: 시뮬레이션 결과
+        """
+        return self.simulate(self._get_parser().parse(script), variables)
+    
+    def estimate(self, ast: MSLNode, variables: Dict[str, Any] = None) -> DurationEstimate:
+        """
+        AST의 실행 시간을 이벤트를 펼치지 않고 계산합니다.
+        
+        Raises:
+            CompileError: 정의되지 않은 변수 등 컴파일 오류 발생 시
+        """
+        return self.estimate_program(self.compiler.compile(ast, variables))
+    
+    def estimate_script(self, script: str, variables: Dict[str, Any] = None) -> DurationEstimate:
+        """MSL 스크립트를 파싱한 뒤 실행 시간을 이벤트를 펼치지 않고 계산합니다."""
+        return self.estimate(self._get_parser().parse(script), variables)
+    
+    def estimate_program(self, program: CompiledProgram) -> DurationEstimate:
+        """
+        컴파일된 프로그램의 실행 시간을 계산합니다.
+        
+        프로그램 길이(duration_us)에 속도 제한으로 늘어나는 시간(estimate_stretch_us)을 더하며,
+        비용은 반복 횟수가 아니라 보관된 이벤트 수에 비례합니다.
+        
+        Args:
+            program (CompiledProgram): 대상 프로그램
+        
+        Returns:
+            DurationEstimate: 실행 시간 추정 결과
+        """
+        op_counts = program.events.op_counts()
+        stretch_us = estimate_stretch_us(self.rate_limits, op_counts, program.duration_us)
+        return DurationEstimate(
+            duration_us=program.duration_us + stretch_us,
+            event_count=len(program),
+            action_count=program.action_count,
+            stretch_us=stretch_us
+        )
+    
+    def _get_parser(self):
+        """스크립트 파서 (처음 사용할 때 생성)"""
+        if self._parser is None:
+            from .msl_parser import MSLParser
+            self._parser = MSLParser()
+        return self._parser
+    
+    def simulate_program(self, program: CompiledProgram) -> SimulationResult:
+        """
+        컴파일된 프로그램을 가상 시계로 재생합니다.
+        
+        이벤트 수에 비례하는 시간과 메모리가 들며, CANCEL_CHECK_EVENTS개마다 요청 마감을 확인합니다.
+        
+        Args:
+            program (CompiledProgram): 재생할 프로그램
+        
+        Returns:
+            SimulationResult: 시뮬레이션 결과
+        
+        Raises:
+            DeadlineExceeded: 요청 마감 시각이 지난 경우
+        """
+        clock = VirtualClock()
+        input_state = InputStateTracker()
+        shaper = RateShaper(self.rate_limits)
+        key_names = program.key_names
+        timeline = []
+        
+        for index, (offset_us, op, arg0, arg1, _) in enumerate(shaper.shape(program.events)):
+            if not index % CANCEL_CHECK_EVENTS:
+                check_cancelled()
+            clock.advance_to(offset_us)
+            
+            action = _EVENT_ACTIONS.get(op)
+            if action is None:
+                continue  # WAIT
+            
+            if op == EventOp.KEY_DOWN:
+                if not input_state.press(arg0):
+                    continue
+                args = (key_names[arg0],)
+            elif op == EventOp.KEY_UP:
+                if not input_state.release(arg0):
+                    continue
+                args = (key_names[arg0],)
+            elif op == EventOp.MOUSE_MOVE:
+                args = (arg0, arg1)
+            else:
+                args = (arg0,)
+            timeline.append(TimelineEntry(clock.now_us, action, args))
+        
+        clock.advance_to(program.duration_us + shaper.stretch_us)
+        
+        return SimulationResult(
+            timeline=timeline,
+            duration_us=clock.now_us,
+            event_count=len(program),
+            suppressed_count=input_state.suppressed,
+            stretch_us=shaper.stretch_us
+        )
@@ -0,0 +1,312 @@
+"""
+MSL (Macro Scripting Language) 실행 추적 (Execution Trace)
+인터프리터가 실제로 내보낸 입력을 고정 크기 바이너리 레코드로 기록하고, 기록 파일을 분석/재생합니다.
+
+레코드 (32바이트, 리틀 엔디언):
+- timestamp_ns (int64): 입력을 백엔드로 보낸 시각 (time.perf_counter_ns)
+- scheduled_ns (int64): 예정 시각 (같은 시계 기준)
+- x (int32): 마우스 x 좌표 또는 휠 스크롤 양
+- y (int32): 마우스 y 좌표
+- key_code (uint16): 키 코드 (키 테이블 인덱스)
+- op (uint8): EventOp 값
+
+파일 구조:
+- 고정 헤더 (매직, 버전, 레코드 크기, 메타데이터 길이, 시작 시각)
+- JSON 메타데이터 (세션 ID, 키 테이블) - 레코드가 정렬되도록 패딩
+- 레코드 배열
+
+기록기는 미리 할당한 링 버퍼에 struct.pack_into로 기록하므로 이벤트당 비용이 1마이크로초보다
+훨씬 작고, 버퍼가 가득 차면 파일로 내보냅니다. 파일 없이 쓰면 최근 capacity개 레코드만 보관합니다.
+읽기 도구는 파일을 mmap으로 열어 복사 없이 레코드를 순회합니다.
+"""
+
+import os
+import json
+import mmap
+import struct
+import time
+from typing import Dict, List, Optional, Any, NamedTuple, Iterator
+
+from .msl_compiler import EventOp
+from .msl_metrics import Histogram
+
+
+# 레코드 형식: timestamp_ns, scheduled_ns, x, y, key_code, op (+ 패딩)
+RECORD = struct.Struct('<qqiiHB5x')
+RECORD_SIZE = RECORD.size
+
+# 헤더 형식: 매직, 버전, 레코드 크기, 메타데이터 길이, 시작 시각
+HEADER = struct.Struct('<8sHHIq8x')
+TRACE_MAGIC = b'MSLTRACE'
+TRACE_VERSION = 1
+
+# 기본 링 버퍼 크기 (레코드 수)
+DEFAULT_TRACE_CAPACITY = 65536
+# 추적 파일 확장자
+TRACE_EXTENSION = '.msltrace'
+
+
+class TraceError(Exception):
+    """추적 파일 오류"""
+    pass
+
+
+class TraceRecord(NamedTuple):
+    """추적 레코드 하나"""
+    timestamp_ns: int
+    scheduled_ns: int
+    x: int
+    y: int
+    key_code: int
+    op: int
+    
+    @property
+    def lateness_ns(self) -> int:
+        """예정 시각 대비 지연 (양수는 늦게 실행됨)"""
+        return self.timestamp_ns - self.scheduled_ns
+
+
+class TraceRecorder:
+    """
+    실행 추적 기록기
+    
+    한 세션(한 스레드/태스크)에서만 기록하며 잠금을 사용하지 않습니다.
+    path를 지정하면 버퍼가 가득 찰 때와 close() 시 파일로 내보내고,
+    지정하지 않으면 링 버퍼에 최근 capacity개 레코드만 남깁니다.
+    """
+    
+    def __init__(self, path: Optional[str] = None, capacity: int = DEFAULT_TRACE_CAPACITY,
+                 key_names: tuple = (), metadata: Optional[Dict[str, Any]] = None):
+        """
+        Trace Recorder 초기화
+        
+        Args:
+            path (str, optional): 기록 파일 경로
+            capacity (int): 링 버퍼 크기 (레코드 수)
+            key_names (tuple): 키 코드 -> 키 이름 테이블 (메타데이터로 저장)
+            metadata (Dict[str, Any], optional): 추가 메타데이터 (세션 ID 등)
+        """
+        self.path = path
+        self.capacity = capacity
+        self.start_ns = time.perf_counter_ns()
+        self.flushed = 0    # 파일로 내보낸 레코드 수
+        
+        self._buffer = bytearray(capacity * RECORD_SIZE)
+        self._pack_into = RECORD.pack_into
+        self._index = 0     # 버퍼 안의 다음 기록 위치 (레코드 단위)
+        self._wrapped = 0   # 버퍼를 한 바퀴 돌 때까지 기록한 레코드 수의 누계
+        self._file = None
+        
+        if path is not None:
+            meta = dict(metadata or {})
+            meta['key_names'] = list(key_names)
+            self._file = open(path, 'wb')
+            self._file.write(_encode_header(self.start_ns, meta))
+    
+    @property
+    def count(self) -> int:
+        """기록한 전체 레코드 수"""
+        return self._wrapped + self._index
+    
+    def record(self, timestamp_ns: int, op: int, key_code: int, x: int, y: int, scheduled_ns: int):
+        """
+        레코드 하나를 링 버퍼에 기록합니다.
+        
+        Args:
+            timestamp_ns (int): 입력을 보낸 시각
+            op (int): EventOp 값
+            key_code (int): 키 코드 (키 입력이 아니면 0)
+            x (int): 마우스 x 좌표 또는 휠 스크롤 양
+            y (int): 마우스 y 좌표
+            scheduled_ns (int): 예정 시각
+        """
+        # 기록 경로는 pack_into 한 번과 인덱스 갱신만 수행 (버퍼가 찰 때만 _wrap 호출)
+        index = self._index
+        self._pack_into(self._buffer, index * RECORD_SIZE, timestamp_ns, scheduled_ns, x, y, key_code, op)
+        index += 1
+        if index == self.capacity:
+            index = self._wrap()
+        self._index = index
+    
+    def _wrap(self) -> int:
+        """버퍼가 가득 찼을 때 파일로 내보내고 처음 위치로 되돌림"""
+        if self._file is not None:
+            # flush()로 이미 내보낸 앞부분은 다시 쓰지 않음
+            start = self.flushed - self._wrapped
+            self._file.write(memoryview(self._buffer)[start * RECORD_SIZE:])
+            self.flushed = self._wrapped + self.capacity
+        self._wrapped += self.capacity
+        return 0
+    
+    def records(self) -> List[TraceRecord]:
+        """링 버퍼에 남아 있는 (아직 내보내지 않았거나 파일 없이 보관 중인) 레코드를 시간순으로 반환"""
+        retained = min(self.count - self.flushed, self.capacity)
+        start = (self._index - retained) % self.capacity
+        view = memoryview(self._buffer)
+        
+        if start + retained <= self.capacity:
+            chunks = [view[start * RECORD_SIZE:(start + retained) * RECORD_SIZE]]
+        else:
+            chunks = [view[start * RECORD_SIZE:], view[:self._index * RECORD_SIZE]]
+        return [TraceRecord(*values) for chunk in chunks for values in RECORD.iter_unpack(chunk)]
+    
+    def flush(self):
+        """아직 내보내지 않은 레코드를 파일에 기록"""
+        if self._file is None:
+            return
+        pending = self.count - self.flushed
+        if pending:
+            start = self._index - pending
+            self._file.write(memoryview(self._buffer)[start * RECORD_SIZE:self._index * RECORD_SIZE])
+            self.flushed = self.count
+        self._file.flush()
+    
+    def close(self):
+        """남은 레코드를 내보내고 파일 닫기"""
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+
+
+def _encode_header(start_ns: int, metadata: Dict[str, Any]) -> bytes:
+    """헤더 + 메타데이터를 레코드 크기 배수로 패딩하여 인코딩"""
+    meta = json.dumps(metadata, ensure_ascii=False).encode('utf-8')
+    padded = -(-(HEADER.size + len(meta)) // RECORD_SIZE) * RECORD_SIZE
+    meta = meta.ljust(padded - HEADER.size, b' ')
+    return HEADER.pack(TRACE_MAGIC, TRACE_VERSION, RECORD_SIZE, len(meta), start_ns) + meta
+
+
+class TraceReader:
+    """
+    추적 파일 읽기 도구 (mmap 기반)
+    
+    레코드는 mmap 위의 memoryview에서 바로 해석되므로 파일 크기와 무관하게 복사 없이 순회할 수 있습니다.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Trace Reader 초기화
+        
+        Args:
+            path (str): 추적 파일 경로
+        
+        Raises:
+            TraceError: 추적 파일 형식이 아닌 경우
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        if size < HEADER.size:
+            self._file.close()
+            raise TraceError(f"추적 파일이 너무 짧습니다: {path}")
+        
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size, meta_size, start_ns = HEADER.unpack_from(self._mmap, 0)
+        if magic != TRACE_MAGIC or record_size != RECORD_SIZE:
+            self.close()
+            raise TraceError(f"지원하지 않는 추적 파일입니다: {path}")
+        
+        self.version = version
+        self.start_ns = start_ns
+        data_start = HEADER.size + meta_size
+        self.metadata: Dict[str, Any] = json.loads(bytes(self._mmap[HEADER.size:data_start]))
+        self.key_names: List[str] = self.metadata.get('key_names', [])
+        
+        record_count = (size - data_start) // RECORD_SIZE
+        self._view = memoryview(self._mmap)[data_start:data_start + record_count * RECORD_SIZE]
+    
+    def __len__(self) -> int:
+        return len(self._view) // RECORD_SIZE
+    
+    def __iter__(self) -> Iterator[TraceRecord]:
+        for values in RECORD.iter_unpack(self._view):
+            yield TraceRecord(*values)
+    
+    def __getitem__(self, index: int) -> TraceRecord:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return TraceRecord(*RECORD.unpack_from(self._view, index * RECORD_SIZE))
+    
+    def __enter__(self) -> 'TraceReader':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def lateness_histogram(self) -> Histogram:
+        """예정 시각 대비 지연 분포 (마이크로초, 늦지 않은 레코드는 0)"""
+        histogram = Histogram()
+        for timestamp_ns, scheduled_ns, _, _, _, _ in RECORD.iter_unpack(self._view):
+            histogram.record(max(0, timestamp_ns - scheduled_ns) / 1000)
+        return histogram
+    
+    def summary(self) -> Dict[str, Any]:
+        """추적 요약 (레코드 수, 동작별 개수, 지연 분포)"""
+        op_counts: Dict[str, int] = {}
+        for record in self:
+            name = EventOp(record.op).name
+            op_counts[name] = op_counts.get(name, 0) + 1
+        
+        return {
+            'records': len(self),
+            'session_id': self.metadata.get('session_id'),
+            'ops': op_counts,
+            'lateness_us': self.lateness_histogram().to_dict()
+        }
+    
+    def replay(self, backend, speed: float = 1.0, stop_event=None) -> int:
+        """
+        기록된 입력을 원래 간격대로 백엔드에 다시 내보냅니다.
+        
+        Args:
+            backend (InputBackend): 입력을 내보낼 백엔드
+            speed (float): 재생 속도 배율 (2.0이면 두 배 빠르게)
+            stop_event (threading.Event, optional): 설정되면 재생 중단
+        
+        Returns:
+            int: 재생한 입력 수
+        """
+        from .msl_scheduler import DeadlineScheduler
+        
+        if len(self) == 0:
+            return 0
+        
+        scheduler = DeadlineScheduler(stop_event=stop_event)
+        scheduler.start()
+        base_ns = self[0].timestamp_ns
+        key_names = self.key_names
+        replayed = 0
+        
+        for record in self:
+            if scheduler.wait_until(scheduler.start_ns + int((record.timestamp_ns - base_ns) / speed)) is None:
+                break
+            
+            op = record.op
+            if op == EventOp.KEY_DOWN:
+                backend.key_down(key_names[record.key_code])
+            elif op == EventOp.KEY_UP:
+                backend.key_up(key_names[record.key_code])
+            elif op == EventOp.MOUSE_MOVE:
+                backend.move(record.x, record.y)
+            elif op == EventOp.WHEEL:
+                backend.scroll(record.x)
+            else:
+                continue
+            replayed += 1
+        
+        return replayed
+    
+    def close(self):
+        """mmap과 파일 닫기"""
+        view = getattr(self, '_view', None)
+        if view is not None:
+            view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
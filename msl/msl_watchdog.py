@@ -0,0 +1,161 @@
+"""
+MSL (Macro Scripting Language) 감시 타이머 (Watchdog)
+실행 시간 제한 같은 마감 시각 콜백을 하나의 타이머 휠로 처리합니다.
+
+타이머 휠:
+- tick 간격의 슬롯 배열에 타이머를 해시하여 등록 (등록/취소 O(1))
+- 휠 스레드 하나가 tick마다 현재 슬롯만 확인하므로 타이머가 수천 개여도 비용이 거의 없음
+- 한 바퀴보다 먼 타이머는 남은 바퀴 수(rounds)를 세어 처리
+- 등록된 타이머가 없으면 휠 스레드는 깨어나지 않고 대기
+
+콜백은 휠 스레드에서 실행되므로 짧게 끝나야 합니다 (중단 이벤트 설정, 태스크 취소 요청 등).
+정밀도는 tick 간격 정도이며, 타이머는 마감 시각보다 일찍 실행되지 않습니다.
+"""
+
+import time
+import threading
+import logging
+from typing import Dict, List, Optional, Callable
+
+
+# 기본 tick 간격 (초)
+DEFAULT_TICK_SECONDS = 0.01
+# 기본 슬롯 수 (tick 10ms x 512 = 한 바퀴 약 5초)
+DEFAULT_WHEEL_SLOTS = 512
+
+
+class TimerHandle:
+    """등록된 타이머 하나 (cancel()로 취소)"""
+    
+    __slots__ = ('wheel', 'callback', 'slot', 'rounds', 'cancelled', 'fired')
+    
+    def __init__(self, wheel: 'TimerWheel', callback: Callable[[], None], slot: int, rounds: int):
+        self.wheel = wheel
+        self.callback = callback
+        self.slot = slot
+        self.rounds = rounds
+        self.cancelled = False
+        self.fired = False
+    
+    def cancel(self):
+        """타이머 취소 (이미 실행되었으면 아무 일도 하지 않음)"""
+        if not self.cancelled and not self.fired:
+            self.cancelled = True
+            self.wheel._remove(self)
+
+
+class TimerWheel:
+    """
+    해시 타이머 휠
+    
+    schedule()로 등록한 콜백을 지연 시간이 지난 뒤 휠 스레드에서 한 번 실행합니다.
+    휠 스레드는 처음 타이머를 등록할 때 데몬 스레드로 시작됩니다.
+    """
+    
+    def __init__(self, tick_seconds: float = DEFAULT_TICK_SECONDS, slots: int = DEFAULT_WHEEL_SLOTS):
+        """
+        Timer Wheel 초기화
+        
+        Args:
+            tick_seconds (float): tick 간격 (초)
+            slots (int): 슬롯 수
+        """
+        self.tick_seconds = tick_seconds
+        self.slots = slots
+        self._wheel: List[Dict[int, TimerHandle]] = [{} for _ in range(slots)]
+        self._active = 0
+        self._tick = 0                     # 다음에 처리할 tick 번호
+        self._origin = time.monotonic()    # tick 0의 시각
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self.logger = logging.getLogger('MSLWatchdog')
+    
+    @property
+    def active_timers(self) -> int:
+        """등록되어 아직 실행/취소되지 않은 타이머 수"""
+        return self._active
+    
+    def schedule(self, delay_seconds: float, callback: Callable[[], None]) -> TimerHandle:
+        """
+        지연 시간 뒤에 콜백을 실행하도록 등록합니다.
+        
+        Args:
+            delay_seconds (float): 지연 시간 (초)
+            callback (Callable[[], None]): 휠 스레드에서 실행할 콜백
+        
+        Returns:
+            TimerHandle: 취소에 사용할 핸들
+        """
+        with self._condition:
+            # 마감 시각이 속한 tick의 끝에서 실행되도록 올림 (일찍 실행되지 않음)
+            now_tick = (time.monotonic() - self._origin) / self.tick_seconds
+            if self._active == 0:
+                # 쉬는 동안 지난 tick은 비어 있으므로 건너뜀
+                self._tick = max(self._tick, int(now_tick))
+            due_tick = max(self._tick, int(now_tick + delay_seconds / self.tick_seconds) + 1)
+            offset = due_tick - self._tick
+            handle = TimerHandle(self, callback, due_tick % self.slots, offset // self.slots)
+            
+            was_idle = self._active == 0
+            self._wheel[handle.slot][id(handle)] = handle
+            self._active += 1
+            
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='MSLWatchdog', daemon=True)
+                self._thread.start()
+            elif was_idle:
+                self._condition.notify()
+        return handle
+    
+    def _remove(self, handle: TimerHandle):
+        """취소된 타이머를 슬롯에서 제거"""
+        with self._condition:
+            if self._wheel[handle.slot].pop(id(handle), None) is not None:
+                self._active -= 1
+    
+    def _run(self):
+        """휠 스레드: tick마다 현재 슬롯의 만기 타이머 실행"""
+        condition = self._condition
+        while True:
+            with condition:
+                while self._active == 0:
+                    condition.wait()
+                
+                tick_time = self._origin + (self._tick + 1) * self.tick_seconds
+                remaining = tick_time - time.monotonic()
+                if remaining > 0:
+                    condition.wait(remaining)
+                    if time.monotonic() < tick_time:
+                        continue  # 새 타이머 등록으로 깨어남
+                
+                slot = self._wheel[self._tick % self.slots]
+                expired = [handle for handle in slot.values() if handle.rounds == 0]
+                for handle in slot.values():
+                    if handle.rounds:
+                        handle.rounds -= 1
+                for handle in expired:
+                    del slot[id(handle)]
+                    handle.fired = True
+                self._active -= len(expired)
+                self._tick += 1
+            
+            for handle in expired:
+                try:
+                    handle.callback()
+                except Exception as e:
+                    self.logger.error(f"감시 타이머 콜백 오류: {e}")
+
+
+# 프로세스 전체에서 공유하는 기본 타이머 휠
+_default_wheel: Optional[TimerWheel] = None
+_default_wheel_lock = threading.Lock()
+
+
+def get_timer_wheel() -> TimerWheel:
+    """프로세스 전체에서 공유하는 타이머 휠 반환 (처음 호출 시 생성)"""
+    global _default_wheel
+    if _default_wheel is None:
+        with _default_wheel_lock:
+            if _default_wheel is None:
+                _default_wheel = TimerWheel()
+    return _default_wheel
@@ -6,9 +6,10 @@ MSL (Macro Scripting Language) AST (Abstract Syntax Tree) 정의
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Sequence, Tuple, Type, Iterator, Iterable, Callable
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
 
 class NodeType(Enum):
@@ -615,4 +616,444 @@ class ASTPrinter(MSLVisitor):
     
     def get_output(self) -> str:
         """출력 결과를 문자열로 반환"""
-        return "\n".join(self.output) 
\ No newline at end of file
+        return "\n".join(self.output) 
+
+
+
+# AST 순회 프레임워크
+# 재귀 대신 명시적 스택을 사용하므로 깊은 트리에서도 재귀 한도에 걸리지 않습니다.
+
+def walk_preorder(root: MSLNode) -> Iterator[Tuple[MSLNode, int]]:
+    """
+    전위 순회로 (노드, 깊이)를 생성합니다.
+    
+    Args:
+        root (MSLNode): 순회할 루트 노드 (PersistentNode도 가능)
+        
+    Yields:
+        Tuple[MSLNode, int]: 방문한 노드와 루트 기준 깊이
+    """
+    stack = [(root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        yield node, depth
+        children = node.children
+        if children:
+            child_depth = depth + 1
+            for child in reversed(children):
+                stack.append((child, child_depth))
+
+
+def walk_postorder(root: MSLNode) -> Iterator[Tuple[MSLNode, int]]:
+    """
+    후위 순회로 (노드, 깊이)를 생성합니다 (자식이 모두 나온 뒤 부모가 나옴).
+    
+    Args:
+        root (MSLNode): 순회할 루트 노드 (PersistentNode도 가능)
+        
+    Yields:
+        Tuple[MSLNode, int]: 방문한 노드와 루트 기준 깊이
+    """
+    stack = [(root, 0, False)]
+    while stack:
+        node, depth, expanded = stack.pop()
+        if expanded or not node.children:
+            yield node, depth
+            continue
+        stack.append((node, depth, True))
+        child_depth = depth + 1
+        for child in reversed(node.children):
+            stack.append((child, child_depth, False))
+
+
+class ASTAnalysis:
+    """
+    단일 순회 분석의 기본 클래스
+    MultiAnalysisWalker에 등록되어 다른 분석들과 한 번의 순회를 공유합니다.
+    """
+    
+    # 결과 딕셔너리에서 사용할 이름
+    name = "analysis"
+    # 관심 있는 노드 타입 (None이면 모든 노드)
+    node_types: Optional[Tuple[NodeType, ...]] = None
+    
+    def enter(self, node: MSLNode, depth: int):
+        """노드에 처음 도착했을 때 호출 (자식보다 먼저)"""
+        pass
+    
+    def leave(self, node: MSLNode, depth: int):
+        """노드의 모든 자식을 처리한 뒤 호출"""
+        pass
+    
+    def result(self) -> Any:
+        """분석 결과 반환"""
+        return None
+
+
+class NodeCountAnalysis(ASTAnalysis):
+    """전체 노드 수 집계"""
+    
+    name = "node_count"
+    
+    def __init__(self):
+        self.count = 0
+    
+    def enter(self, node: MSLNode, depth: int):
+        self.count += 1
+    
+    def result(self) -> int:
+        return self.count
+
+
+class MaxDepthAnalysis(ASTAnalysis):
+    """최대 깊이 집계 (루트 깊이는 0)"""
+    
+    name = "max_depth"
+    
+    def __init__(self):
+        self.max_depth = 0
+    
+    def enter(self, node: MSLNode, depth: int):
+        if depth > self.max_depth:
+            self.max_depth = depth
+    
+    def result(self) -> int:
+        return self.max_depth
+
+
+class NodeTypeCountAnalysis(ASTAnalysis):
+    """노드 타입별 개수 집계"""
+    
+    name = "node_types"
+    
+    def __init__(self):
+        self.counts: Dict[NodeType, int] = {}
+    
+    def enter(self, node: MSLNode, depth: int):
+        self.counts[node.node_type] = self.counts.get(node.node_type, 0) + 1
+    
+    def result(self) -> Dict[NodeType, int]:
+        return self.counts
+
+
+class KeySequenceAnalysis(ASTAnalysis):
+    """소스 순서대로 키 이름 수집"""
+    
+    name = "key_sequence"
+    node_types = (NodeType.KEY,)
+    
+    def __init__(self):
+        self.keys: List[str] = []
+    
+    def enter(self, node: MSLNode, depth: int):
+        # 파서는 키 이름을 key 속성에 기록하므로 우선 사용
+        key = getattr(node, 'key', None)
+        self.keys.append(key if isinstance(key, str) else node.key_name)
+    
+    def result(self) -> List[str]:
+        return self.keys
+
+
+class MultiAnalysisWalker:
+    """
+    여러 분석을 한 번의 순회로 실행하는 워커
+    
+    ASTAnalysis 객체나 가벼운 콜백 함수를 등록하면 노드 타입별 디스패치 테이블을 만들어
+    각 노드에서 관심 있는 콜백만 호출합니다. leave 콜백이 하나도 없으면
+    후위 처리 없이 전위 순회만 수행합니다.
+    
+    Example:
+        >>> walker = MultiAnalysisWalker([NodeCountAnalysis(), MaxDepthAnalysis()])
+        >>> walker.on_enter("delays", lambda node, depth: ..., NodeType.DELAY)
+        >>> results = walker.run(ast)
+        >>> results["node_count"], results["max_depth"]
+    """
+    
+    def __init__(self, analyses: Iterable[ASTAnalysis] = ()):
+        """
+        워커 초기화
+        
+        Args:
+            analyses (Iterable[ASTAnalysis]): 처음부터 등록할 분석들
+        """
+        self._analyses: List[ASTAnalysis] = []
+        self._enter: Dict[Optional[NodeType], List[Callable[[MSLNode, int], Any]]] = {}
+        self._leave: Dict[Optional[NodeType], List[Callable[[MSLNode, int], Any]]] = {}
+        self._callback_results: Dict[str, Callable[[], Any]] = {}
+        self._dispatch: Optional[Tuple[Dict, Dict]] = None
+        
+        for analysis in analyses:
+            self.add(analysis)
+    
+    def add(self, analysis: ASTAnalysis) -> 'MultiAnalysisWalker':
+        """분석 객체를 등록합니다 (기본 클래스 구현을 그대로 쓰는 훅은 건너뜀)"""
+        self._analyses.append(analysis)
+        analysis_type = type(analysis)
+        if analysis_type.enter is not ASTAnalysis.enter:
+            self._register(self._enter, analysis.enter, analysis.node_types)
+        if analysis_type.leave is not ASTAnalysis.leave:
+            self._register(self._leave, analysis.leave, analysis.node_types)
+        return self
+    
+    def on_enter(self, name: str, callback: Callable[[MSLNode, int], Any],
+                 *node_types: NodeType, result: Optional[Callable[[], Any]] = None) -> 'MultiAnalysisWalker':
+        """
+        전위 콜백을 등록합니다.
+        
+        Args:
+            name (str): 결과 딕셔너리 키
+            callback (Callable): (node, depth)를 받는 콜백
+            *node_types (NodeType): 콜백을 호출할 노드 타입 (없으면 모든 노드)
+            result (Callable, optional): 순회 후 결과를 반환하는 함수 (없으면 None)
+        """
+        self._register(self._enter, callback, node_types or None)
+        self._callback_results[name] = result or (lambda: None)
+        return self
+    
+    def on_leave(self, name: str, callback: Callable[[MSLNode, int], Any],
+                 *node_types: NodeType, result: Optional[Callable[[], Any]] = None) -> 'MultiAnalysisWalker':
+        """후위 콜백을 등록합니다 (인자는 on_enter와 동일)"""
+        self._register(self._leave, callback, node_types or None)
+        self._callback_results[name] = result or (lambda: None)
+        return self
+    
+    def _register(self, table: Dict, callback: Callable, node_types: Optional[Iterable[NodeType]]):
+        """디스패치 테이블에 콜백 등록"""
+        for node_type in (node_types or (None,)):
+            table.setdefault(node_type, []).append(callback)
+        self._dispatch = None
+    
+    def _build_dispatch(self) -> Tuple[Dict, Dict]:
+        """노드 타입별 (공통 콜백 + 타입 전용 콜백) 목록을 미리 계산"""
+        def build(table: Dict) -> Dict[NodeType, Tuple[Callable, ...]]:
+            common = table.get(None, [])
+            return {node_type: tuple(common + table.get(node_type, []))
+                    for node_type in NodeType}
+        
+        return build(self._enter), build(self._leave)
+    
+    def run(self, root: MSLNode) -> Dict[str, Any]:
+        """
+        한 번의 순회로 등록된 모든 분석을 실행합니다.
+        
+        Args:
+            root (MSLNode): 분석할 루트 노드
+            
+        Returns:
+            Dict[str, Any]: 분석 이름별 결과
+        """
+        if self._dispatch is None:
+            self._dispatch = self._build_dispatch()
+        enter_table, leave_table = self._dispatch
+        
+        if not self._leave:
+            for node, depth in walk_preorder(root):
+                for callback in enter_table[node.node_type]:
+                    callback(node, depth)
+        else:
+            stack = [(root, 0, False)]
+            while stack:
+                node, depth, leaving = stack.pop()
+                if leaving:
+                    for callback in leave_table[node.node_type]:
+                        callback(node, depth)
+                    continue
+                for callback in enter_table[node.node_type]:
+                    callback(node, depth)
+                stack.append((node, depth, True))
+                child_depth = depth + 1
+                for child in reversed(node.children):
+                    stack.append((child, child_depth, False))
+        
+        results = {analysis.name: analysis.result() for analysis in self._analyses}
+        for name, result in self._callback_results.items():
+            results[name] = result()
+        return results
+
+
+# 불변 노드로 옮기지 않는 MSLNode 구조 필드 (나머지 인스턴스 속성은 그대로 보존)
+_STRUCTURAL_FIELDS = ('node_type', 'position', 'parent', 'children')
+
+
+class PersistentNode:
+    """
+    불변(persistent) AST 노드
+    
+    MSLNode와 같은 속성과 방문자 인터페이스(accept)를 제공하지만 생성 후에는 수정할 수 없습니다.
+    변경 헬퍼들은 새 노드를 반환하며, 루트에서 변경 지점까지의 경로만 새로 할당하고
+    나머지 서브트리는 원본 트리와 공유합니다 (path copying).
+    부모 포인터는 서브트리 공유와 양립할 수 없으므로 가지지 않습니다.
+    """
+    
+    __slots__ = ('node_class', 'node_type', 'position', 'children', '_attrs', '_hash')
+    
+    def __init__(self, node_class: Type[MSLNode], node_type: NodeType,
+                 attrs: Optional[Dict[str, Any]] = None,
+                 children: Sequence['PersistentNode'] = (),
+                 position: Optional[Position] = None):
+        """
+        불변 노드 초기화
+        
+        Args:
+            node_class (Type[MSLNode]): 원본 노드 클래스 (방문자 디스패치 및 복원에 사용)
+            node_type (NodeType): 노드 타입
+            attrs (Dict[str, Any], optional): 노드 고유 속성 (key_name, count 등)
+            children (Sequence[PersistentNode]): 자식 노드들
+            position (Position, optional): 소스 코드 위치
+        """
+        object.__setattr__(self, 'node_class', node_class)
+        object.__setattr__(self, 'node_type', node_type)
+        object.__setattr__(self, 'position', position)
+        object.__setattr__(self, 'children', tuple(children))
+        object.__setattr__(self, '_attrs', dict(attrs) if attrs else {})
+        object.__setattr__(self, '_hash', None)
+    
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"PersistentNode는 수정할 수 없습니다: {name}")
+    
+    def __delattr__(self, name: str):
+        raise AttributeError(f"PersistentNode는 수정할 수 없습니다: {name}")
+    
+    def __getattr__(self, name: str) -> Any:
+        """슬롯에 없는 속성은 노드 고유 속성에서 찾습니다 (key_name, hold_time 등)"""
+        try:
+            return object.__getattribute__(self, '_attrs')[name]
+        except KeyError:
+            raise AttributeError(name) from None
+    
+    @property
+    def attrs(self) -> MappingProxyType:
+        """노드 고유 속성의 읽기 전용 뷰"""
+        return MappingProxyType(self._attrs)
+    
+    def accept(self, visitor):
+        """원본 노드 클래스의 accept로 디스패치하여 기존 방문자를 그대로 사용합니다"""
+        return self.node_class.accept(self, visitor)
+    
+    # 경로 복사 변경 헬퍼
+    
+    def with_children(self, children: Sequence['PersistentNode']) -> 'PersistentNode':
+        """자식 목록만 교체한 새 노드를 반환합니다 (속성과 위치는 공유)"""
+        return PersistentNode(self.node_class, self.node_type, self._attrs, children, self.position)
+    
+    def with_attrs(self, **changes: Any) -> 'PersistentNode':
+        """일부 속성만 바꾼 새 노드를 반환합니다 (자식 서브트리는 공유)"""
+        attrs = dict(self._attrs)
+        attrs.update(changes)
+        return PersistentNode(self.node_class, self.node_type, attrs, self.children, self.position)
+    
+    def replace_child(self, index: int, child: 'PersistentNode') -> 'PersistentNode':
+        """index 위치의 자식을 교체한 새 노드를 반환합니다"""
+        children = list(self.children)
+        children[index] = child
+        return self.with_children(children)
+    
+    def node_at(self, path: Sequence[int]) -> 'PersistentNode':
+        """자식 인덱스 경로를 따라 내려간 노드를 반환합니다"""
+        node = self
+        for index in path:
+            node = node.children[index]
+        return node
+    
+    def replace_at(self, path: Sequence[int], new_node: 'PersistentNode') -> 'PersistentNode':
+        """
+        경로 위의 노드를 교체한 새 루트를 반환합니다.
+        
+        루트부터 교체 지점까지 len(path)+1 개의 노드만 새로 할당되고
+        경로 밖의 서브트리는 모두 원본과 공유됩니다.
+        
+        Args:
+            path (Sequence[int]): 루트에서 대상 노드까지의 자식 인덱스 경로 (빈 경로는 루트)
+            new_node (PersistentNode): 대상 위치에 들어갈 노드
+            
+        Returns:
+            PersistentNode: 새 루트 노드
+        """
+        ancestors = []
+        node = self
+        for index in path:
+            ancestors.append((node, index))
+            node = node.children[index]
+        
+        result = new_node
+        for ancestor, index in reversed(ancestors):
+            result = ancestor.replace_child(index, result)
+        return result
+    
+    # 변환 및 비교
+    
+    def thaw(self) -> MSLNode:
+        """수정 가능한 MSLNode 트리로 복원합니다 (부모 포인터 포함)"""
+        node = self.node_class.__new__(self.node_class)
+        node.__dict__.update(self._attrs)
+        node.node_type = self.node_type
+        node.position = self.position
+        node.parent = None
+        node.children = []
+        for child in self.children:
+            node.add_child(child.thaw())
+        return node
+    
+    def __eq__(self, other: Any) -> bool:
+        """구조적 동등성 비교 (소스 위치는 비교하지 않음)"""
+        if self is other:
+            return True
+        if not isinstance(other, PersistentNode):
+            return NotImplemented
+        if hash(self) != hash(other):
+            return False
+        return (self.node_class is other.node_class
+                and self._attrs == other._attrs
+                and self.children == other.children)
+    
+    def __hash__(self) -> int:
+        if self._hash is None:
+            try:
+                attrs_key = hash(tuple(sorted(self._attrs.items())))
+            except TypeError:
+                # 해시 불가능한 속성 값은 문자열 표현으로 대체
+                attrs_key = hash(repr(sorted(self._attrs.items())))
+            object.__setattr__(self, '_hash',
+                               hash((self.node_class, attrs_key, self.children)))
+        return self._hash
+    
+    def __str__(self) -> str:
+        return self.node_class.__str__(self)
+    
+    def __repr__(self) -> str:
+        return f"PersistentNode({self})"
+    
+    def tree_string(self, indent: int = 0) -> str:
+        """트리 구조를 문자열로 표현하는 메서드"""
+        return MSLNode.tree_string(self, indent)
+
+
+def freeze(node: MSLNode) -> PersistentNode:
+    """
+    수정 가능한 MSLNode 트리를 불변 PersistentNode 트리로 변환합니다.
+    
+    Args:
+        node (MSLNode): 변환할 루트 노드 (이미 불변 노드이면 그대로 반환)
+        
+    Returns:
+        PersistentNode: 불변 루트 노드
+    """
+    if isinstance(node, PersistentNode):
+        return node
+    
+    # 후위 순회로 자식부터 변환하여 깊은 트리에서도 재귀 한도에 걸리지 않도록 함
+    frozen: Dict[int, PersistentNode] = {}
+    for current, _ in walk_postorder(node):
+        attrs = {name: value for name, value in vars(current).items()
+                 if name not in _STRUCTURAL_FIELDS}
+        children = [frozen[id(child)] for child in current.children]
+        frozen[id(current)] = PersistentNode(type(current), current.node_type, attrs,
+                                             children, current.position)
+    return frozen[id(node)]
+
+
+def thaw(node: PersistentNode) -> MSLNode:
+    """불변 노드 트리를 수정 가능한 MSLNode 트리로 복원합니다"""
+    if isinstance(node, MSLNode):
+        return node
+    return node.thaw()
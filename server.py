@@ -7,21 +7,26 @@ MSL MCP Server - 게이머를 위한 매크로 스크립팅 언어 도우미
 - 자연어 프롬프트에서 MSL 스크립트 자동 생성
 - MSL 구문 최적화 및 설명
 - 게임별 매크로 예제 제공
+
+도구는 처음 호출될 때 생성되므로(ToolRegistry) 서버 시작 시에는 파서, 예제 데이터베이스,
+OpenAI SDK 등을 불러오지 않습니다. 시작 시간은 서버 로그에 기록됩니다.
 """
 
+import time
+
+# 시작 시간 측정 기준 (모듈 임포트 시작 시각)
+_STARTUP_STARTED = time.perf_counter()
+
 import asyncio
 import logging
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-# MSL 도구들 임포트
-from tools.parse_tool import ParseMSLTool
-from tools.generate_tool import GenerateMSLTool
-from tools.validate_tool import ValidateMSLTool
-from tools.optimize_tool import OptimizeMSLTool
-from tools.explain_tool import ExplainMSLTool
-from tools.examples_tool import ExamplesMSLTool
+# MSL 도구 레지스트리 (도구 모듈은 처음 호출될 때 임포트)
+from tools.registry import ToolRegistry
+from tools.dispatch import ToolDispatcher, ToolBusyError, ToolTimeoutError
+from tools.worker_pool import WorkerPool
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -30,13 +35,14 @@ logger = logging.getLogger("msl-mcp-server")
 # MCP 서버 인스턴스 생성
 server = Server("msl-assistant")
 
-# MSL 도구 인스턴스들
-parse_tool = ParseMSLTool()
-generate_tool = GenerateMSLTool()
-validate_tool = ValidateMSLTool()
-optimize_tool = OptimizeMSLTool()
-explain_tool = ExplainMSLTool()
-examples_tool = ExamplesMSLTool()
+# MSL 도구들 (처음 호출될 때 생성)
+tool_registry = ToolRegistry()
+
+# 도구별 동시 실행 한도/대기열 (첫 call_tool에서 설정을 읽어 생성)
+_dispatcher = None
+
+# 모듈 임포트에 걸린 시간 (밀리초)
+_IMPORT_MS = (time.perf_counter() - _STARTUP_STARTED) * 1000
 
 
 @server.list_tools()
@@ -44,137 +50,52 @@ async def list_tools() -> list[Tool]:
     """
     사용 가능한 MSL 도구 목록을 반환합니다.
     
+    도구 정의는 각 도구 클래스의 TOOL_DEFINITION에서 처음 한 번 만들어 캐시한 목록입니다.
+    
     Returns:
         list[Tool]: 6개 MSL 도구의 정의 목록
     """
-    return [
-        Tool(
-            name="parse_msl",
-            description="MSL 스크립트를 파싱하고 AST 구조를 분석합니다. 구문 오류를 검출하고 토큰 분석 결과를 제공합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script": {
-                        "type": "string",
-                        "description": "분석할 MSL 스크립트 코드"
-                    },
-                    "detailed": {
-                        "type": "boolean", 
-                        "description": "상세한 AST 및 토큰 정보 포함 여부",
-                        "default": False
-                    }
-                },
-                "required": ["script"]
-            }
-        ),
-        Tool(
-            name="generate_msl",
-            description="자연어 설명을 바탕으로 MSL 스크립트를 자동 생성합니다. Context7를 활용하여 게임별 최적화된 스크립트를 생성합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "prompt": {
-                        "type": "string",
-                        "description": "원하는 매크로 동작을 설명하는 자연어 프롬프트"
-                    },
-                    "game_type": {
-                        "type": "string",
-                        "description": "게임 타입 (fps, mmo, rts, moba, general)",
-                        "default": "general"
-                    },
-                    "complexity": {
-                        "type": "string",
-                        "description": "스크립트 복잡도 (simple, medium, complex)",
-                        "default": "medium"
-                    }
-                },
-                "required": ["prompt"]
-            }
-        ),
-        Tool(
-            name="validate_msl",
-            description="MSL 스크립트의 구문과 논리적 오류를 검증합니다. 성능 문제나 비효율적인 패턴을 진단합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script": {
-                        "type": "string",
-                        "description": "검증할 MSL 스크립트 코드"
-                    },
-                    "strict": {
-                        "type": "boolean",
-                        "description": "엄격한 검증 모드 활성화",
-                        "default": False
-                    }
-                },
-                "required": ["script"]
-            }
-        ),
-        Tool(
-            name="optimize_msl",
-            description="MSL 스크립트를 최적화하여 성능을 개선하고 더 효율적인 구조로 변환합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script": {
-                        "type": "string",
-                        "description": "최적화할 MSL 스크립트 코드"
-                    },
-                    "target": {
-                        "type": "string",
-                        "description": "최적화 목표 (speed, readability, compatibility)",
-                        "default": "speed"
-                    }
-                },
-                "required": ["script"]
-            }
-        ),
-        Tool(
-            name="explain_msl",
-            description="MSL 스크립트나 특정 구문을 상세히 설명합니다. 동작 방식과 매개변수를 분석하여 학습을 도와줍니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "input": {
-                        "type": "string",
-                        "description": "설명할 MSL 스크립트 또는 구문"
-                    },
-                    "detail_level": {
-                        "type": "string",
-                        "description": "설명 상세도 (basic, intermediate, advanced)",
-                        "default": "intermediate"
-                    }
-                },
-                "required": ["input"]
-            }
-        ),
-        Tool(
-            name="msl_examples",
-            description="특정 카테고리나 게임 타입에 맞는 MSL 예제를 제공합니다. 학습 목적이나 템플릿으로 활용할 수 있습니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category": {
-                        "type": "string",
-                        "description": "예제 카테고리 (combat, movement, ui_interaction, combo, timing)",
-                        "default": "all"
-                    },
-                    "game_type": {
-                        "type": "string",
-                        "description": "게임 타입 (fps, mmo, rts, moba, general)",
-                        "default": "general"
-                    },
-                    "count": {
-                        "type": "integer",
-                        "description": "반환할 예제 개수",
-                        "default": 5,
-                        "minimum": 1,
-                        "maximum": 20
-                    }
-                }
-            }
-        )
-    ]
+    return tool_registry.catalogue()
+
+
+def _get_dispatcher() -> ToolDispatcher:
+    """
+    도구 호출 디스패처 반환 (처음 호출 시 설정에서 한도, 마감 시간, 작업자 풀 설정을 읽어 생성)
+    
+    설정(pydantic)은 서버 시작을 늦추지 않도록 처음 필요할 때 불러오며,
+    설정 모듈을 임포트할 수 없을 때만 기본값을 사용합니다.
+    잘못된 설정값(환경변수, .env)은 기본값으로 덮지 않고 그대로 오류로 보고합니다.
+    """
+    global _dispatcher
+    if _dispatcher is None:
+        try:
+            from config import get_config_manager
+        except ImportError as e:
+            logger.warning(f"설정 모듈을 불러올 수 없어 동시 실행 기본값 사용: {e}")
+            limits, workers = {}, {}
+        else:
+            config = get_config_manager()
+            limits = config.get_concurrency_config()
+            limits.update(config.get_timeout_config())
+            workers = config.get_worker_config()
+        
+        pool = None
+        if workers.get("max_workers", 1) > 0:
+            pool = WorkerPool(tool_registry, tool_registry.cpu_bound_names, **workers)
+        _dispatcher = ToolDispatcher(tool_registry, pool=pool, **limits)
+        logger.info(f"도구 동시 실행 한도: {limits or '기본값'}, 작업자: {workers or '기본값'}")
+    return _dispatcher
+
+
+async def _warm_workers():
+    """서버 준비 후 백그라운드에서 작업자 프로세스를 미리 띄움"""
+    pool = _get_dispatcher().pool
+    if pool is None:
+        return
+    try:
+        await pool.warm()
+    except Exception as e:
+        logger.warning(f"도구 작업자 예열 실패: {e}")
 
 
 @server.call_tool()
@@ -189,23 +110,25 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     Returns:
         list[TextContent]: 도구 실행 결과
     """
+    if name not in tool_registry:
+        return [TextContent(type="text", text=f"알 수 없는 도구: {name}")]
+    
     try:
-        if name == "parse_msl":
-            result = await parse_tool.execute(arguments)
-        elif name == "generate_msl":
-            result = await generate_tool.execute(arguments)
-        elif name == "validate_msl":
-            result = await validate_tool.execute(arguments)
-        elif name == "optimize_msl":
-            result = await optimize_tool.execute(arguments)
-        elif name == "explain_msl":
-            result = await explain_tool.execute(arguments)
-        elif name == "msl_examples":
-            result = await examples_tool.execute(arguments)
-        else:
-            return [TextContent(type="text", text=f"알 수 없는 도구: {name}")]
+        # 입력 스키마 검증 (도구 인스턴스를 만들기 전에 미리 컴파일된 검증 함수로 확인)
+        errors = tool_registry.validate(name, arguments)
+        if errors:
+            return [TextContent(type="text", text=f"❌ 잘못된 인자 ({name}): " + "; ".join(errors))]
         
-        return [TextContent(type="text", text=result)]
+        # 도구별 한도와 마감 시간 안에서 실행 (슬롯과 대기열이 모두 차 있으면 즉시 거절)
+        return await _get_dispatcher().dispatch(name, arguments)
+    
+    except ToolBusyError as e:
+        logger.warning(f"도구 호출 거절 ({name}): {e}")
+        return [TextContent(type="text", text=f"⏳ 서버가 바쁩니다: {e}")]
+    
+    except ToolTimeoutError as e:
+        logger.warning(f"도구 호출 시간 초과 ({name}): {e}")
+        return [TextContent(type="text", text=f"⏱️ 요청 시간 초과: {e}")]
         
     except Exception as e:
         logger.error(f"도구 실행 중 오류 발생 ({name}): {e}")
@@ -217,12 +140,21 @@ async def main():
     MSL MCP 서버를 시작합니다.
     """
     logger.info("MSL MCP 서버 시작 중...")
-    logger.info("지원 도구: parse_msl, generate_msl, validate_msl, optimize_msl, explain_msl, msl_examples")
+    logger.info(f"지원 도구: {', '.join(tool_registry.names)}")
     
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream, write_stream, server.create_initialization_options()
-        )
+    startup_ms = (time.perf_counter() - _STARTUP_STARTED) * 1000
+    logger.info(f"MSL MCP 서버 준비 완료: {startup_ms:.1f}ms (모듈 임포트 {_IMPORT_MS:.1f}ms)")
+    
+    warm_task = asyncio.create_task(_warm_workers())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream, write_stream, server.create_initialization_options()
+            )
+    finally:
+        warm_task.cancel()
+        if _dispatcher is not None and _dispatcher.pool is not None:
+            _dispatcher.pool.shutdown()
 
 
 if __name__ == "__main__":
@@ -11,6 +11,7 @@ import logging
 from aiohttp import web, web_request
 from msl.msl_lexer import MSLLexer
 from msl.msl_parser import MSLParser
+from msl.msl_simulator import MSLSimulator
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -21,6 +22,7 @@ class MSLHttpServer:
     
     def __init__(self):
         self.app = web.Application()
+        self.simulator = MSLSimulator()
         self.setup_routes()
     
     def setup_routes(self):
@@ -74,7 +76,7 @@ class MSLHttpServer:
                 "token_count": len(tokens),
                 "tokens": [{"type": token.type.value, "value": token.value} for token in tokens[:10]],  # 처음 10개만
                 "analysis": {
-                    "estimated_time": self.calculate_execution_time(tokens),
+                    "estimated_time": self.calculate_execution_time(script),
                     "complexity": self.calculate_complexity(tokens),
                     "key_count": len([t for t in tokens if t.type.value in ['KEY', 'MOUSE_BUTTON']])
                 }
@@ -110,7 +112,7 @@ class MSLHttpServer:
             if len(tokens) == 0:
                 errors.append("빈 스크립트입니다")
             
-            execution_time = self.calculate_execution_time(tokens)
+            execution_time = self.calculate_execution_time(script)
             if execution_time > 10000:
                 warnings.append(f"실행 시간이 {execution_time}ms로 매우 깁니다")
             
@@ -165,15 +167,13 @@ class MSLHttpServer:
             "count": len(examples)
         })
     
-    def calculate_execution_time(self, tokens):
-        """토큰 기반 실행 시간 계산"""
-        total_time = 0
-        for token in tokens:
-            if token.type.value == 'DELAY':
-                total_time += int(token.value) if token.value.isdigit() else 0
-            elif token.type.value in ['KEY', 'MOUSE_BUTTON']:
-                total_time += 50  # 기본 키 입력 시간
-        return total_time
+    def calculate_execution_time(self, script):
+        """시뮬레이터 추정 기반 실행 시간 계산 (밀리초)"""
+        try:
+            return int(round(self.simulator.estimate_script(script).duration_ms))
+        except Exception:
+            # 파싱/컴파일할 수 없는 스크립트는 시간을 알 수 없음
+            return 0
     
     def calculate_complexity(self, tokens):
         """토큰 기반 복잡도 계산 (1-10)"""
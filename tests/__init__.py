@@ -0,0 +1,6 @@
+"""
+MSL MCP 서버 단위 테스트
+
+파서를 거치지 않고 AST를 직접 만들어 컴파일러, 인터프리터, 속도 제한, 캐시, 디스패처를 검증합니다.
+입력은 RecordingBackend로 기록하므로 실제 키보드/마우스 입력은 발생하지 않습니다.
+"""
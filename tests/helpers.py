@@ -0,0 +1,35 @@
+"""테스트용 AST 생성 헬퍼"""
+
+import os
+import sys
+
+# 프로젝트 루트 경로를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from msl_ast import MSLNode, KeyNode, RepeatNode, IntervalNode, HoldNode
+
+
+def node(node_class, *args, children=()) -> MSLNode:
+    """자식 노드를 붙인 노드 생성"""
+    result = node_class(*args)
+    for child in children:
+        result.add_child(child)
+    return result
+
+
+def key(name: str) -> KeyNode:
+    """키 입력 노드"""
+    return KeyNode(name)
+
+
+def hold(name: str, hold_ms: int) -> HoldNode:
+    """키 홀드 노드 (name[hold_ms])"""
+    return node(HoldNode, hold_ms, children=[key(name)])
+
+
+def repeat(body: MSLNode, count: int, interval_ms=None) -> RepeatNode:
+    """반복 노드 (body*count{interval_ms})"""
+    children = [body]
+    if interval_ms is not None:
+        children.append(IntervalNode(interval_ms))
+    return node(RepeatNode, count, children=children)
@@ -0,0 +1,48 @@
+"""입력 백엔드 테스트"""
+
+import pytest
+
+from msl.msl_backend import RecordingBackend, NullBackend, BackendError, create_backend
+
+
+def test_recording_backend_records_in_order():
+    """기록 백엔드는 입력을 순서대로 타임스탬프와 함께 기록"""
+    backend = RecordingBackend()
+    backend.key_down('w')
+    backend.move(10, 20)
+    backend.scroll(-3)
+    backend.key_up('w')
+    
+    assert [(event.action, event.args) for event in backend.events] == [
+        ('key_down', ('w',)), ('move', (10, 20)), ('scroll', (-3,)), ('key_up', ('w',)),
+    ]
+    timestamps = [event.timestamp_ns for event in backend.events]
+    assert timestamps == sorted(timestamps)
+
+
+def test_recording_backend_batches_share_timestamp():
+    """일괄 입력은 같은 타임스탬프로 기록"""
+    backend = RecordingBackend()
+    backend.send_batch([('key_down', ('ctrl',)), ('key_down', ('c',)), ('key_up', ('c',))])
+    
+    assert len({event.timestamp_ns for event in backend.events}) == 1
+    assert backend.relative_events()[0].timestamp_ns == 0
+
+
+def test_hotkey_releases_in_reverse_order():
+    """hotkey()는 순서대로 누르고 역순으로 뗌"""
+    backend = RecordingBackend()
+    backend.hotkey('ctrl', 'shift', 'esc')
+    
+    assert [(event.action, event.args[0]) for event in backend.events] == [
+        ('key_down', 'ctrl'), ('key_down', 'shift'), ('key_down', 'esc'),
+        ('key_up', 'esc'), ('key_up', 'shift'), ('key_up', 'ctrl'),
+    ]
+
+
+def test_create_backend_by_name():
+    """이름으로 백엔드 생성 (알 수 없는 이름은 BackendError)"""
+    assert isinstance(create_backend('null'), NullBackend)
+    assert isinstance(create_backend('recording'), RecordingBackend)
+    with pytest.raises(BackendError):
+        create_backend('missing')
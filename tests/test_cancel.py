@@ -0,0 +1,71 @@
+"""요청 마감(취소 토큰) 테스트"""
+
+import time
+
+import pytest
+
+from tests.helpers import key, repeat
+from msl.msl_cancel import (CancellationToken, DeadlineExceeded, cancellation_scope,
+                            check_cancelled, current_token)
+from msl.msl_compiler import MSLCompiler
+
+
+def test_token_expires_after_deadline():
+    """마감 시각이 지나면 취소된 것으로 보고 check()가 DeadlineExceeded를 발생"""
+    token = CancellationToken(0.01)
+    assert not token.cancelled
+    token.check()
+    
+    time.sleep(0.02)
+    
+    assert token.cancelled
+    assert token.remaining() == 0.0
+    with pytest.raises(DeadlineExceeded):
+        token.check()
+
+
+def test_token_without_deadline_never_expires():
+    """마감이 없는 토큰은 cancel()로만 취소"""
+    token = CancellationToken()
+    assert token.remaining() is None
+    assert token.wall_deadline() is None
+    assert not token.cancelled
+    
+    token.cancel()
+    assert token.cancelled
+
+
+def test_wall_deadline_round_trip():
+    """절대 마감 시각으로 다시 만든 토큰은 같은 시각에 마감"""
+    token = CancellationToken(10)
+    restored = CancellationToken.from_wall_deadline(token.wall_deadline(), token.timeout_seconds)
+    
+    assert restored.timeout_seconds == 10
+    assert abs(restored.remaining() - token.remaining()) < 0.05
+    assert CancellationToken.from_wall_deadline(time.time() - 1).cancelled
+
+
+def test_check_cancelled_uses_current_scope():
+    """check_cancelled()는 현재 컨텍스트의 토큰만 확인하고 범위를 벗어나면 복원"""
+    check_cancelled()
+    expired = CancellationToken(0)
+    
+    with cancellation_scope(expired):
+        assert current_token() is expired
+        with pytest.raises(DeadlineExceeded):
+            check_cancelled()
+    
+    assert current_token() is None
+    check_cancelled()
+
+
+def test_loop_expansion_stops_at_deadline():
+    """반복 스트림을 펼치는 도중 마감이 지나면 중단"""
+    program = MSLCompiler().compile(repeat(key('W'), 10_000_000))
+    
+    started = time.monotonic()
+    with cancellation_scope(CancellationToken(0.05)):
+        with pytest.raises(DeadlineExceeded):
+            for _ in program.events:
+                pass
+    assert time.monotonic() - started < 2.0
@@ -0,0 +1,63 @@
+"""가까운 시각 이벤트의 일괄 입력 묶기 테스트"""
+
+from tests.helpers import node, key
+from msl_ast import SimultaneousNode
+from msl.msl_compiler import ProgramEvent, EventOp, coalesce_events
+from msl.msl_backend import RecordingBackend
+from msl.msl_interpreter import MSLInterpreter
+from msl.msl_program_cache import ProgramCache
+
+
+def _events(*offsets_us):
+    return [ProgramEvent(offset_us, EventOp.KEY_DOWN, index) for index, offset_us in enumerate(offsets_us)]
+
+
+def _groups(events, epsilon_us):
+    """(묶음 오프셋, 묶음 안 이벤트의 키 코드) 목록"""
+    return [(offset_us, [event.arg0 for event in batch])
+            for offset_us, batch in coalesce_events(events, epsilon_us)]
+
+
+def test_event_at_epsilon_joins_batch():
+    """첫 이벤트에서 정확히 epsilon 떨어진 이벤트는 같은 묶음"""
+    assert _groups(_events(0, 1000), 1000) == [(0, [0, 1])]
+
+
+def test_event_past_epsilon_starts_new_batch():
+    """epsilon보다 1us라도 늦으면 새 묶음"""
+    assert _groups(_events(0, 1001), 1000) == [(0, [0]), (1001, [1])]
+
+
+def test_window_is_measured_from_batch_start():
+    """묶음 범위는 직전 이벤트가 아니라 묶음의 첫 이벤트 기준 (사슬처럼 늘어나지 않음)"""
+    assert _groups(_events(0, 600, 1200, 1500), 1000) == [(0, [0, 1]), (1200, [2, 3])]
+
+
+def test_zero_epsilon_groups_only_same_time():
+    """epsilon이 0이면 같은 시각의 이벤트만 묶음"""
+    assert _groups(_events(5, 5, 6, 6, 6), 0) == [(5, [0, 1]), (6, [2, 3, 4])]
+
+
+def test_order_within_batch_is_preserved():
+    """묶음 안의 순서는 입력 순서 그대로"""
+    events = [ProgramEvent(0, EventOp.KEY_DOWN, 7), ProgramEvent(10, EventOp.KEY_UP, 7),
+              ProgramEvent(20, EventOp.KEY_DOWN, 3)]
+    ((_, batch),) = coalesce_events(events, 1000)
+    
+    assert list(batch) == events
+
+
+def test_empty_stream_yields_nothing():
+    """이벤트가 없으면 묶음도 없음"""
+    assert list(coalesce_events([], 1000)) == []
+
+
+def test_simultaneous_keys_are_sent_as_one_batch():
+    """Ctrl+C의 누름/뗌은 백엔드에 하나의 일괄 입력으로 전달"""
+    backend = RecordingBackend()
+    interpreter = MSLInterpreter(backend=backend, program_cache=ProgramCache(), rate_limits={})
+    result = interpreter.execute(node(SimultaneousNode, children=[key('Ctrl'), key('C')]))
+    
+    assert result.success
+    assert len(backend.events) == 4
+    assert len({event.timestamp_ns for event in backend.events}) == 1
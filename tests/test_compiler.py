@@ -0,0 +1,193 @@
+"""AST -> 이벤트 프로그램 컴파일 테스트"""
+
+import pytest
+
+from tests.helpers import node, key, hold, repeat
+from msl_ast import (SequentialNode, SimultaneousNode, ParallelNode, ContinuousNode, DelayNode,
+                     VariableNode, freeze)
+from msl.msl_compiler import (MSLCompiler, CompileError, EventStream, EventOp,
+                              CONTINUOUS_MAX_DURATION_MS, CONTINUOUS_MIN_PERIOD_MS)
+
+
+def _ops(program):
+    """(오프셋, 연산, 키 이름) 목록 (WAIT 제외)"""
+    return [(event.offset_us, event.op, program.key_name(event.arg0))
+            for event in program.events if event.op in (EventOp.KEY_DOWN, EventOp.KEY_UP)]
+
+
+def test_sequence_timeline():
+    """W[100], (50), A: 홀드와 지연만큼 커서가 전진"""
+    tree = node(SequentialNode, children=[hold('W', 100), DelayNode(50), key('A')])
+    program = MSLCompiler().compile(tree)
+    
+    assert _ops(program) == [
+        (0, EventOp.KEY_DOWN, 'w'),
+        (100_000, EventOp.KEY_UP, 'w'),
+        (150_000, EventOp.KEY_DOWN, 'a'),
+        (150_000, EventOp.KEY_UP, 'a'),
+    ]
+    assert program.duration_us == 150_000
+    assert program.action_count == 4
+
+
+def test_simultaneous_releases_in_reverse_order():
+    """Ctrl+C: 함께 누르고 역순으로 뗌"""
+    program = MSLCompiler().compile(node(SimultaneousNode, children=[key('Ctrl'), key('C')]))
+    
+    assert [(op, name) for _, op, name in _ops(program)] == [
+        (EventOp.KEY_DOWN, 'ctrl'), (EventOp.KEY_DOWN, 'c'),
+        (EventOp.KEY_UP, 'c'), (EventOp.KEY_UP, 'ctrl'),
+    ]
+
+
+def test_events_are_regenerated_on_each_iteration():
+    """프로그램은 불변이며 순회할 때마다 같은 이벤트를 처음부터 만듦"""
+    program = MSLCompiler().compile(hold('W', 10))
+    
+    assert list(program.events) == list(program.events)
+    assert len(program) == 2
+
+
+def test_frozen_tree_compiles_like_original():
+    """불변 트리와 원본 트리는 같은 프로그램으로 컴파일"""
+    tree = node(SequentialNode, children=[hold('W', 100),
+                                         node(SimultaneousNode, children=[key('Ctrl'), key('C')])])
+    original = MSLCompiler().compile(tree)
+    frozen = MSLCompiler().compile(freeze(tree))
+    
+    assert list(frozen.events) == list(original.events)
+    assert frozen.duration_us == original.duration_us
+
+
+def test_variable_value_is_inlined():
+    """AST 값을 가진 변수는 참조 위치에 인라인"""
+    tree = node(SequentialNode, children=[VariableNode('combo'), key('A')])
+    program = MSLCompiler().compile(tree, {'combo': hold('W', 20)})
+    
+    assert [name for _, op, name in _ops(program) if op == EventOp.KEY_DOWN] == ['w', 'a']
+    assert program.duration_us == 20_000
+
+
+def test_undefined_variable_raises():
+    """정의되지 않은 변수는 CompileError"""
+    with pytest.raises(CompileError, match="정의되지 않은 변수"):
+        MSLCompiler().compile(VariableNode('missing'))
+
+
+def test_self_referencing_variable_raises():
+    """자기 자신을 참조하는 변수는 RecursionError 대신 CompileError"""
+    variables = {'loop': node(SequentialNode, children=[key('W'), VariableNode('loop')])}
+    
+    with pytest.raises(CompileError, match=r"순환 변수 참조: \$loop"):
+        MSLCompiler().compile(VariableNode('loop'), variables)
+
+
+def test_indirect_variable_cycle_raises():
+    """다른 변수를 거친 순환 참조도 CompileError (불변 노드 값 포함)"""
+    variables = {
+        'a': node(SequentialNode, children=[key('W'), VariableNode('b')]),
+        'b': freeze(node(SequentialNode, children=[key('A'), VariableNode('a')])),
+    }
+    
+    with pytest.raises(CompileError, match="순환 변수 참조"):
+        MSLCompiler().compile(VariableNode('a'), variables)
+
+
+def test_repeated_variable_reference_is_not_a_cycle():
+    """같은 변수를 여러 번 (중첩 없이) 참조하는 것은 순환이 아님"""
+    tree = node(SequentialNode, children=[VariableNode('tap'), VariableNode('tap')])
+    program = MSLCompiler().compile(tree, {'tap': key('W')})
+    
+    assert len(_ops(program)) == 4
+
+
+def test_event_stream_is_abstract():
+    """EventStream은 직접 만들 수 없는 추상 기본 클래스"""
+    with pytest.raises(TypeError):
+        EventStream()
+
+
+def test_parallel_branches_merge_by_time():
+    """A[30] | (B, (10), C): 분기 이벤트가 시각순으로 섞이고 가장 긴 분기에서 종료"""
+    branch = node(SequentialNode, children=[key('B'), DelayNode(10), key('C')])
+    program = MSLCompiler().compile(node(ParallelNode, children=[hold('A', 30), branch]))
+    
+    assert _ops(program) == [
+        (0, EventOp.KEY_DOWN, 'a'),
+        (0, EventOp.KEY_DOWN, 'b'),
+        (0, EventOp.KEY_UP, 'b'),
+        (10_000, EventOp.KEY_DOWN, 'c'),
+        (10_000, EventOp.KEY_UP, 'c'),
+        (30_000, EventOp.KEY_UP, 'a'),
+    ]
+    assert program.duration_us == 30_000
+
+
+def test_parallel_same_time_events_keep_branch_order():
+    """같은 시각의 이벤트는 분기 순서대로 (결정적)"""
+    program = MSLCompiler().compile(node(ParallelNode, children=[key('X'), key('Y'), key('Z')]))
+    downs = [name for _, op, name in _ops(program) if op == EventOp.KEY_DOWN]
+    
+    assert downs == ['x', 'y', 'z']
+    assert list(program.events) == list(program.events)
+
+
+def test_nested_parallel_after_sequence():
+    """병렬 노드 뒤의 동작은 가장 긴 분기가 끝난 시각에 시작"""
+    parallel = node(ParallelNode, children=[hold('A', 50), hold('B', 20)])
+    program = MSLCompiler().compile(node(SequentialNode, children=[parallel, key('C')]))
+    
+    assert (50_000, EventOp.KEY_DOWN, 'c') in _ops(program)
+
+
+def test_repeat_places_interval_between_iterations():
+    """A[10]*3{20}: 주기는 본문 + 간격이며 마지막 반복 뒤에는 간격이 없음"""
+    program = MSLCompiler().compile(repeat(hold('A', 10), 3, 20))
+    downs = [offset for offset, op, _ in _ops(program) if op == EventOp.KEY_DOWN]
+    
+    assert downs == [0, 30_000, 60_000]
+    assert program.duration_us == 70_000
+
+
+def test_repeat_stores_body_once():
+    """반복 횟수와 무관하게 본문만 보관하며 길이와 연산 수는 펼치지 않고 계산"""
+    small = MSLCompiler().compile(repeat(key('W'), 10))
+    large = MSLCompiler().compile(repeat(key('W'), 1_000_000))
+    
+    assert small.events.stored_count == large.events.stored_count
+    assert len(large) == 2_000_000
+    assert large.events.op_counts() == {EventOp.KEY_DOWN: 1_000_000, EventOp.KEY_UP: 1_000_000}
+
+
+def test_nested_repeat_matches_expanded_sequence():
+    """(W, A*2{5})*3{10}는 같은 동작을 풀어 쓴 순차 실행과 같은 이벤트"""
+    inner = node(SequentialNode, children=[key('W'), repeat(key('A'), 2, 5)])
+    looped = MSLCompiler().compile(repeat(inner, 3, 10))
+    
+    children = []
+    for index in range(3):
+        if index:
+            children.append(DelayNode(10))
+        children.extend([key('W'), key('A'), DelayNode(5), key('A')])
+    expanded = MSLCompiler().compile(node(SequentialNode, children=children))
+    
+    assert _ops(looped) == _ops(expanded)
+    assert looped.duration_us == expanded.duration_us
+
+
+def test_zero_count_repeat_is_empty():
+    """반복 횟수가 0이면 이벤트가 없음"""
+    program = MSLCompiler().compile(repeat(key('W'), 0))
+    
+    assert len(program) == 0
+    assert program.duration_us == 0
+
+
+def test_continuous_is_capped_by_max_duration_and_min_period():
+    """연속 입력은 최대 실행 시간 동안, 최소 주기 이상의 간격으로 반복"""
+    program = MSLCompiler().compile(node(ContinuousNode, 0, children=[key('W')]))
+    downs = [offset for offset, op, _ in _ops(program) if op == EventOp.KEY_DOWN]
+    
+    assert len(downs) == CONTINUOUS_MAX_DURATION_MS // CONTINUOUS_MIN_PERIOD_MS
+    assert downs[1] - downs[0] == CONTINUOUS_MIN_PERIOD_MS * 1000
+    assert program.duration_us == CONTINUOUS_MAX_DURATION_MS * 1000
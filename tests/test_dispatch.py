@@ -0,0 +1,114 @@
+"""도구 호출 디스패처 테스트 (대기열 거절, 도구별 한도, 마감)"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from msl.msl_cancel import check_cancelled
+from tools.registry import ToolRegistry, ToolSpec
+from tools.dispatch import ToolDispatcher, ToolBusyError, ToolTimeoutError
+
+_SCHEMA = {"type": "object", "properties": {"seconds": {"type": "number"}}}
+
+
+class SleepTool:
+    """지정 시간 동안 이벤트 루프에서 대기하는 도구"""
+    
+    TOOL_DEFINITION = {"name": "sleep", "description": "sleep", "inputSchema": _SCHEMA}
+    
+    async def execute(self, arguments):
+        await asyncio.sleep(arguments.get("seconds", 0))
+        return ["done"]
+
+
+class SpinTool:
+    """취소 토큰을 확인하며 지정 시간 동안 CPU 루프를 도는 도구"""
+    
+    TOOL_DEFINITION = {"name": "spin", "description": "spin", "inputSchema": _SCHEMA}
+    
+    async def execute(self, arguments):
+        loop = asyncio.get_running_loop()
+        until = loop.time() + arguments.get("seconds", 0)
+        while loop.time() < until:
+            check_cancelled()
+        return ["done"]
+
+
+def _dispatcher(**kwargs):
+    registry = ToolRegistry((
+        ToolSpec("sleep", __name__, "SleepTool"),
+        ToolSpec("spin", __name__, "SpinTool", cpu_bound=True),
+    ))
+    return ToolDispatcher(registry, **kwargs)
+
+
+def test_rejects_when_slots_and_queue_are_full():
+    """실행 슬롯과 대기열이 모두 차면 기다리지 않고 거절"""
+    dispatcher = _dispatcher(max_concurrent=1, max_queued=1)
+    
+    async def scenario():
+        running = asyncio.ensure_future(dispatcher.dispatch("sleep", {"seconds": 0.1}))
+        queued = asyncio.ensure_future(dispatcher.dispatch("sleep", {"seconds": 0.1}))
+        await asyncio.sleep(0.01)
+        with pytest.raises(ToolBusyError):
+            await dispatcher.dispatch("sleep", {"seconds": 0})
+        return await asyncio.gather(running, queued)
+    
+    assert asyncio.run(scenario()) == [["done"], ["done"]]
+    stats = dispatcher.get_statistics()["sleep"]
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 2
+    assert stats["active"] == 0 and stats["waiting"] == 0
+
+
+def test_limits_are_per_tool():
+    """한 도구의 대기열이 차도 다른 도구의 호출은 거절되지 않음"""
+    dispatcher = _dispatcher(max_concurrent=1, max_queued=0)
+    
+    async def scenario():
+        running = asyncio.ensure_future(dispatcher.dispatch("sleep", {"seconds": 0.05}))
+        await asyncio.sleep(0.01)
+        result = await dispatcher.dispatch("spin", {"seconds": 0})
+        await running
+        return result
+    
+    assert asyncio.run(scenario()) == ["done"]
+
+
+def test_awaiting_call_times_out():
+    """마감 시간을 넘긴 호출은 ToolTimeoutError"""
+    dispatcher = _dispatcher(request_timeout=0.05)
+    
+    with pytest.raises(ToolTimeoutError):
+        asyncio.run(dispatcher.dispatch("sleep", {"seconds": 5}))
+    assert dispatcher.get_statistics()["sleep"]["timed_out"] == 1
+
+
+def test_cpu_loop_stops_at_deadline():
+    """이벤트 루프를 양보하지 않는 CPU 도구도 취소 토큰으로 마감에 중단"""
+    dispatcher = _dispatcher(request_timeout=None, script_timeout=0.05)
+    
+    async def scenario():
+        started = asyncio.get_running_loop().time()
+        with pytest.raises(ToolTimeoutError):
+            await dispatcher.dispatch("spin", {"seconds": 5})
+        return asyncio.get_running_loop().time() - started
+    
+    assert asyncio.run(scenario()) < 1.0
+    assert dispatcher.get_statistics()["spin"]["timed_out"] == 1
+
+
+def test_queue_wait_counts_toward_deadline():
+    """대기열에서 기다린 시간도 마감에 포함"""
+    dispatcher = _dispatcher(max_concurrent=1, request_timeout=0.1)
+    
+    async def scenario():
+        running = asyncio.ensure_future(dispatcher.dispatch("sleep", {"seconds": 0.08}))
+        await asyncio.sleep(0.01)
+        with pytest.raises(ToolTimeoutError):
+            await dispatcher.dispatch("sleep", {"seconds": 0.05})
+        await running
+    
+    asyncio.run(scenario())
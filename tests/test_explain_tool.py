@@ -0,0 +1,84 @@
+"""설명 도구의 단일 순회 사실 수집 테스트"""
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from tests.helpers import node, key, hold, repeat
+from msl_ast import (SequentialNode, SimultaneousNode, ParallelNode, DelayNode, NodeType,
+                     KeyNode, HoldNode)
+from tools import explain_tool
+
+
+@pytest.fixture
+def tool(monkeypatch):
+    # 도구 생성자는 MSLLexer()를 인자 없이 만들지만 렉서는 입력 텍스트를 요구하며,
+    # 사실 수집은 렉서를 쓰지 않음
+    monkeypatch.setattr(explain_tool, "MSLLexer", lambda: None)
+    return explain_tool.ExplainTool()
+
+
+def _sample_tree():
+    """(Ctrl+C), (500), V[100] | W*3 형태의 트리"""
+    return node(SequentialNode, children=[
+        node(SimultaneousNode, children=[key('Ctrl'), key('C')]),
+        DelayNode(500),
+        node(ParallelNode, children=[hold('V', 100), repeat(key('W'), 3)]),
+        DelayNode(1500),
+    ])
+
+
+def _reference_facts(tool, tree):
+    """노드마다 재귀로 계산한 기대값 (대체된 개별 헬퍼들의 의도)"""
+    facts = {"node_count": 0, "operators": [], "key_sequence": [], "delays": [], "hold_count": 0}
+    
+    def visit(current):
+        facts["node_count"] += 1
+        if current.node_type in tool.operator_symbols:
+            facts["operators"].append(tool.operator_symbols[current.node_type])
+        if isinstance(current, KeyNode):
+            facts["key_sequence"].append(current.key_name)
+        if current.node_type == NodeType.DELAY:
+            facts["delays"].append(current.duration)
+        if isinstance(current, HoldNode):
+            facts["hold_count"] += 1
+        for child in current.children:
+            visit(child)
+    
+    visit(tree)
+    return facts
+
+
+def test_collect_facts_matches_recursive_helpers(tool):
+    """한 번의 순회로 모은 사실이 노드별 재귀 계산과 같음"""
+    tree = _sample_tree()
+    facts = tool._collect_facts(tree)
+    
+    for name, expected in _reference_facts(tool, tree).items():
+        assert facts[name] == expected, name
+
+
+def test_helpers_read_collected_facts(tool):
+    """개별 헬퍼들이 수집된 사실과 같은 답을 냄"""
+    tree = _sample_tree()
+    
+    assert tool._count_nodes(tree) == 11
+    assert tool._find_operators(tree) == [',', '+', '|', '*']
+    assert [delay["delay"] for delay in tool._find_delays(tree)] == [500, 1500]
+    assert tool._find_concurrent_actions(tree) == ["동시 실행 발견"]
+    assert tool._has_delays(tree) and tool._has_excessive_delays(tree)
+    assert tool._has_concurrent_actions(tree) and tool._has_repeats(tree) and tool._has_holds(tree)
+    assert tool._generate_key_sequence(tree) == ['컨트롤키', 'C', 'V', 'W']
+
+
+def test_facts_are_cached_per_ast(tool):
+    """같은 AST는 다시 순회하지 않고, 다른 AST는 새로 수집"""
+    tree = _sample_tree()
+    first = tool._collect_facts(tree)
+    
+    assert tool._collect_facts(tree) is first
+    
+    other = key('A')
+    assert tool._collect_facts(other)["node_count"] == 1
+    assert tool._collect_facts(tree) is not first
+    assert tool._collect_facts(tree) == first
@@ -0,0 +1,96 @@
+"""공유 메모리 링 버퍼와 프로세스 외부 입력 주입기 테스트"""
+
+import threading
+import time
+
+import pytest
+
+from tests.helpers import key, hold, repeat
+from msl.msl_compiler import MSLCompiler
+from msl.msl_injector import SharedRingBuffer, InjectorProcess, InjectorError, RECORD_EVENT
+
+
+@pytest.fixture
+def injector():
+    """null 백엔드를 쓰는 작은 링의 주입 프로세스"""
+    process = InjectorProcess('null', capacity=8)
+    process.start()
+    yield process
+    process.close()
+
+
+def _run_in_thread(injector, program, stop_event=None):
+    """주입기 실행을 별도 스레드에서 시작하고 (스레드, 결과 딕셔너리)를 반환"""
+    outcome = {}
+    
+    def target():
+        try:
+            outcome['report'] = injector.run(program, stop_event=stop_event)
+        except Exception as e:
+            outcome['error'] = e
+    
+    thread = threading.Thread(target=target)
+    thread.start()
+    return thread, outcome
+
+
+def test_ring_wraps_around_capacity():
+    """읽은 만큼 자리가 나며 위치가 용량을 넘어가도 기록 순서대로 읽힘"""
+    ring = SharedRingBuffer(4)
+    try:
+        for index in range(4):
+            assert ring.try_write(RECORD_EVENT, 1, offset_us=index)
+        assert not ring.try_write(RECORD_EVENT, 1, offset_us=99)
+        
+        assert [ring.try_read()[0] for _ in range(3)] == [0, 1, 2]
+        for index in range(4, 7):
+            assert ring.try_write(RECORD_EVENT, 1, offset_us=index)
+        
+        assert len(ring) == 4
+        assert [ring.try_read()[0] for _ in range(4)] == [3, 4, 5, 6]
+        assert ring.try_read() is None
+    finally:
+        ring.close()
+
+
+def test_program_longer_than_ring_is_streamed(injector):
+    """링보다 긴 프로그램도 주입기가 소비하는 대로 이어서 기록되어 끝까지 실행"""
+    program = MSLCompiler().compile(repeat(key('W'), 50, 1))
+    assert len(program) > injector.capacity
+    
+    report = injector.run(program)
+    
+    assert report['error'] is None
+    assert report['completed']
+    assert report['executed_actions'] == 100
+
+
+def test_stop_mid_program_does_not_corrupt_next_program(injector):
+    """실행 도중 중단하면 남은 레코드를 끝 레코드까지 비워 다음 프로그램은 처음부터 실행"""
+    stop_event = threading.Event()
+    thread, outcome = _run_in_thread(injector, MSLCompiler().compile(repeat(hold('W', 10), 200)), stop_event)
+    time.sleep(0.2)
+    injector.stop(stop_event)
+    thread.join(5.0)
+    
+    report = outcome['report']
+    assert report['stopped']
+    assert not report['completed']
+    assert report['timing']['input_state']['held_keys'] == 0
+    
+    report = injector.run(MSLCompiler().compile(hold('A', 10)))
+    assert report['completed']
+    assert report['executed_actions'] == 2
+
+
+def test_child_death_raises_injector_error(injector):
+    """실행 중 주입 프로세스가 종료되면 InjectorError를 발생시키고 자원을 정리"""
+    thread, outcome = _run_in_thread(injector, MSLCompiler().compile(repeat(hold('W', 10), 200)))
+    time.sleep(0.2)
+    injector._process.kill()
+    thread.join(5.0)
+    
+    assert isinstance(outcome.get('error'), InjectorError)
+    assert not injector.is_alive
+    with pytest.raises(InjectorError):
+        injector.run(MSLCompiler().compile(key('W')))
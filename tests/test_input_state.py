@@ -0,0 +1,71 @@
+"""입력 상태 추적기 참조 카운트 테스트"""
+
+from tests.helpers import node, hold
+from msl_ast import ParallelNode
+from msl.msl_backend import RecordingBackend
+from msl.msl_input_state import InputStateTracker
+from msl.msl_interpreter import MSLInterpreter
+from msl.msl_program_cache import ProgramCache
+
+
+def test_nested_press_emits_only_outer_transitions():
+    """같은 키를 두 번 누르면 첫 누름과 마지막 뗌만 내보냄"""
+    tracker = InputStateTracker()
+    
+    assert tracker.press(1) is True
+    assert tracker.press(1) is False
+    assert tracker.release(1) is False
+    assert tracker.is_held(1)
+    assert tracker.release(1) is True
+    assert not tracker.is_held(1)
+    assert tracker.suppressed_downs == 1
+    assert tracker.suppressed_ups == 1
+
+
+def test_release_of_unpressed_key_is_suppressed():
+    """눌리지 않은 키의 뗌은 무시하고 생략 수에 포함"""
+    tracker = InputStateTracker()
+    
+    assert tracker.release(3) is False
+    assert tracker.suppressed == 1
+    assert tracker.held == []
+
+
+def test_release_all_returns_keys_in_reverse_press_order():
+    """남은 키를 누른 역순으로 꺼내고 상태를 비움"""
+    tracker = InputStateTracker()
+    for key_code in (2, 0, 5):
+        tracker.press(key_code)
+    tracker.press(0)
+    
+    assert tracker.held == [2, 0, 5]
+    assert tracker.release_all() == [5, 0, 2]
+    assert tracker.held == []
+    assert tracker.release(0) is False
+
+
+def test_to_dict_reports_counts():
+    tracker = InputStateTracker()
+    tracker.press(1)
+    tracker.press(1)
+    tracker.release(4)
+    
+    assert tracker.to_dict() == {
+        'held_keys': 1,
+        'suppressed_downs': 1,
+        'suppressed_ups': 1,
+        'suppressed_events': 2
+    }
+
+
+def test_overlapping_holds_send_one_down_and_one_up():
+    """A[80] | A[40]: 백엔드에는 한 번 누르고 더 긴 홀드가 끝날 때 한 번 뗌"""
+    backend = RecordingBackend()
+    interpreter = MSLInterpreter(backend=backend, program_cache=ProgramCache(), rate_limits={})
+    result = interpreter.execute(node(ParallelNode, children=[hold('A', 80), hold('A', 40)]))
+    
+    assert result.success
+    events = backend.relative_events()
+    assert [(event.action, event.args[0]) for event in events] == [('key_down', 'a'), ('key_up', 'a')]
+    assert events[1].timestamp_ns >= 70_000_000
+    assert result.performance_metrics['timing']['input_state']['suppressed_events'] == 2
@@ -0,0 +1,262 @@
+"""인터프리터 실행 타이밍과 키 해제 테스트 (RecordingBackend)"""
+
+import asyncio
+import threading
+
+import pytest
+
+from tests.helpers import node, key, hold, repeat
+from msl_ast import SequentialNode, ParallelNode, DelayNode
+from msl.msl_backend import RecordingBackend
+from msl.msl_interpreter import MSLInterpreter
+from msl.msl_program_cache import ProgramCache
+
+# 예정 시각 대비 허용 오차 (나노초): 시각은 첫 입력 기준이므로 첫 입력이 늦게 나가면
+# 이후 입력이 그만큼 일찍 나간 것처럼 보임
+EARLY_TOLERANCE_NS = 10_000_000
+LATE_TOLERANCE_NS = 30_000_000
+
+
+def _interpreter(**kwargs):
+    """기록 백엔드와 전용 캐시를 쓰는 인터프리터 (속도 제한 없음)"""
+    backend = RecordingBackend()
+    kwargs.setdefault('rate_limits', {})
+    interpreter = MSLInterpreter(backend=backend, program_cache=ProgramCache(), **kwargs)
+    return backend, interpreter
+
+
+def _timeline(backend):
+    """(상대 시각, 동작, 키) 목록"""
+    return [(event.timestamp_ns, event.action, event.args[0]) for event in backend.relative_events()]
+
+
+def _assert_at(actual_ns, expected_ms):
+    assert expected_ms * 1_000_000 - EARLY_TOLERANCE_NS <= actual_ns <= expected_ms * 1_000_000 + LATE_TOLERANCE_NS
+
+
+def _held_keys(backend):
+    """기록 끝에 눌린 채로 남은 키"""
+    held = set()
+    for _, action, name in _timeline(backend):
+        if action == 'key_down':
+            held.add(name)
+        elif action == 'key_up':
+            held.discard(name)
+    return held
+
+
+def test_hold_timing():
+    """W[100]: 누름 후 100ms 뒤에 뗌"""
+    backend, interpreter = _interpreter()
+    result = interpreter.execute(hold('W', 100))
+    
+    assert result.success
+    timeline = _timeline(backend)
+    assert [(action, name) for _, action, name in timeline] == [('key_down', 'w'), ('key_up', 'w')]
+    _assert_at(timeline[1][0], 100)
+
+
+def test_sequence_timing():
+    """W, (50), A[30]: 지연과 홀드가 순서대로 누적"""
+    backend, interpreter = _interpreter()
+    result = interpreter.execute(node(SequentialNode, children=[key('W'), DelayNode(50), hold('A', 30)]))
+    
+    assert result.success
+    assert result.executed_actions == 4
+    events = {(action, name): timestamp for timestamp, action, name in _timeline(backend)}
+    _assert_at(events[('key_up', 'w')], 0)
+    _assert_at(events[('key_down', 'a')], 50)
+    _assert_at(events[('key_up', 'a')], 80)
+
+
+def test_repeat_timing():
+    """A*3{50}: 반복 사이에만 50ms 간격"""
+    backend, interpreter = _interpreter()
+    result = interpreter.execute(repeat(key('A'), 3, 50))
+    
+    assert result.success
+    downs = [timestamp for timestamp, action, _ in _timeline(backend) if action == 'key_down']
+    assert len(downs) == 3
+    for index, timestamp in enumerate(downs):
+        _assert_at(timestamp, 50 * index)
+
+
+def test_parallel_timing():
+    """A[80] | B[40]: 두 분기가 같은 시각에 시작하고 각자의 홀드 시간 뒤에 뗌"""
+    backend, interpreter = _interpreter()
+    result = interpreter.execute(node(ParallelNode, children=[hold('A', 80), hold('B', 40)]))
+    
+    assert result.success
+    events = {(action, name): timestamp for timestamp, action, name in _timeline(backend)}
+    _assert_at(events[('key_down', 'a')], 0)
+    _assert_at(events[('key_down', 'b')], 0)
+    _assert_at(events[('key_up', 'b')], 40)
+    _assert_at(events[('key_up', 'a')], 80)
+    assert result.performance_metrics['scheduled_duration_us'] == 80_000
+
+
+def test_sequence_after_parallel_starts_after_longest_branch():
+    """(A[60] | B[20]), C: 병렬 노드 뒤의 동작은 가장 긴 분기가 끝난 뒤 실행"""
+    backend, interpreter = _interpreter()
+    parallel = node(ParallelNode, children=[hold('A', 60), hold('B', 20)])
+    result = interpreter.execute(node(SequentialNode, children=[parallel, key('C')]))
+    
+    assert result.success
+    events = {(action, name): timestamp for timestamp, action, name in _timeline(backend)}
+    _assert_at(events[('key_down', 'c')], 60)
+
+
+def test_stop_releases_held_keys():
+    """다른 스레드에서 중단하면 누르고 있던 키를 뗌"""
+    backend, interpreter = _interpreter()
+    timer = threading.Timer(0.05, interpreter.stop_execution)
+    timer.start()
+    try:
+        result = interpreter.execute(hold('W', 5000))
+    finally:
+        timer.cancel()
+    
+    assert result.performance_metrics['timing']['stopped']
+    assert result.execution_time < 1.0
+    assert _held_keys(backend) == set()
+    assert ('key_up', 'w') in [(action, name) for _, action, name in _timeline(backend)]
+    assert result.performance_metrics['timing']['stop_latency_us'] < 50_000
+    assert interpreter.last_stop_latency_ms is not None
+
+
+def test_timeout_releases_held_keys():
+    """최대 실행 시간을 넘기면 시간 초과 결과를 반환하고 키를 뗌"""
+    backend, interpreter = _interpreter(max_execution_time=0.05)
+    result = interpreter.execute(hold('W', 5000))
+    
+    assert not result.success
+    assert result.timed_out
+    assert result.execution_time < 1.0
+    assert _held_keys(backend) == set()
+
+
+class _TimeoutOnKeyUpBackend(RecordingBackend):
+    """키를 뗄 때 다른 스레드에서 감시 타이머 콜백을 실행하는 기록 백엔드 (시간 초과와 실행 완료가 겹치는 경우 재현용)"""
+    
+    def __init__(self):
+        super().__init__()
+        self.session = None
+    
+    def send_batch(self, inputs):
+        super().send_batch(inputs)
+        if inputs[-1][0] == 'key_up':
+            watchdog = threading.Thread(target=self.session._on_timeout)
+            watchdog.start()
+            watchdog.join()
+
+
+def test_timeout_at_completion_reports_success():
+    """마지막 입력과 함께 도착한 시간 초과는 모두 실행된 프로그램을 시간 초과로 보고하지 않음"""
+    backend = _TimeoutOnKeyUpBackend()
+    interpreter = MSLInterpreter(backend=backend, program_cache=ProgramCache(), rate_limits={})
+    session = interpreter.create_session(interpreter.compile(key('W')))
+    backend.session = session
+    
+    result = session.run()
+    
+    assert result.success
+    assert not result.timed_out
+    assert len(backend.events) == 2
+
+
+def test_timeout_after_completion_is_ignored():
+    """완료를 기록한 뒤 도착한 감시 타이머 콜백은 세션을 중단하지 않음"""
+    backend, interpreter = _interpreter()
+    session = interpreter.create_session(interpreter.compile(key('W')))
+    session._begin()
+    session._run_events()
+    
+    session._on_timeout()
+    
+    assert not session.timed_out
+    assert not session.stopped
+    session._end()
+
+
+class _StopOnInputBackend(RecordingBackend):
+    """입력을 내보낼 때마다 세션 중단을 요청하는 기록 백엔드 (중단과 실행 완료가 겹치는 경우 재현용)"""
+    
+    def __init__(self):
+        super().__init__()
+        self.session = None
+    
+    def send_batch(self, inputs):
+        super().send_batch(inputs)
+        self.session.stop()
+
+
+def test_async_execution_timing():
+    """비동기 실행도 같은 일정으로 입력을 내보냄"""
+    backend, interpreter = _interpreter()
+    result = asyncio.run(interpreter.execute_async(hold('W', 60)))
+    
+    assert result.success
+    _assert_at(_timeline(backend)[1][0], 60)
+
+
+def test_async_sessions_run_concurrently():
+    """같은 이벤트 루프에서 여러 세션이 서로를 막지 않고 동시에 실행"""
+    backend, interpreter = _interpreter()
+    
+    async def scenario():
+        started = asyncio.get_running_loop().time()
+        results = await asyncio.gather(interpreter.execute_async(hold('A', 100)),
+                                       interpreter.execute_async(hold('B', 100)))
+        return results, asyncio.get_running_loop().time() - started
+    
+    results, elapsed = asyncio.run(scenario())
+    assert all(result.success for result in results)
+    assert elapsed < 0.18
+    assert len(backend.events) == 4
+
+
+def test_stop_from_thread_cancels_async_run():
+    """다른 스레드의 stop_execution()은 비동기 실행을 취소하고 키를 뗌"""
+    backend, interpreter = _interpreter()
+    
+    async def scenario():
+        threading.Timer(0.05, interpreter.stop_execution).start()
+        await interpreter.execute_async(hold('W', 5000))
+    
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(scenario())
+    assert _held_keys(backend) == set()
+    assert not interpreter.is_running
+
+
+def test_stop_at_completion_does_not_cancel_caller():
+    """실행이 끝나는 시점에 도착한 중단은 호출자의 다음 await를 취소하지 않음"""
+    backend = _StopOnInputBackend()
+    interpreter = MSLInterpreter(backend=backend, program_cache=ProgramCache(), rate_limits={})
+    session = interpreter.create_session(interpreter.compile(key('W')))
+    backend.session = session
+    
+    async def scenario():
+        result = await session.run_async()
+        await asyncio.sleep(0.02)  # 늦게 도착한 취소가 있으면 여기서 CancelledError
+        return result
+    
+    result = asyncio.run(scenario())
+    assert result.success
+    assert len(backend.events) == 2
+
+
+def test_async_cancel_releases_held_keys():
+    """비동기 실행 태스크를 취소하면 키를 뗀 뒤 CancelledError를 전파"""
+    backend, interpreter = _interpreter()
+    
+    async def run_and_cancel():
+        task = asyncio.ensure_future(interpreter.execute_async(hold('W', 5000)))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await task
+    
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(run_and_cancel())
+    assert _held_keys(backend) == set()
+    assert len(backend.events) == 2
@@ -0,0 +1,70 @@
+"""스레드별 샤드 메트릭 테스트"""
+
+import threading
+
+from msl.msl_metrics import ExecutionMetrics, Histogram
+
+
+def test_snapshot_merges_thread_shards():
+    """여러 스레드의 기록을 읽을 때 병합"""
+    metrics = ExecutionMetrics()
+    barrier = threading.Barrier(4)
+    
+    def record():
+        barrier.wait()
+        for value in range(100):
+            metrics.increment('events')
+            metrics.observe('latency_us', value)
+    
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert metrics.counter('events') == 400
+    assert metrics.histogram('latency_us').count == 400
+
+
+def test_exited_thread_shards_are_retired():
+    """종료된 스레드의 샤드는 은퇴 샤드에 합쳐지고 값은 유지"""
+    metrics = ExecutionMetrics()
+    
+    for _ in range(50):
+        thread = threading.Thread(target=metrics.increment, args=('events',))
+        thread.start()
+        thread.join()
+    metrics.increment('events')
+    
+    assert metrics.counter('events') == 51
+    assert metrics.shard_count == 1
+
+
+def test_reset_clears_retired_values():
+    """reset()은 은퇴 샤드의 값도 지움"""
+    metrics = ExecutionMetrics()
+    thread = threading.Thread(target=metrics.increment, args=('events',))
+    thread.start()
+    thread.join()
+    assert metrics.counter('events') == 1
+    
+    metrics.reset()
+    assert metrics.counter('events') == 0
+
+
+def test_histogram_percentiles_and_merge():
+    """히스토그램 병합은 개수, 합계, 최솟값/최댓값을 모두 합침"""
+    first = Histogram()
+    second = Histogram()
+    for value in (10, 20, 30):
+        first.record(value)
+    second.record(1000)
+    
+    merged = first.copy()
+    merged.merge(second)
+    
+    assert merged.count == 4
+    assert merged.total == 1060
+    assert merged.min == 10 and merged.max == 1000
+    assert first.count == 3
+    assert merged.percentile(50) <= merged.percentile(99)
@@ -0,0 +1,47 @@
+"""마우스 이동 경로 계산 테스트"""
+
+import pytest
+
+from msl.msl_motion import compute_path, MotionError, MOTION_CURVES, _compute_path_python
+
+CASES = [
+    ((0, 0), (300, 120), 250_000, 10_000),
+    ((500, 500), (480, 510), 1_000_000, 10_000),
+    ((10, -20), (-400, 90), 95_000, 7_000),
+    ((0, 0), (3, 0), 1_000_000, 10_000),
+]
+
+
+@pytest.mark.parametrize('curve', MOTION_CURVES)
+@pytest.mark.parametrize('start, end, duration_us, tick_us', CASES)
+def test_numpy_and_python_paths_are_identical(curve, start, end, duration_us, tick_us):
+    """NumPy 경로와 순수 Python 경로는 같은 샘플을 만듦"""
+    np = pytest.importorskip('numpy')
+    from msl.msl_motion import _compute_path_numpy
+    
+    vectorized = _compute_path_numpy(start, end, duration_us, curve, tick_us)
+    
+    assert isinstance(vectorized, np.ndarray)
+    assert [tuple(int(value) for value in sample) for sample in vectorized] == \
+        _compute_path_python(start, end, duration_us, curve, tick_us)
+
+
+@pytest.mark.parametrize('curve', MOTION_CURVES)
+def test_path_ends_at_target_without_repeated_points(curve):
+    samples = [tuple(int(value) for value in sample) for sample in compute_path((0, 0), (3, 0), 1_000_000, curve)]
+    
+    assert samples[-1] == (1_000_000, 3, 0)
+    points = [sample[1:] for sample in samples[:-1]]
+    assert len(points) == len(set(points))
+    assert [sample[0] for sample in samples] == sorted(sample[0] for sample in samples)
+
+
+def test_zero_duration_jumps_to_target():
+    assert compute_path((0, 0), (7, 8), 0) == [(0, 7, 8)]
+
+
+def test_rejects_unknown_curve_and_non_positive_tick():
+    with pytest.raises(MotionError):
+        compute_path((0, 0), (1, 1), 1000, curve='spiral')
+    with pytest.raises(MotionError):
+        compute_path((0, 0), (1, 1), 1000, tick_us=0)
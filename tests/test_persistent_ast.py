@@ -0,0 +1,66 @@
+"""불변 AST (freeze/thaw) 테스트"""
+
+import pytest
+
+from tests.helpers import node, key, hold, repeat
+from msl_ast import SequentialNode, ParallelNode, PersistentNode, freeze, thaw
+
+
+def _sample_tree():
+    """W[100], (A,B)*3{50} | S 형태의 트리"""
+    branch = repeat(node(SequentialNode, children=[key('A'), key('B')]), 3, 50)
+    return node(SequentialNode, children=[
+        hold('W', 100),
+        node(ParallelNode, children=[branch, key('S')]),
+    ])
+
+
+def _shape(tree):
+    """비교용 트리 표현 (클래스, 고유 속성, 자식)"""
+    attrs = {name: value for name, value in vars(tree).items()
+             if name not in ('children', 'parent', 'position', 'node_type')}
+    return type(tree), attrs, [_shape(child) for child in tree.children]
+
+
+def test_freeze_thaw_round_trip():
+    """freeze -> thaw -> freeze는 원본과 구조적으로 같음"""
+    tree = _sample_tree()
+    frozen = freeze(tree)
+    thawed = thaw(frozen)
+    
+    assert _shape(thawed) == _shape(tree)
+    assert freeze(thawed) == frozen
+    assert hash(freeze(thawed)) == hash(frozen)
+
+
+def test_thaw_restores_parent_pointers():
+    """복원된 트리는 부모 포인터를 가지며 원본과 노드를 공유하지 않음"""
+    tree = _sample_tree()
+    thawed = thaw(freeze(tree))
+    
+    assert thawed.parent is None
+    for child in thawed.children:
+        assert child.parent is thawed
+    assert thawed.children[0] is not tree.children[0]
+
+
+def test_frozen_node_is_immutable():
+    """불변 노드는 속성을 바꿀 수 없음"""
+    frozen = freeze(key('W'))
+    
+    assert isinstance(frozen, PersistentNode)
+    assert frozen.key_name == 'W'
+    with pytest.raises(AttributeError):
+        frozen.key_name = 'A'
+
+
+def test_replace_at_shares_untouched_subtrees():
+    """경로 복사는 바뀐 경로 밖의 서브트리를 공유"""
+    frozen = freeze(_sample_tree())
+    replaced = frozen.replace_at((1, 1), freeze(key('D')))
+    
+    assert replaced.node_at((1, 1)).key_name == 'D'
+    assert frozen.node_at((1, 1)).key_name == 'S'
+    assert replaced.children[0] is frozen.children[0]
+    assert replaced.node_at((1, 0)) is frozen.node_at((1, 0))
+
@@ -0,0 +1,70 @@
+"""컴파일 프로그램 LRU 캐시 테스트"""
+
+from tests.helpers import key, repeat
+from msl.msl_compiler import MSLCompiler
+from msl.msl_program_cache import ProgramCache, make_key, estimate_program_size
+
+
+def _program(name='W', count=1):
+    return MSLCompiler().compile(repeat(key(name), count) if count > 1 else key(name))
+
+
+def test_evicts_least_recently_used_entry():
+    """항목 수 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거"""
+    cache = ProgramCache(max_entries=2)
+    cache.put(make_key('A'), _program('A'))
+    cache.put(make_key('B'), _program('B'))
+    assert cache.get(make_key('A')) is not None
+    
+    cache.put(make_key('C'), _program('C'))
+    
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get(make_key('B')) is None
+    assert cache.get(make_key('A')) is not None
+    assert cache.get(make_key('C')) is not None
+
+
+def test_evicts_by_estimated_size():
+    """크기 합계가 한도를 넘으면 오래된 항목을 제거하고 크기 합계를 갱신"""
+    program = _program()
+    size = estimate_program_size(program)
+    cache = ProgramCache(max_entries=100, max_bytes=size * 2)
+    for name in ('A', 'B', 'C'):
+        cache.put(make_key(name), program)
+    
+    assert len(cache) == 2
+    assert cache.total_bytes == size * 2
+    assert cache.get(make_key('A')) is None
+
+
+def test_oversized_program_is_not_stored():
+    """크기 한도보다 큰 프로그램은 보관하지 않음"""
+    cache = ProgramCache(max_bytes=1)
+    cache.put(make_key('W'), _program())
+    
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
+
+
+def test_repeat_size_does_not_grow_with_count():
+    """반복 프로그램의 추정 크기는 반복 횟수와 무관 (본문만 보관)"""
+    assert estimate_program_size(_program(count=10)) == estimate_program_size(_program(count=100000))
+
+
+def test_replacing_key_keeps_size_consistent():
+    """같은 키로 다시 넣으면 이전 크기를 빼고 새 크기를 더함"""
+    program = _program()
+    cache = ProgramCache()
+    cache.put(make_key('W'), program)
+    cache.put(make_key('W'), program)
+    
+    assert len(cache) == 1
+    assert cache.total_bytes == estimate_program_size(program)
+    assert cache.evictions == 0
+
+
+def test_normalized_scripts_share_key():
+    """공백과 줄 끝 형식만 다른 스크립트는 같은 키"""
+    assert make_key('W ,  A\r\n') == make_key('W , A')
+    assert make_key('W', {'x': 1}) != make_key('W', {'x': 2})
@@ -0,0 +1,71 @@
+"""토큰 버킷 속도 제한 테스트"""
+
+from tests.helpers import repeat, key
+from msl.msl_compiler import MSLCompiler, ProgramEvent, EventOp
+from msl.msl_rate_limit import RateLimit, RateShaper, estimate_stretch_us
+
+KEYBOARD = {'keyboard': RateLimit(events_per_sec=1000, burst=100)}
+
+
+def _key_events(count, offset_us=0):
+    return [ProgramEvent(offset_us, EventOp.KEY_DOWN, 0) for _ in range(count)]
+
+
+def test_events_within_limit_keep_schedule():
+    """한도 안의 이벤트는 원래 시각 그대로"""
+    shaper = RateShaper(KEYBOARD)
+    events = [ProgramEvent(index * 1000, EventOp.KEY_DOWN, 0) for index in range(500)]
+    
+    assert list(shaper.shape(events)) == events
+    assert shaper.delayed_events == 0
+    assert shaper.stretch_us == 0
+
+
+def test_burst_then_paced_at_rate():
+    """버스트만큼은 바로 나가고 나머지는 1/rate 간격으로 미뤄짐"""
+    shaper = RateShaper(KEYBOARD)
+    shaped = [event.offset_us for event in shaper.shape(_key_events(300))]
+    
+    assert shaped[:100] == [0] * 100
+    assert shaped[100:] == [1000 * index for index in range(1, 201)]
+    assert shaper.delayed_events == 200
+    assert shaper.stretch_us == 200_000
+    assert shaper.max_delay_us == 200_000
+
+
+def test_bucket_refills_while_idle():
+    """쉬는 동안 토큰이 다시 차서 다음 버스트는 미뤄지지 않음"""
+    shaper = RateShaper(KEYBOARD)
+    events = _key_events(100) + _key_events(100, offset_us=100_000)
+    
+    assert list(shaper.shape(events)) == events
+
+
+def test_order_is_preserved_across_devices():
+    """미뤄진 이벤트 뒤의 다른 장치 이벤트도 순서를 지키기 위해 함께 밀림"""
+    shaper = RateShaper(KEYBOARD)
+    events = _key_events(101) + [ProgramEvent(0, EventOp.MOUSE_MOVE, 10, 20)]
+    shaped = list(shaper.shape(events))
+    
+    assert shaped[100].offset_us == 1000
+    assert shaped[101].op == EventOp.MOUSE_MOVE
+    assert shaped[101].offset_us == 1000
+
+
+def test_unlimited_device_passes_through():
+    """한도가 없는 장치는 제한하지 않음"""
+    shaper = RateShaper({'keyboard': None})
+    events = _key_events(1000)
+    
+    assert list(shaper.shape(events)) == events
+
+
+def test_estimate_matches_shaper_for_front_loaded_repeat():
+    """간격 없는 반복은 펼치지 않고 추정한 늘어난 시간이 실제 조정 결과와 같음"""
+    program = MSLCompiler().compile(repeat(key('W'), 1000))
+    shaper = RateShaper(KEYBOARD)
+    for _ in shaper.shape(program.events):
+        pass
+    
+    estimate = estimate_stretch_us(KEYBOARD, program.events.op_counts(), program.duration_us)
+    assert estimate == shaper.stretch_us == 1_900_000
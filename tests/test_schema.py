@@ -0,0 +1,87 @@
+"""도구 입력 스키마 검사와 인자 검증 테스트"""
+
+import importlib
+
+import pytest
+
+from tools.schema import SchemaError, check_schema, compile_validator
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "script": {"type": "string"},
+        "level": {"type": "string", "enum": ["basic", "standard"], "default": "basic"},
+        "count": {"type": "integer", "minimum": 1, "maximum": 10, "default": 3},
+        "strict": {"type": "boolean", "default": False},
+    },
+    "required": ["script"],
+}
+
+
+@pytest.fixture
+def validate():
+    check_schema(SCHEMA)
+    return compile_validator(SCHEMA)
+
+
+def test_valid_arguments_pass(validate):
+    assert validate({"script": "W", "level": "standard", "count": 10, "strict": True}) == []
+    assert validate({"script": "W", "extra": object()}) == []
+
+
+def test_rejects_missing_required_and_non_object(validate):
+    assert validate({}) == ["필수 인자 'script'이(가) 없습니다"]
+    assert validate(["W"]) == ["인자는 객체여야 합니다"]
+
+
+def test_rejects_wrong_type(validate):
+    assert validate({"script": 1}) == ["'script'은(는) string 타입이어야 합니다"]
+    # bool은 integer로 취급하지 않음
+    assert validate({"script": "W", "count": True}) == ["'count'은(는) integer 타입이어야 합니다"]
+
+
+def test_rejects_value_outside_enum(validate):
+    assert validate({"script": "W", "level": "aggressive"}) == ["'level'은(는) basic, standard 중 하나여야 합니다"]
+
+
+def test_rejects_value_outside_bounds(validate):
+    assert validate({"script": "W", "count": 0}) == ["'count'은(는) 1 이상이어야 합니다"]
+    assert validate({"script": "W", "count": 11}) == ["'count'은(는) 10 이하여야 합니다"]
+
+
+@pytest.mark.parametrize("prop", [
+    {"type": "string", "enum": ["a", "b"], "default": "c"},
+    {"type": "integer", "minimum": 1, "default": 0},
+    {"type": "boolean", "default": "false"},
+])
+def test_bad_default_is_schema_error(prop):
+    with pytest.raises(SchemaError, match="기본값 오류"):
+        check_schema({"type": "object", "properties": {"value": prop}})
+
+
+@pytest.mark.parametrize("schema", [
+    {"type": "object", "properties": {"script": {"type": "string"}}, "required": ["scirpt"]},
+    {"type": "object", "properties": {"value": {"type": "str"}}},
+    {"type": "object", "properties": {"value": {"type": "string", "minimum": 1}}},
+    {"type": "array"},
+])
+def test_invalid_schema_is_schema_error(schema):
+    with pytest.raises(SchemaError):
+        check_schema(schema)
+
+
+def test_catalogue_matches_tool_definitions():
+    """카탈로그는 각 도구 클래스의 TOOL_DEFINITION을 등록 순서대로 그대로 제공"""
+    pytest.importorskip("mcp")
+    from tools.registry import ToolRegistry, TOOL_SPECS
+    
+    registry = ToolRegistry()
+    catalogue = registry.catalogue()
+    
+    assert [tool.name for tool in catalogue] == [spec.name for spec in TOOL_SPECS]
+    for tool, spec in zip(catalogue, TOOL_SPECS):
+        definition = getattr(importlib.import_module(spec.module), spec.class_name).TOOL_DEFINITION
+        assert tool.description == definition["description"]
+        assert tool.inputSchema == definition["inputSchema"]
+        assert not registry.is_loaded(spec.name)
+    assert registry.catalogue() == catalogue
@@ -0,0 +1,83 @@
+"""한 엔진에서 여러 세션을 동시에 실행하는 테스트"""
+
+import threading
+import time
+
+import pytest
+
+from tests.helpers import key, hold
+from msl.msl_backend import RecordingBackend
+from msl.msl_interpreter import MSLInterpreter, ExecutionError
+from msl.msl_program_cache import ProgramCache
+
+
+def _interpreter():
+    backend = RecordingBackend()
+    return backend, MSLInterpreter(backend=backend, program_cache=ProgramCache(), rate_limits={})
+
+
+def _wait_for_sessions(interpreter, count, timeout=1.0):
+    """진행 중인 세션이 count개가 될 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    while len(interpreter.sessions) < count:
+        assert time.monotonic() < deadline, "세션이 시작되지 않았습니다"
+        time.sleep(0.001)
+
+
+def test_concurrent_sessions_have_isolated_results():
+    """스레드마다 실행한 세션은 서로의 결과와 카운터를 건드리지 않음"""
+    backend, interpreter = _interpreter()
+    results = {}
+    
+    def run(name, hold_ms):
+        results[name] = interpreter.execute(hold(name, hold_ms))
+    
+    threads = [threading.Thread(target=run, args=(name, 50)) for name in ('A', 'B', 'C')]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert time.monotonic() - started < 0.14
+    assert all(result.success and result.executed_actions == 2 for result in results.values())
+    ids = {result.performance_metrics['execution_id'] for result in results.values()}
+    assert len(ids) == 3
+    assert interpreter.get_statistics()['total_executions'] == 3
+    assert not interpreter.is_running
+
+
+def test_stop_targets_one_session():
+    """세션 ID를 지정한 중단은 그 세션만 멈춤"""
+    backend, interpreter = _interpreter()
+    results = {}
+    
+    def run(name, hold_ms):
+        results[name] = interpreter.execute(hold(name, hold_ms))
+    
+    long_run = threading.Thread(target=run, args=('A', 5000))
+    long_run.start()
+    _wait_for_sessions(interpreter, 1)
+    (target,) = interpreter.sessions
+    
+    short_run = threading.Thread(target=run, args=('B', 100))
+    short_run.start()
+    _wait_for_sessions(interpreter, 2)
+    interpreter.stop_execution(target)
+    long_run.join(timeout=1.0)
+    short_run.join(timeout=1.0)
+    
+    assert results['A'].performance_metrics['timing'].get('stopped')
+    assert results['A'].execution_time < 1.0
+    assert not results['B'].performance_metrics['timing'].get('stopped')
+    assert results['B'].execution_time >= 0.09
+
+
+def test_session_runs_only_once():
+    """세션은 한 번만 실행 가능"""
+    _, interpreter = _interpreter()
+    session = interpreter.create_session(interpreter.compile(key('W')))
+    assert session.run().success
+    
+    with pytest.raises(ExecutionError):
+        session.run()
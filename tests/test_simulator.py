@@ -0,0 +1,86 @@
+"""가상 시계 시뮬레이터와 실행 시간 추정 테스트"""
+
+import time
+
+import pytest
+
+from tests.helpers import node, key, hold, repeat
+from msl_ast import SequentialNode, ParallelNode, DelayNode, ContinuousNode, MouseCoordNode
+from msl.msl_simulator import MSLSimulator
+from msl.msl_cancel import CancellationToken, DeadlineExceeded, cancellation_scope
+
+# 추정과 시뮬레이션을 비교할 AST (이벤트가 앞쪽에 몰려 속도 제한에 걸리는 반복 포함)
+CASES = {
+    'hold': lambda: hold('W', 100),
+    'sequence': lambda: node(SequentialNode, children=[key('W'), DelayNode(50), hold('A', 30)]),
+    'repeat': lambda: repeat(hold('A', 5), 20, 10),
+    'parallel': lambda: node(ParallelNode, children=[hold('A', 80), repeat(key('B'), 5, 10)]),
+    'continuous': lambda: node(ContinuousNode, 20, children=[key('Space')]),
+    'burst': lambda: repeat(key('W'), 1000),
+    'mouse': lambda: repeat(node(SequentialNode, children=[MouseCoordNode(0, 0), MouseCoordNode(10, 10)]), 300),
+}
+
+
+@pytest.mark.parametrize('name', sorted(CASES))
+def test_estimate_matches_simulation(name):
+    """이벤트를 펼치지 않은 추정이 가상 시계 재생 결과와 같음"""
+    simulator = MSLSimulator()
+    ast = CASES[name]()
+    simulated = simulator.simulate(ast)
+    estimated = simulator.estimate(ast)
+    
+    assert estimated.duration_us == simulated.duration_us
+    assert estimated.stretch_us == simulated.stretch_us
+    assert estimated.event_count == simulated.event_count
+
+
+def test_burst_is_stretched_by_rate_limit():
+    """간격 없는 반복은 키보드 한도(초당 1000, 버스트 100)만큼 늘어남"""
+    estimate = MSLSimulator().estimate(repeat(key('W'), 1000))
+    
+    assert estimate.stretch_us == 1_900_000
+    assert estimate.action_count == 2000
+    assert MSLSimulator(rate_limits={}).estimate(repeat(key('W'), 1000)).stretch_us == 0
+
+
+def test_simulation_timeline():
+    """W[100], A: 타임라인에 입력과 가상 시각이 기록됨"""
+    result = MSLSimulator().simulate(node(SequentialNode, children=[hold('W', 100), key('A')]))
+    
+    assert [(entry.time_us, entry.action, entry.args) for entry in result.timeline] == [
+        (0, 'key_down', ('w',)),
+        (100_000, 'key_up', ('w',)),
+        (100_000, 'key_down', ('a',)),
+        (100_000, 'key_up', ('a',)),
+    ]
+    assert result.duration_ms == 100.0
+    assert result.key_press_count == 2
+
+
+def test_estimate_does_not_expand_large_repeats():
+    """추정 비용은 반복 횟수와 무관"""
+    started = time.perf_counter()
+    estimate = MSLSimulator().estimate(repeat(key('W'), 10_000_000))
+    
+    assert time.perf_counter() - started < 0.5
+    assert estimate.event_count == 20_000_000
+
+
+def test_simulation_stops_at_deadline():
+    """시뮬레이션은 요청 마감이 지나면 DeadlineExceeded로 중단"""
+    simulator = MSLSimulator()
+    ast = repeat(key('W'), 10_000_000)
+    
+    started = time.monotonic()
+    with cancellation_scope(CancellationToken(0.05)):
+        with pytest.raises(DeadlineExceeded):
+            simulator.simulate(ast)
+    assert time.monotonic() - started < 2.0
+
+
+def test_simulation_with_expired_token_raises_immediately():
+    """이미 마감된 토큰이면 첫 이벤트 전에 중단"""
+    expired = CancellationToken(0)
+    with cancellation_scope(expired):
+        with pytest.raises(DeadlineExceeded):
+            MSLSimulator().simulate(key('W'))
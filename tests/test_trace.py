@@ -0,0 +1,47 @@
+"""실행 추적 기록/읽기 왕복 테스트"""
+
+from msl.msl_compiler import EventOp
+from msl.msl_trace import TraceRecorder, TraceReader
+
+
+def _record(recorder, values):
+    for value in values:
+        recorder.record(value, EventOp.KEY_DOWN, value % 3, value, -value, value - 1)
+
+
+def test_file_round_trip_preserves_records_and_metadata(tmp_path):
+    path = str(tmp_path / 'run.msltrace')
+    recorder = TraceRecorder(path, capacity=4, key_names=('a', 'b', 'c'), metadata={'session_id': 's1'})
+    _record(recorder, range(10))
+    recorder.close()
+    
+    with TraceReader(path) as reader:
+        assert len(reader) == 10
+        assert reader.key_names == ['a', 'b', 'c']
+        assert reader.metadata['session_id'] == 's1'
+        assert [record.timestamp_ns for record in reader] == list(range(10))
+        assert reader[-1] == (9, 8, 9, -9, 0, EventOp.KEY_DOWN)
+        assert reader[3].lateness_ns == 1
+
+
+def test_flush_before_wrap_does_not_duplicate_records(tmp_path):
+    """capacity=4에서 2개 기록 후 flush하고 4개 더 기록해도 같은 레코드를 두 번 쓰지 않음"""
+    path = str(tmp_path / 'run.msltrace')
+    recorder = TraceRecorder(path, capacity=4)
+    _record(recorder, range(2))
+    recorder.flush()
+    _record(recorder, range(2, 6))
+    recorder.flush()
+    _record(recorder, range(6, 9))
+    recorder.close()
+    
+    with TraceReader(path) as reader:
+        assert [record.timestamp_ns for record in reader] == list(range(9))
+
+
+def test_memory_only_recorder_keeps_latest_capacity_records():
+    recorder = TraceRecorder(capacity=4)
+    _record(recorder, range(10))
+    
+    assert recorder.count == 10
+    assert [record.timestamp_ns for record in recorder.records()] == [6, 7, 8, 9]
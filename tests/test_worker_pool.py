@@ -0,0 +1,119 @@
+"""도구 작업자 풀 테스트 (비용 추정, 작업자 실행 여부, 비정상 종료 후 재시도)"""
+
+import asyncio
+import time
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+pytest.importorskip("mcp")
+
+from tools.worker_pool import WorkerPool, WorkerCrashError, estimate_script_cost, _CONTINUOUS_MAX_COUNT
+
+
+class _FakeRegistry:
+    """이벤트 루프에서 바로 실행한 호출을 기록하는 레지스트리"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def get(self, name):
+        registry = self
+        
+        class Tool:
+            async def execute(self, arguments):
+                registry.calls.append(name)
+                return ["inline"]
+        
+        return Tool()
+
+
+class _FakeExecutor(Executor):
+    """작업자 비정상 종료 또는 결과를 바로 돌려주는 실행기"""
+    
+    def __init__(self, crash):
+        self.crash = crash
+    
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        if self.crash:
+            future.set_exception(BrokenProcessPool("작업자 종료"))
+        else:
+            future.set_result(("worker",))
+        return future
+
+
+def _pool(executors):
+    """주어진 실행기를 차례로 사용하는 작업자 풀 (풀을 다시 만들 때마다 다음 실행기)"""
+    pool = WorkerPool(_FakeRegistry(), ("parse_msl",), inline_max_cost=100)
+    executors = iter(executors)
+    
+    def get_executor():
+        if pool._executor is None:
+            pool._executor = next(executors)
+        return pool._executor
+    
+    pool._get_executor = get_executor
+    return pool
+
+
+def test_cost_multiplies_repeats_and_continuous():
+    assert estimate_script_cost("W") == 1
+    assert estimate_script_cost("W*10, A*3") == 9 * 10 * 3
+    assert estimate_script_cost("W*0") == 3
+    assert estimate_script_cost("&W") == 2 * _CONTINUOUS_MAX_COUNT
+
+
+def test_cost_of_huge_counts_is_capped_and_fast():
+    """자릿수가 아주 많은 반복 횟수도 정수 변환 오류 없이 빠르게 추정"""
+    script = "W*" + "9" * 5000
+    assert estimate_script_cost(script) == len(script) * 10 ** 7
+    
+    script = ", ".join(["W*9999999"] * 2000 + ["&A"] * 2000)
+    started = time.perf_counter()
+    assert estimate_script_cost(script, limit=100) > 100
+    assert time.perf_counter() - started < 0.05
+
+
+def test_offload_decision():
+    """작업자 도구의 비용이 큰 스크립트만 작업자에서 실행"""
+    pool = _pool([])
+    
+    assert not pool.should_offload("parse_msl", {"script": "W, A"})
+    assert pool.should_offload("parse_msl", {"script": "W*1000"})
+    assert pool.should_offload("parse_msl", {"script": "&W"})
+    assert not pool.should_offload("msl_examples", {"script": "W*1000"})
+    assert not pool.should_offload("parse_msl", {"script": None})
+
+
+def test_small_script_runs_inline():
+    pool = _pool([])
+    
+    assert asyncio.run(pool.run("parse_msl", {"script": "W"})) == ["inline"]
+    assert pool.registry.calls == ["parse_msl"]
+    assert pool.get_statistics()["inline"] == 1
+
+
+def test_crashed_pool_is_recreated_and_retried_once():
+    """작업자가 비정상 종료되면 새 풀에서 한 번 더 시도"""
+    pool = _pool([_FakeExecutor(crash=True), _FakeExecutor(crash=False)])
+    
+    result = asyncio.run(pool.run("parse_msl", {"script": "W*1000"}))
+    
+    assert [content.text for content in result] == ["worker"]
+    stats = pool.get_statistics()
+    assert stats["crashes"] == 1
+    assert stats["offloaded"] == 1
+    assert pool.registry.calls == []
+
+
+def test_second_crash_raises_without_running_inline():
+    """다시 만든 풀의 작업자도 종료되면 서버 프로세스에서 실행하지 않고 오류"""
+    pool = _pool([_FakeExecutor(crash=True), _FakeExecutor(crash=True)])
+    
+    with pytest.raises(WorkerCrashError):
+        asyncio.run(pool.run("parse_msl", {"script": "W*1000"}))
+    
+    assert pool.get_statistics()["crashes"] == 2
+    assert pool.registry.calls == []
@@ -10,20 +10,29 @@ MSL MCP 서버 도구 패키지
 - optimize_tool: MSL 스크립트 최적화
 - explain_tool: MSL 구문 설명 및 도움말
 - examples_tool: MSL 예제 제공
+- registry: 도구를 처음 호출할 때 생성하는 지연 도구 레지스트리
+- dispatch: 도구별 동시 실행 한도와 대기열을 적용하는 호출 디스패처
+- worker_pool: CPU 작업 도구를 실행하는 예열된 작업자 프로세스 풀
 """
 
-from .parse_tool import ParseTool
-from .generate_tool import GenerateTool
-from .validate_tool import ValidateTool
-from .optimize_tool import OptimizeTool
-from .explain_tool import ExplainTool
-from .examples_tool import ExamplesTool
+import importlib
 
-__all__ = [
-    'ParseTool',
-    'GenerateTool', 
-    'ValidateTool',
-    'OptimizeTool',
-    'ExplainTool',
-    'ExamplesTool'
-] 
\ No newline at end of file
+# 클래스 이름 -> 구현 모듈 (처음 접근할 때 임포트)
+_EXPORTS = {
+    'ParseTool': '.parse_tool',
+    'GenerateTool': '.generate_tool',
+    'ValidateTool': '.validate_tool',
+    'OptimizeTool': '.optimize_tool',
+    'ExplainTool': '.explain_tool',
+    'ExamplesTool': '.examples_tool',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """도구 클래스를 처음 접근할 때 해당 모듈만 임포트합니다 (패키지 임포트 시 무거운 의존성 로드 방지)."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
@@ -0,0 +1,190 @@
+"""
+MSL 도구 호출 디스패처
+
+도구마다 독립된 동시 실행 한도(asyncio.Semaphore)와 크기가 제한된 대기열을 두고 호출을 분배합니다.
+
+- 도구별 한도이므로 값싼 결정적 도구(parse_msl 등)는 AI 도구(generate_msl) 뒤에 줄 서지 않음
+- AI 도구는 OpenAI 할당량을 지키기 위해 더 작은 한도와 대기열을 사용
+- 실행 슬롯과 대기열이 모두 찬 도구의 호출은 기다리지 않고 즉시 ToolBusyError로 거절
+- 작업자 풀이 있으면 CPU 도구의 큰 요청은 작업자 프로세스에서 실행 (이벤트 루프를 막지 않음)
+- 호출마다 마감 시각(대기 시간 포함)을 두고 취소 토큰으로 도구 내부 루프, 작업자, OpenAI 요청까지 전달
+  마감을 넘긴 호출은 ToolTimeoutError로 끝나며 도구별 timed_out으로 집계
+"""
+
+import asyncio
+from typing import Dict, Any, List, Optional
+
+from msl.msl_cancel import CancellationToken, DeadlineExceeded, cancellation_scope
+
+from .registry import ToolRegistry
+from .worker_pool import WorkerPool
+
+
+# 기본 한도 (설정을 불러올 수 없을 때 사용)
+DEFAULT_MAX_CONCURRENT = 10
+DEFAULT_MAX_QUEUED = 50
+DEFAULT_AI_MAX_CONCURRENT = 2
+DEFAULT_AI_MAX_QUEUED = 4
+# 기본 마감 시간 (초): 모든 요청 / CPU 도구의 스크립트 처리
+DEFAULT_REQUEST_TIMEOUT = 60
+DEFAULT_SCRIPT_TIMEOUT = 30
+
+
+class ToolBusyError(Exception):
+    """도구의 실행 슬롯과 대기열이 모두 찬 경우"""
+    pass
+
+
+class ToolTimeoutError(Exception):
+    """도구 호출이 마감 시간을 초과한 경우"""
+    pass
+
+
+class ToolLimiter:
+    """도구 하나의 동시 실행 한도와 대기열 (async with로 사용)"""
+    
+    def __init__(self, name: str, max_concurrent: int, max_queued: int):
+        """
+        Tool Limiter 초기화
+        
+        Args:
+            name (str): 도구 이름
+            max_concurrent (int): 동시에 실행할 수 있는 호출 수
+            max_queued (int): 실행 슬롯을 기다릴 수 있는 호출 수 (0이면 대기 없이 거절)
+        """
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queued = max(0, max_queued)
+        self.active = 0
+        self.waiting = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+    
+    async def __aenter__(self):
+        if self._semaphore.locked() and self.waiting >= self.max_queued:
+            self.rejected += 1
+            raise ToolBusyError(
+                f"{self.name} 요청이 너무 많습니다 (실행 중 {self.active}, 대기 {self.waiting}). "
+                f"잠시 후 다시 시도하세요.")
+        
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.active += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self.active -= 1
+        self.completed += 1
+        self._semaphore.release()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """보고용 딕셔너리"""
+        return {
+            'max_concurrent': self.max_concurrent,
+            'max_queued': self.max_queued,
+            'active': self.active,
+            'waiting': self.waiting,
+            'completed': self.completed,
+            'rejected': self.rejected,
+            'timed_out': self.timed_out
+        }
+
+
+class ToolDispatcher:
+    """
+    도구 호출 디스패처
+    
+    레지스트리의 도구마다 ToolLimiter를 만들고, 호출을 해당 도구의 한도 안에서 실행합니다.
+    AI 도구(ToolSpec.ai_backed)는 AI 한도를, 나머지 도구는 일반 한도를 각각 따로 가집니다.
+    CPU 도구(ToolSpec.cpu_bound)의 마감은 요청 마감과 스크립트 처리 마감 중 짧은 쪽입니다.
+    """
+    
+    def __init__(self, registry: ToolRegistry,
+                 max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+                 max_queued: int = DEFAULT_MAX_QUEUED,
+                 ai_max_concurrent: int = DEFAULT_AI_MAX_CONCURRENT,
+                 ai_max_queued: int = DEFAULT_AI_MAX_QUEUED,
+                 pool: Optional[WorkerPool] = None,
+                 request_timeout: Optional[float] = DEFAULT_REQUEST_TIMEOUT,
+                 script_timeout: Optional[float] = DEFAULT_SCRIPT_TIMEOUT):
+        """
+        Tool Dispatcher 초기화
+        
+        Args:
+            registry (ToolRegistry): 도구 레지스트리
+            max_concurrent (int): 일반 도구별 동시 실행 한도
+            max_queued (int): 일반 도구별 대기열 크기
+            ai_max_concurrent (int): AI 도구별 동시 실행 한도
+            ai_max_queued (int): AI 도구별 대기열 크기
+            pool (WorkerPool, optional): CPU 도구 작업자 풀. 지정하지 않으면 모든 도구를 이벤트 루프에서 실행
+            request_timeout (float, optional): 요청 마감 시간 (초, None 또는 0 이하이면 제한 없음)
+            script_timeout (float, optional): CPU 도구의 스크립트 처리 마감 시간 (초, None 또는 0 이하이면 제한 없음)
+        """
+        self.registry = registry
+        self.pool = pool
+        self._limiters: Dict[str, ToolLimiter] = {}
+        self._timeouts: Dict[str, Optional[float]] = {}
+        
+        request_timeout = request_timeout if request_timeout and request_timeout > 0 else None
+        script_timeout = script_timeout if script_timeout and script_timeout > 0 else None
+        for name in registry.names:
+            spec = registry.spec(name)
+            if spec.ai_backed:
+                self._limiters[name] = ToolLimiter(name, ai_max_concurrent, ai_max_queued)
+            else:
+                self._limiters[name] = ToolLimiter(name, max_concurrent, max_queued)
+    
+            timeout = request_timeout
+            if spec.cpu_bound and script_timeout is not None:
+                timeout = script_timeout if timeout is None else min(timeout, script_timeout)
+            self._timeouts[name] = timeout
+    
+    async def dispatch(self, name: str, arguments: Dict[str, Any]) -> List[Any]:
+        """
+        도구를 한도와 마감 시간 안에서 실행합니다.
+        
+        마감은 대기열에서 기다린 시간을 포함하며, 취소 토큰으로 도구 내부에 전달됩니다.
+        도구가 토큰의 DeadlineExceeded를 오류 응답으로 바꿔 반환해도 시간 초과로 처리합니다.
+        
+        Args:
+            name (str): 도구 이름
+            arguments (Dict[str, Any]): 도구 인자
+        
+        Returns:
+            List[Any]: 도구 실행 결과 (TextContent 목록)
+        
+        Raises:
+            ToolBusyError: 도구의 실행 슬롯과 대기열이 모두 찬 경우
+            ToolTimeoutError: 마감 시간을 초과한 경우
+        """
+        limiter = self._limiters[name]
+        timeout = self._timeouts[name]
+        token = CancellationToken(timeout)
+        
+        with cancellation_scope(token):
+            try:
+                result = await asyncio.wait_for(self._run(limiter, name, arguments), timeout)
+            except (asyncio.TimeoutError, DeadlineExceeded):
+                token.cancel()
+                result = None
+        
+        if token.cancelled:
+            limiter.timed_out += 1
+            raise ToolTimeoutError(f"{name} 요청이 처리 시간 제한({timeout}초)을 초과했습니다")
+        return result
+    
+    async def _run(self, limiter: ToolLimiter, name: str, arguments: Dict[str, Any]) -> List[Any]:
+        """한도 안에서 도구 실행 (작업자 풀이 있으면 풀을 거침)"""
+        async with limiter:
+            if self.pool is not None:
+                return await self.pool.run(name, arguments)
+            return await self.registry.get(name).execute(arguments)
+    
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """도구별 실행/대기/거절/시간 초과 통계"""
+        return {name: limiter.to_dict() for name, limiter in self._limiters.items()}
@@ -4,9 +4,14 @@ MSL 스크립트 예제 제공 도구
 """
 
 import asyncio
+import json
 from typing import Dict, Any, List, Optional
-from ..msl.msl_parser import MSLParser
-from ..msl.msl_lexer import MSLLexer
+from mcp.types import TextContent, Tool
+from msl.msl_parser import MSLParser
+from msl.msl_lexer import MSLLexer
+from msl.msl_simulator import MSLSimulator
+from msl.msl_compiler import CompileError
+from msl_ast import MultiAnalysisWalker, NodeCountAnalysis
 
 class ExamplesTool:
     """
@@ -19,10 +24,36 @@ class ExamplesTool:
     - 대화형 예제 검색 및 필터링
     """
     
+    # 도구 정의 (list_tools 카탈로그와 입력 검증의 단일 출처)
+    TOOL_DEFINITION = {
+        "name": "msl_examples",
+        "description": "카테고리, 난이도, 검색어에 맞는 MSL 예제를 제공합니다. "
+                       "학습 목적이나 템플릿으로 활용할 수 있습니다.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "category": {
+                    "type": "string",
+                    "description": "예제 카테고리 (예: '기본 키 입력', '순차 실행')"
+                },
+                "difficulty": {
+                    "type": "string",
+                    "enum": ["초급", "중급", "고급"],
+                    "description": "난이도"
+                },
+                "search_term": {
+                    "type": "string",
+                    "description": "이름, 설명, 사용 사례, 스크립트에서 찾을 검색어"
+                }
+            }
+        }
+    }
+    
     def __init__(self):
         """도구 초기화"""
         self.parser = MSLParser()
         self.lexer = MSLLexer()
+        self.simulator = MSLSimulator()
         
         # 예제 데이터베이스 초기화
         self._init_examples_database()
@@ -335,6 +366,17 @@ class ExamplesTool:
             }
         }
     
+    @property
+    def tool_definition(self) -> Tool:
+        """도구 정의를 반환합니다."""
+        return Tool(**self.TOOL_DEFINITION)
+    
+    async def execute(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        """예제 도구를 실행합니다 (결과는 JSON 텍스트)."""
+        result = await self.get_examples(arguments.get("category"), arguments.get("difficulty"),
+                                         arguments.get("search_term"))
+        return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2))]
+    
     async def get_examples(self, 
                           category: str = None, 
                           difficulty: str = None, 
@@ -741,34 +783,15 @@ class ExamplesTool:
         if not node:
             return 0
         
-        count = 1
-        if hasattr(node, 'left') and node.left:
-            count += self._count_ast_nodes(node.left)
-        if hasattr(node, 'right') and node.right:
-            count += self._count_ast_nodes(node.right)
-        if hasattr(node, 'children') and node.children:
-            for child in node.children:
-                count += self._count_ast_nodes(child)
-        
-        return count
+        return MultiAnalysisWalker([NodeCountAnalysis()]).run(node)["node_count"]
     
     def _estimate_execution_time(self, node) -> float:
-        """실행 시간을 추정합니다 (밀리초)"""
+        """실행 시간을 계산합니다 (밀리초, 시뮬레이터 추정)"""
         if not node:
             return 0.0
         
-        # 기본 키 입력은 50ms로 가정
-        base_time = 50.0
-        
-        # 노드 타입에 따른 시간 계산 (간단한 추정)
-        if hasattr(node, 'left') and hasattr(node, 'right'):
-            left_time = self._estimate_execution_time(node.left)
-            right_time = self._estimate_execution_time(node.right)
-            
-            # 순차 실행인 경우 시간을 더하고, 동시 실행인 경우 최대값 선택
-            if 'Sequence' in type(node).__name__:
-                return left_time + right_time
-            else:
-                return max(left_time, right_time)
-        
-        return base_time 
\ No newline at end of file
+        try:
+            return self.simulator.estimate(node).duration_ms
+        except CompileError:
+            # 변수 값이 없으면 실행 시간을 알 수 없음
+            return 0.0 
\ No newline at end of file
@@ -4,10 +4,18 @@ MSL 구문을 분석하고 초보자가 이해하기 쉽게 설명해주는 도
 """
 
 import asyncio
+import json
 from typing import Dict, Any, List, Optional
-from ..msl.msl_parser import MSLParser
-from ..msl.msl_lexer import MSLLexer
-from ..msl.msl_ast import *
+from mcp.types import TextContent, Tool
+from msl.msl_parser import MSLParser
+from msl.msl_lexer import MSLLexer
+from msl_ast import *
+from msl.msl_simulator import MSLSimulator
+from msl.msl_compiler import CompileError
+from msl.msl_cancel import check_cancelled
+
+# 타입 표기에 쓰는 AST 노드 기본 클래스
+ASTNode = MSLNode
 
 class ExplainTool:
     """
@@ -20,10 +28,48 @@ class ExplainTool:
     - 키 입력 시퀀스 시각화
     """
     
+    # 도구 정의 (list_tools 카탈로그와 입력 검증의 단일 출처)
+    TOOL_DEFINITION = {
+        "name": "explain_msl",
+        "description": "MSL 스크립트나 특정 구문을 상세히 설명합니다. "
+                       "동작 방식과 매개변수를 분석하여 학습을 도와줍니다.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "script": {
+                    "type": "string",
+                    "description": "설명할 MSL 스크립트 또는 구문"
+                },
+                "detail_level": {
+                    "type": "string",
+                    "enum": ["basic", "standard", "detailed"],
+                    "description": "설명 상세도 (basic, standard, detailed)",
+                    "default": "standard"
+                }
+            },
+            "required": ["script"]
+        }
+    }
+    
     def __init__(self):
         """도구 초기화 - 파서와 어휘분석기 준비"""
         self.parser = MSLParser()
         self.lexer = MSLLexer()
+        self.simulator = MSLSimulator()
+        
+        # 마지막으로 분석한 (AST, 사실 정보) - 같은 AST에 대한 헬퍼 호출은 순회 없이 재사용
+        self._facts_cache = None
+        
+        # 노드 타입별 MSL 연산자 기호
+        self.operator_symbols = {
+            NodeType.SEQUENTIAL: ',',
+            NodeType.SIMULTANEOUS: '+',
+            NodeType.HOLD_CHAIN: '>',
+            NodeType.PARALLEL: '|',
+            NodeType.TOGGLE: '~',
+            NodeType.REPEAT: '*',
+            NodeType.CONTINUOUS: '&'
+        }
         
         # MSL 연산자별 설명 사전
         self.operator_descriptions = {
@@ -71,6 +117,17 @@ class ExplainTool:
             'backspace': 'Backspace키'
         }
     
+    @property
+    def tool_definition(self) -> Tool:
+        """도구 정의를 반환합니다."""
+        return Tool(**self.TOOL_DEFINITION)
+    
+    async def execute(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        """설명 도구를 실행합니다 (결과는 JSON 텍스트)."""
+        result = await self.explain_script(arguments["script"].strip(),
+                                           arguments.get("detail_level", "standard"))
+        return [TextContent(type="text", text=json.dumps(result, ensure_ascii=False, indent=2, default=str))]
+    
     async def explain_script(self, script: str, detail_level: str = "standard") -> Dict[str, Any]:
         """
         MSL 스크립트를 분석하고 설명을 생성합니다
@@ -180,6 +237,7 @@ class ExplainTool:
     
     def _collect_components(self, node: ASTNode, components: List[Dict[str, Any]], detail_level: str, level: int = 0):
         """재귀적으로 컴포넌트를 수집합니다"""
+        check_cancelled()
         component = {
             "level": level,
             "type": type(node).__name__,
@@ -321,17 +379,9 @@ class ExplainTool:
         return sequence
     
     def _collect_key_sequence(self, node: ASTNode, sequence: List[str]):
-        """키 시퀀스를 재귀적으로 수집합니다"""
-        if isinstance(node, KeyNode):
-            key_name = self.special_keys.get(node.key.lower(), node.key)
-            sequence.append(key_name)
-        elif hasattr(node, 'left') and node.left:
-            self._collect_key_sequence(node.left, sequence)
-        elif hasattr(node, 'right') and node.right:
-            self._collect_key_sequence(node.right, sequence)
-        elif hasattr(node, 'children') and node.children:
-            for child in node.children:
-                self._collect_key_sequence(child, sequence)
+        """키 시퀀스를 수집합니다"""
+        for key in self._collect_facts(node)["key_sequence"]:
+            sequence.append(self.special_keys.get(key.lower(), key))
     
     def _analyze_timing(self, ast: ASTNode) -> Dict[str, Any]:
         """타이밍 정보를 분석합니다"""
@@ -374,47 +424,52 @@ class ExplainTool:
         return tips
     
     # 헬퍼 메서드들
+    def _collect_facts(self, ast: ASTNode) -> Dict[str, Any]:
+        """
+        한 번의 AST 순회로 설명에 필요한 사실들을 모두 수집합니다.
+        
+        노드 수, 연산자, 키 시퀀스, 딜레이, 홀드 정보를 같은 순회에서 모으며
+        같은 AST에 대한 반복 호출은 캐시된 결과를 사용합니다.
+        """
+        cached = self._facts_cache
+        if cached is not None and cached[0] is ast:
+            return cached[1]
+        
+        operators = []
+        delays = []
+        holds = []
+        
+        walker = MultiAnalysisWalker([NodeCountAnalysis(), KeySequenceAnalysis()])
+        walker.on_enter(
+            "operators",
+            lambda node, depth: operators.append(self.operator_symbols[node.node_type]),
+            *self.operator_symbols,
+            result=lambda: operators
+        )
+        walker.on_enter(
+            "delays",
+            lambda node, depth: delays.append(node.duration),
+            NodeType.DELAY,
+            result=lambda: delays
+        )
+        walker.on_enter(
+            "hold_count",
+            lambda node, depth: holds.append(node),
+            NodeType.HOLD,
+            result=lambda: len(holds)
+        )
+        
+        facts = walker.run(ast)
+        self._facts_cache = (ast, facts)
+        return facts
+    
     def _count_nodes(self, node: ASTNode) -> int:
         """AST 노드 개수를 계산합니다"""
-        count = 1
-        if hasattr(node, 'left') and node.left:
-            count += self._count_nodes(node.left)
-        if hasattr(node, 'right') and node.right:
-            count += self._count_nodes(node.right)
-        if hasattr(node, 'children') and node.children:
-            for child in node.children:
-                count += self._count_nodes(child)
-        return count
+        return self._collect_facts(node)["node_count"]
     
     def _find_operators(self, node: ASTNode) -> List[str]:
         """사용된 연산자들을 찾습니다"""
-        operators = []
-        
-        if isinstance(node, SequenceNode):
-            operators.append(',')
-        elif isinstance(node, ConcurrentNode):
-            operators.append('+')
-        elif isinstance(node, HoldNode):
-            operators.append('>')
-        elif isinstance(node, ParallelNode):
-            operators.append('|')
-        elif isinstance(node, ToggleNode):
-            operators.append('~')
-        elif isinstance(node, RepeatNode):
-            operators.append('*')
-        elif isinstance(node, ContinuousNode):
-            operators.append('&')
-        
-        # 자식 노드들에서 재귀적으로 찾기
-        if hasattr(node, 'left') and node.left:
-            operators.extend(self._find_operators(node.left))
-        if hasattr(node, 'right') and node.right:
-            operators.extend(self._find_operators(node.right))
-        if hasattr(node, 'children') and node.children:
-            for child in node.children:
-                operators.extend(self._find_operators(child))
-        
-        return operators
+        return list(self._collect_facts(node)["operators"])
     
     def _categorize_key(self, key: str) -> str:
         """키를 카테고리별로 분류합니다"""
@@ -495,64 +550,23 @@ class ExplainTool:
     
     # 유틸리티 메서드들
     def _calculate_total_time(self, node: ASTNode) -> float:
-        """총 예상 실행 시간을 계산합니다 (밀리초)"""
-        if isinstance(node, DelayNode):
-            return float(node.delay)
-        elif isinstance(node, SequenceNode):
-            # 순차 실행은 시간을 더함
-            left_time = self._calculate_total_time(node.left) if node.left else 0
-            right_time = self._calculate_total_time(node.right) if node.right else 0
-            return left_time + right_time
-        elif isinstance(node, ConcurrentNode):
-            # 동시 실행은 더 긴 시간을 선택
-            left_time = self._calculate_total_time(node.left) if node.left else 0
-            right_time = self._calculate_total_time(node.right) if node.right else 0
-            return max(left_time, right_time)
-        elif isinstance(node, RepeatNode):
-            # 반복은 내용 시간 × 반복 횟수
-            child_time = 0
-            if hasattr(node, 'children') and node.children:
-                child_time = sum(self._calculate_total_time(child) for child in node.children)
-            return child_time * node.count
-        else:
-            # 기본 키 입력은 50ms로 가정
-            return 50.0
+        """총 예상 실행 시간을 계산합니다 (밀리초, 시뮬레이터 추정)"""
+        try:
+            return self.simulator.estimate(node).duration_ms
+        except CompileError:
+            # 변수 값이 없으면 실행 시간을 알 수 없음
+            return 0.0
     
     def _find_delays(self, node: ASTNode) -> List[Dict[str, Any]]:
         """딜레이 노드들을 찾습니다"""
-        delays = []
-        
-        if isinstance(node, DelayNode):
-            delays.append({
-                "delay": node.delay,
-                "description": f"{node.delay}ms 대기"
-            })
-        
-        # 자식 노드들에서 재귀적으로 찾기
-        if hasattr(node, 'left') and node.left:
-            delays.extend(self._find_delays(node.left))
-        if hasattr(node, 'right') and node.right:
-            delays.extend(self._find_delays(node.right))
-        if hasattr(node, 'children') and node.children:
-            for child in node.children:
-                delays.extend(self._find_delays(child))
-        
-        return delays
+        return [
+            {"delay": delay, "description": f"{delay}ms 대기"}
+            for delay in self._collect_facts(node)["delays"]
+        ]
     
     def _find_concurrent_actions(self, node: ASTNode) -> List[str]:
         """동시 실행 동작들을 찾습니다"""
-        concurrent = []
-        
-        if isinstance(node, ConcurrentNode):
-            concurrent.append("동시 실행 발견")
-        
-        # 자식 노드들에서 재귀적으로 찾기
-        if hasattr(node, 'left') and node.left:
-            concurrent.extend(self._find_concurrent_actions(node.left))
-        if hasattr(node, 'right') and node.right:
-            concurrent.extend(self._find_concurrent_actions(node.right))
-        
-        return concurrent
+        return ["동시 실행 발견"] * self._collect_facts(node)["operators"].count('+')
     
     def _assess_timing_criticality(self, node: ASTNode) -> str:
         """타이밍 중요도를 평가합니다"""
@@ -571,67 +585,23 @@ class ExplainTool:
     
     def _has_delays(self, node: ASTNode) -> bool:
         """딜레이가 있는지 확인합니다"""
-        if isinstance(node, DelayNode):
-            return True
-        
-        if hasattr(node, 'left') and node.left and self._has_delays(node.left):
-            return True
-        if hasattr(node, 'right') and node.right and self._has_delays(node.right):
-            return True
-        if hasattr(node, 'children') and node.children:
-            for child in node.children:
-                if self._has_delays(child):
-                    return True
-        
-        return False
+        return bool(self._collect_facts(node)["delays"])
     
     def _has_concurrent_actions(self, node: ASTNode) -> bool:
         """동시 실행이 있는지 확인합니다"""
-        if isinstance(node, ConcurrentNode):
-            return True
-        
-        if hasattr(node, 'left') and node.left and self._has_concurrent_actions(node.left):
-            return True
-        if hasattr(node, 'right') and node.right and self._has_concurrent_actions(node.right):
-            return True
-        
-        return False
+        return '+' in self._collect_facts(node)["operators"]
     
     def _has_repeats(self, node: ASTNode) -> bool:
         """반복이 있는지 확인합니다"""
-        if isinstance(node, RepeatNode):
-            return True
-        
-        if hasattr(node, 'left') and node.left and self._has_repeats(node.left):
-            return True
-        if hasattr(node, 'right') and node.right and self._has_repeats(node.right):
-            return True
-        
-        return False
+        return '*' in self._collect_facts(node)["operators"]
     
     def _has_holds(self, node: ASTNode) -> bool:
         """홀드가 있는지 확인합니다"""
-        if isinstance(node, HoldNode):
-            return True
-        
-        if hasattr(node, 'left') and node.left and self._has_holds(node.left):
-            return True
-        if hasattr(node, 'right') and node.right and self._has_holds(node.right):
-            return True
-        
-        return False
+        return self._collect_facts(node)["hold_count"] > 0
     
     def _has_excessive_delays(self, node: ASTNode) -> bool:
         """과도한 딜레이가 있는지 확인합니다 (1초 이상)"""
-        if isinstance(node, DelayNode) and node.delay > 1000:
-            return True
-        
-        if hasattr(node, 'left') and node.left and self._has_excessive_delays(node.left):
-            return True
-        if hasattr(node, 'right') and node.right and self._has_excessive_delays(node.right):
-            return True
-        
-        return False
+        return any(delay > 1000 for delay in self._collect_facts(node)["delays"])
     
     def _has_redundant_actions(self, node: ASTNode) -> bool:
         """중복 동작이 있는지 확인합니다 (간단한 휴리스틱)"""
@@ -11,14 +11,54 @@ import traceback
 from typing import Dict, Any, List, Optional
 from mcp.types import TextContent, Tool
 
-from ..msl.msl_lexer import MSLLexer
-from ..msl.msl_parser import MSLParser
-from ..ai.openai_integration import get_openai_integration
+from msl.msl_lexer import MSLLexer
+from msl.msl_parser import MSLParser
 
 
 class GenerateTool:
     """MSL 스크립트 자동 생성 도구"""
     
+    # 도구 정의 (list_tools 카탈로그와 입력 검증의 단일 출처)
+    TOOL_DEFINITION = {
+        "name": "generate_msl",
+        "description": "자연어 프롬프트를 기반으로 MSL(Macro Scripting Language) 스크립트를 자동 생성합니다. "
+                      "Context7과 AI를 활용하여 사용자의 의도에 맞는 정확한 MSL 스크립트를 생성합니다.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "prompt": {
+                    "type": "string",
+                    "description": "생성할 매크로의 동작을 설명하는 자연어 프롬프트입니다. "
+                                 "예: '컨트롤C 누르고 컨트롤V를 누르는 매크로' 또는 '공격키를 연속으로 5번 누르기'"
+                },
+                "game_context": {
+                    "type": "string",
+                    "description": "게임 컨텍스트 정보 (선택사항). 특정 게임에 최적화된 스크립트를 생성합니다. "
+                                 "예: 'FPS게임', 'MMORPG', 'RTS게임' 등",
+                    "default": ""
+                },
+                "complexity": {
+                    "type": "string",
+                    "enum": ["simple", "medium", "complex"],
+                    "description": "생성할 스크립트의 복잡도 수준입니다. "
+                                 "simple: 기본적인 키 조합, medium: 타이밍 제어 포함, complex: 고급 기능 활용",
+                    "default": "medium"
+                },
+                "optimize": {
+                    "type": "boolean",
+                    "description": "생성된 스크립트를 자동으로 최적화할지 여부입니다.",
+                    "default": True
+                },
+                "include_explanation": {
+                    "type": "boolean", 
+                    "description": "생성된 스크립트에 대한 상세 설명을 포함할지 여부입니다.",
+                    "default": True
+                }
+            },
+            "required": ["prompt"]
+        }
+    }
+    
     def __init__(self):
         self.lexer = MSLLexer()
         self.parser = MSLParser()
@@ -27,45 +67,7 @@ class GenerateTool:
     @property
     def tool_definition(self) -> Tool:
         """도구 정의를 반환합니다."""
-        return Tool(
-            name="generate_msl",
-            description="자연어 프롬프트를 기반으로 MSL(Macro Scripting Language) 스크립트를 자동 생성합니다. "
-                       "Context7과 AI를 활용하여 사용자의 의도에 맞는 정확한 MSL 스크립트를 생성합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "prompt": {
-                        "type": "string",
-                        "description": "생성할 매크로의 동작을 설명하는 자연어 프롬프트입니다. "
-                                     "예: '컨트롤C 누르고 컨트롤V를 누르는 매크로' 또는 '공격키를 연속으로 5번 누르기'"
-                    },
-                    "game_context": {
-                        "type": "string",
-                        "description": "게임 컨텍스트 정보 (선택사항). 특정 게임에 최적화된 스크립트를 생성합니다. "
-                                     "예: 'FPS게임', 'MMORPG', 'RTS게임' 등",
-                        "default": ""
-                    },
-                    "complexity": {
-                        "type": "string",
-                        "enum": ["simple", "medium", "complex"],
-                        "description": "생성할 스크립트의 복잡도 수준입니다. "
-                                     "simple: 기본적인 키 조합, medium: 타이밍 제어 포함, complex: 고급 기능 활용",
-                        "default": "medium"
-                    },
-                    "optimize": {
-                        "type": "boolean",
-                        "description": "생성된 스크립트를 자동으로 최적화할지 여부입니다.",
-                        "default": True
-                    },
-                    "include_explanation": {
-                        "type": "boolean", 
-                        "description": "생성된 스크립트에 대한 상세 설명을 포함할지 여부입니다.",
-                        "default": True
-                    }
-                },
-                "required": ["prompt"]
-            }
-        )
+        return Tool(**self.TOOL_DEFINITION)
     
     async def execute(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """MSL 생성 도구를 실행합니다."""
@@ -195,6 +197,8 @@ class GenerateTool:
         
         # OpenAI 통합을 시도하되, 실패시 기본 패턴 매칭 사용
         try:
+            # OpenAI SDK는 생성 요청이 처음 들어올 때 불러옴
+            from ai.openai_integration import get_openai_integration
             openai_integration = await get_openai_integration()
             prompt = analysis.get("original_prompt", "")
             
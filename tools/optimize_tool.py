@@ -12,59 +12,65 @@ import re
 from typing import Dict, Any, List, Optional, Tuple
 from mcp.types import TextContent, Tool
 
-from ..msl.msl_lexer import MSLLexer
-from ..msl.msl_parser import MSLParser
+from msl.msl_lexer import MSLLexer
+from msl.msl_parser import MSLParser
+from msl.msl_simulator import MSLSimulator
+from msl.msl_cancel import check_cancelled
 
 
 class OptimizeTool:
     """MSL 스크립트 최적화 도구"""
     
+    # 도구 정의 (list_tools 카탈로그와 입력 검증의 단일 출처)
+    TOOL_DEFINITION = {
+        "name": "optimize_msl",
+        "description": "MSL(Macro Scripting Language) 스크립트를 최적화하여 성능과 효율성을 개선합니다. "
+                      "중복 제거, 타이밍 최적화, 구조 개선 등을 수행하여 더 빠르고 안정적인 스크립트를 생성합니다.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "script": {
+                    "type": "string",
+                    "description": "최적화할 MSL 스크립트 텍스트입니다."
+                },
+                "optimization_level": {
+                    "type": "string",
+                    "enum": ["basic", "standard", "aggressive"],
+                    "description": "최적화 수준입니다. "
+                                 "basic: 기본 최적화, standard: 표준 최적화, aggressive: 적극적 최적화",
+                    "default": "standard"
+                },
+                "preserve_timing": {
+                    "type": "boolean",
+                    "description": "기존 타이밍을 보존할지 여부입니다. true로 설정하면 타이밍 관련 최적화를 제한합니다.",
+                    "default": False
+                },
+                "target_performance": {
+                    "type": "string",
+                    "enum": ["speed", "stability", "balanced"],
+                    "description": "최적화 목표입니다. speed: 실행 속도 우선, stability: 안정성 우선, balanced: 균형",
+                    "default": "balanced"
+                },
+                "show_diff": {
+                    "type": "boolean",
+                    "description": "원본과 최적화된 스크립트의 차이점을 보여줄지 여부입니다.",
+                    "default": True
+                }
+            },
+            "required": ["script"]
+        }
+    }
+    
     def __init__(self):
         self.lexer = MSLLexer()
         self.parser = MSLParser()
+        self.simulator = MSLSimulator()
         self.optimization_rules = self._load_optimization_rules()
     
     @property
     def tool_definition(self) -> Tool:
         """도구 정의를 반환합니다."""
-        return Tool(
-            name="optimize_msl",
-            description="MSL(Macro Scripting Language) 스크립트를 최적화하여 성능과 효율성을 개선합니다. "
-                       "중복 제거, 타이밍 최적화, 구조 개선 등을 수행하여 더 빠르고 안정적인 스크립트를 생성합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script": {
-                        "type": "string",
-                        "description": "최적화할 MSL 스크립트 텍스트입니다."
-                    },
-                    "optimization_level": {
-                        "type": "string",
-                        "enum": ["basic", "standard", "aggressive"],
-                        "description": "최적화 수준입니다. "
-                                     "basic: 기본 최적화, standard: 표준 최적화, aggressive: 적극적 최적화",
-                        "default": "standard"
-                    },
-                    "preserve_timing": {
-                        "type": "boolean",
-                        "description": "기존 타이밍을 보존할지 여부입니다. true로 설정하면 타이밍 관련 최적화를 제한합니다.",
-                        "default": False
-                    },
-                    "target_performance": {
-                        "type": "string",
-                        "enum": ["speed", "stability", "balanced"],
-                        "description": "최적화 목표입니다. speed: 실행 속도 우선, stability: 안정성 우선, balanced: 균형",
-                        "default": "balanced"
-                    },
-                    "show_diff": {
-                        "type": "boolean",
-                        "description": "원본과 최적화된 스크립트의 차이점을 보여줄지 여부입니다.",
-                        "default": True
-                    }
-                },
-                "required": ["script"]
-            }
-        )
+        return Tool(**self.TOOL_DEFINITION)
     
     async def execute(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """최적화 도구를 실행합니다."""
@@ -135,6 +141,7 @@ class OptimizeTool:
             applied_optimizations.extend(basic_opts)
             
             # 2. 표준 최적화 (standard, aggressive)
+            check_cancelled()
             if level in ["standard", "aggressive"]:
                 optimized, standard_opts = await self._apply_standard_optimizations(
                     optimized, preserve_timing
@@ -142,6 +149,7 @@ class OptimizeTool:
                 applied_optimizations.extend(standard_opts)
             
             # 3. 적극적 최적화 (aggressive만)
+            check_cancelled()
             if level == "aggressive":
                 optimized, aggressive_opts = await self._apply_aggressive_optimizations(
                     optimized, target
@@ -149,12 +157,14 @@ class OptimizeTool:
                 applied_optimizations.extend(aggressive_opts)
             
             # 4. 타겟별 특화 최적화
+            check_cancelled()
             optimized, target_opts = await self._apply_target_specific_optimizations(
                 optimized, target
             )
             applied_optimizations.extend(target_opts)
             
             # 5. 최적화 결과 검증
+            check_cancelled()
             optimized_valid = await self._validate_script(optimized)
             if not optimized_valid:
                 optimization_result["warnings"].append("최적화된 스크립트에 오류가 발생했습니다. 원본을 반환합니다.")
@@ -416,29 +426,12 @@ class OptimizeTool:
         return score
     
     def _estimate_execution_time(self, script: str) -> int:
-        """예상 실행 시간을 밀리초로 추정합니다."""
-        base_time = 100  # 기본 100ms
-        
-        # 키 수에 따른 시간 증가
-        key_count = script.count(',') + 1
-        base_time += key_count * 10
-        
-        # 반복에 따른 시간 증가
-        for match in re.finditer(r'\*(\d+)', script):
-            repeat_count = int(match.group(1))
-            base_time += repeat_count * 20
-        
-        # 타이밍 제어에 따른 시간 증가
-        for match in re.finditer(r'&\s*(\d+)', script):
-            interval = int(match.group(1))
-            base_time += interval
-        
-        # 홀드 시간 추가
-        for match in re.finditer(r'>\s*(\d+)', script):
-            hold_time = int(match.group(1))
-            base_time += hold_time
-        
-        return base_time
+        """예상 실행 시간을 밀리초로 계산합니다 (시뮬레이터 추정)."""
+        try:
+            return int(round(self.simulator.estimate_script(script).duration_ms))
+        except Exception:
+            # 파싱/컴파일할 수 없는 스크립트는 시간을 알 수 없음
+            return 0
     
     def _is_complex_expression(self, expr: str) -> bool:
         """표현식이 복잡한지 확인합니다."""
@@ -22,6 +22,36 @@ from msl.msl_parser import MSLParser
 class ParseTool:
     """MSL 스크립트 파싱 도구"""
     
+    # 도구 정의 (list_tools 카탈로그와 입력 검증의 단일 출처)
+    TOOL_DEFINITION = {
+        "name": "parse_msl",
+        "description": "MSL(Macro Scripting Language) 스크립트를 파싱하고 구문 분석을 수행합니다. "
+                      "입력된 MSL 스크립트의 구문 오류를 확인하고 AST(Abstract Syntax Tree)를 생성합니다.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "script": {
+                    "type": "string",
+                    "description": "파싱할 MSL 스크립트 텍스트입니다. "
+                                 "예: 'ctrl+c, ctrl+v' 또는 'a+b > 500, c'"
+                },
+                "verbose": {
+                    "type": "boolean", 
+                    "description": "상세한 파싱 정보를 포함할지 여부입니다. "
+                                 "true로 설정하면 토큰 정보와 AST 구조를 자세히 보여줍니다.",
+                    "default": False
+                },
+                "validate_only": {
+                    "type": "boolean",
+                    "description": "파싱 결과 없이 구문 검증만 수행할지 여부입니다. "
+                                 "true로 설정하면 오류 여부만 확인합니다.",
+                    "default": False
+                }
+            },
+            "required": ["script"]
+        }
+    }
+    
     def __init__(self):
         self.lexer = MSLLexer()
         self.parser = MSLParser()
@@ -29,34 +59,7 @@ class ParseTool:
     @property
     def tool_definition(self) -> Tool:
         """도구 정의를 반환합니다."""
-        return Tool(
-            name="parse_msl",
-            description="MSL(Macro Scripting Language) 스크립트를 파싱하고 구문 분석을 수행합니다. "
-                       "입력된 MSL 스크립트의 구문 오류를 확인하고 AST(Abstract Syntax Tree)를 생성합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script": {
-                        "type": "string",
-                        "description": "파싱할 MSL 스크립트 텍스트입니다. "
-                                     "예: 'ctrl+c, ctrl+v' 또는 'a+b > 500, c'"
-                    },
-                    "verbose": {
-                        "type": "boolean", 
-                        "description": "상세한 파싱 정보를 포함할지 여부입니다. "
-                                     "true로 설정하면 토큰 정보와 AST 구조를 자세히 보여줍니다.",
-                        "default": False
-                    },
-                    "validate_only": {
-                        "type": "boolean",
-                        "description": "파싱 결과 없이 구문 검증만 수행할지 여부입니다. "
-                                     "true로 설정하면 오류 여부만 확인합니다.",
-                        "default": False
-                    }
-                },
-                "required": ["script"]
-            }
-        )
+        return Tool(**self.TOOL_DEFINITION)
     
     async def execute(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """파싱 도구를 실행합니다."""
@@ -0,0 +1,167 @@
+"""
+MSL 도구 레지스트리
+
+도구 이름과 구현 클래스의 위치(모듈 경로, 클래스 이름)만 등록해 두고,
+각 도구는 처음 호출될 때 모듈을 임포트하여 인스턴스를 만듭니다.
+
+서버 시작 시에는 파서, 예제 데이터베이스, OpenAI SDK 등 무거운 의존성을 전혀 불러오지 않으므로
+CPU가 적은 컨테이너에서도 첫 list_tools 응답까지의 시간이 짧습니다.
+
+도구 스키마는 각 도구 클래스의 TOOL_DEFINITION이 단일 출처입니다.
+카탈로그(list_tools 응답)는 처음 요청될 때 클래스만 불러와 한 번 만들고 검사한 뒤 그대로 재사용하며,
+입력 스키마는 검증 함수로 미리 컴파일되어 call_tool마다 인자를 검사합니다 (인스턴스 생성 없음).
+"""
+
+import time
+import logging
+import importlib
+import threading
+from typing import Dict, Any, List, Tuple, NamedTuple
+
+from mcp.types import Tool
+
+from .schema import SchemaError, ArgumentValidator, check_schema, compile_validator
+
+
+class ToolSpec(NamedTuple):
+    """도구 하나의 등록 정보"""
+    name: str          # MCP 도구 이름
+    module: str        # 구현 모듈 경로
+    class_name: str    # 구현 클래스 이름
+    ai_backed: bool = False  # 외부 AI API를 호출하는 도구 (별도의 작은 동시 실행 한도 적용)
+    cpu_bound: bool = False  # 동기 CPU 작업 도구 (큰 입력은 작업자 프로세스에서 실행)
+
+
+# 서버가 제공하는 도구 (list_tools 순서)
+TOOL_SPECS = (
+    ToolSpec("parse_msl", "tools.parse_tool", "ParseTool", cpu_bound=True),
+    ToolSpec("generate_msl", "tools.generate_tool", "GenerateTool", ai_backed=True),
+    ToolSpec("validate_msl", "tools.validate_tool", "ValidateTool", cpu_bound=True),
+    ToolSpec("optimize_msl", "tools.optimize_tool", "OptimizeTool", cpu_bound=True),
+    ToolSpec("explain_msl", "tools.explain_tool", "ExplainTool", cpu_bound=True),
+    ToolSpec("msl_examples", "tools.examples_tool", "ExamplesTool"),
+)
+
+
+class ToolRegistry:
+    """
+    지연 생성 도구 레지스트리
+    
+    get()으로 처음 요청된 도구만 임포트/생성하고 이후에는 같은 인스턴스를 반환합니다.
+    도구별 로드 시간은 로그와 load_times_ms에 기록됩니다.
+    """
+    
+    def __init__(self, specs=TOOL_SPECS):
+        """
+        Tool Registry 초기화
+        
+        Args:
+            specs (Iterable[ToolSpec]): 등록할 도구 목록
+        """
+        self._specs: Dict[str, ToolSpec] = {spec.name: spec for spec in specs}
+        self._instances: Dict[str, Any] = {}
+        self._classes: Dict[str, type] = {}
+        self._validators: Dict[str, ArgumentValidator] = {}
+        self._catalogue: Tuple[Tool, ...] = ()
+        self._lock = threading.Lock()
+        self.load_times_ms: Dict[str, float] = {}
+        self.logger = logging.getLogger("msl-tool-registry")
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._specs
+    
+    @property
+    def names(self) -> List[str]:
+        """등록된 도구 이름 (등록 순서)"""
+        return list(self._specs)
+    
+    @property
+    def cpu_bound_names(self) -> List[str]:
+        """작업자 프로세스에서 실행할 수 있는 도구 이름"""
+        return [name for name, spec in self._specs.items() if spec.cpu_bound]
+    
+    def spec(self, name: str) -> ToolSpec:
+        """도구 등록 정보"""
+        return self._specs[name]
+    
+    def is_loaded(self, name: str) -> bool:
+        """도구 인스턴스가 이미 생성되었는지 여부"""
+        return name in self._instances
+    
+    def catalogue(self) -> List[Tool]:
+        """
+        list_tools 응답용 도구 정의 목록 (처음 호출 시 한 번 만들고 검사)
+        
+        Returns:
+            List[Tool]: 등록 순서의 도구 정의
+        
+        Raises:
+            SchemaError: 도구 정의가 잘못된 경우
+        """
+        if not self._catalogue:
+            catalogue = tuple(Tool(**self._definition(name)) for name in self._specs)
+            with self._lock:
+                self._catalogue = catalogue
+        return list(self._catalogue)
+    
+    def validate(self, name: str, arguments: Any) -> List[str]:
+        """
+        도구 인자를 미리 컴파일된 입력 스키마 검증 함수로 검사합니다.
+        
+        Returns:
+            List[str]: 오류 메시지 목록 (비어 있으면 통과)
+        """
+        validator = self._validators.get(name)
+        if validator is None:
+            self._definition(name)
+            validator = self._validators[name]
+        return validator(arguments)
+    
+    def _tool_class(self, name: str) -> type:
+        """도구 클래스 (모듈만 임포트하고 인스턴스는 만들지 않음)"""
+        tool_class = self._classes.get(name)
+        if tool_class is None:
+            spec = self._specs[name]
+            tool_class = getattr(importlib.import_module(spec.module), spec.class_name)
+            self._classes[name] = tool_class
+        return tool_class
+    
+    def _definition(self, name: str) -> Dict[str, Any]:
+        """도구 정의를 검사하고 입력 검증 함수를 컴파일 (도구마다 한 번)"""
+        definition = self._tool_class(name).TOOL_DEFINITION
+        if name not in self._validators:
+            if definition.get("name") != name:
+                raise SchemaError(f"도구 이름 불일치: 등록 {name}, 정의 {definition.get('name')}")
+            schema = definition["inputSchema"]
+            check_schema(schema)
+            self._validators[name] = compile_validator(schema)
+        return definition
+    
+    def get(self, name: str) -> Any:
+        """
+        도구 인스턴스 반환 (처음 호출 시 모듈 임포트 및 생성)
+        
+        Args:
+            name (str): 도구 이름
+        
+        Returns:
+            Any: 도구 인스턴스
+        
+        Raises:
+            KeyError: 등록되지 않은 도구인 경우
+        """
+        tool = self._instances.get(name)
+        if tool is not None:
+            return tool
+        
+        with self._lock:
+            tool = self._instances.get(name)
+            if tool is None:
+                started = time.perf_counter()
+                tool = self._tool_class(name)()
+                load_ms = (time.perf_counter() - started) * 1000
+                
+                self._instances[name] = tool
+                self.load_times_ms[name] = round(load_ms, 3)
+                self.logger.info(f"도구 로드: {name} ({load_ms:.1f}ms)")
+        return tool
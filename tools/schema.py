@@ -0,0 +1,132 @@
+"""
+MSL 도구 입력 스키마 검증
+
+도구 정의(TOOL_DEFINITION)의 inputSchema는 카탈로그를 만들 때 한 번 검사하고,
+속성별 검사 함수로 미리 컴파일해 두었다가 call_tool마다 인자를 검증합니다.
+
+지원하는 JSON Schema 범위 (도구 정의에서 쓰는 부분):
+- 최상위 type: object, properties, required
+- 속성별 type (string, boolean, integer, number, object, array), enum, minimum, maximum, default
+  (minimum/maximum은 type이 integer 또는 number인 속성에만 허용 - 타입 검사가 먼저 숫자만 통과시킴)
+정의되지 않은 추가 인자는 JSON Schema 기본 동작대로 허용합니다.
+"""
+
+from typing import Dict, Any, List, Callable
+
+
+class SchemaError(ValueError):
+    """도구 스키마 정의 오류"""
+    pass
+
+
+# JSON Schema 타입 -> 값 검사 (bool은 int의 하위 클래스이므로 숫자에서 제외)
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+}
+
+# 범위(minimum/maximum)를 지정할 수 있는 타입
+_NUMERIC_TYPES = ("integer", "number")
+
+# 인자 검증 함수: 인자 딕셔너리 -> 오류 메시지 목록 (비어 있으면 통과)
+ArgumentValidator = Callable[[Any], List[str]]
+
+
+def _property_errors(name: str, value: Any, prop: Dict[str, Any]) -> List[str]:
+    """속성 하나의 값 검사 (스키마 검사와 인자 검증에서 공용)"""
+    type_name = prop.get("type")
+    if type_name is not None and not _TYPE_CHECKS[type_name](value):
+        return [f"'{name}'은(는) {type_name} 타입이어야 합니다"]
+    
+    errors = []
+    enum = prop.get("enum")
+    if enum is not None and value not in enum:
+        errors.append(f"'{name}'은(는) {', '.join(map(str, enum))} 중 하나여야 합니다")
+    if "minimum" in prop and value < prop["minimum"]:
+        errors.append(f"'{name}'은(는) {prop['minimum']} 이상이어야 합니다")
+    if "maximum" in prop and value > prop["maximum"]:
+        errors.append(f"'{name}'은(는) {prop['maximum']} 이하여야 합니다")
+    return errors
+
+
+def check_schema(schema: Dict[str, Any]):
+    """
+    도구 입력 스키마 자체를 검사합니다.
+    
+    Args:
+        schema (Dict[str, Any]): inputSchema
+    
+    Raises:
+        SchemaError: 지원하지 않는 타입, 숫자 타입이 아닌 속성의 범위, 정의되지 않은 필수 속성, 스키마에 맞지 않는 기본값 등
+    """
+    if schema.get("type") != "object":
+        raise SchemaError("inputSchema의 type은 object여야 합니다")
+    
+    properties = schema.get("properties", {})
+    if not isinstance(properties, dict):
+        raise SchemaError("properties는 객체여야 합니다")
+    
+    for name, prop in properties.items():
+        type_name = prop.get("type")
+        if type_name is not None and type_name not in _TYPE_CHECKS:
+            raise SchemaError(f"'{name}': 지원하지 않는 타입 {type_name}")
+        for value in prop.get("enum", ()):
+            if type_name is not None and not _TYPE_CHECKS[type_name](value):
+                raise SchemaError(f"'{name}': enum 값 {value!r}이(가) {type_name} 타입이 아닙니다")
+        for bound in ("minimum", "maximum"):
+            if bound not in prop:
+                continue
+            if type_name not in _NUMERIC_TYPES:
+                raise SchemaError(f"'{name}': {bound}은(는) integer 또는 number 타입에만 지정할 수 있습니다")
+            if not _TYPE_CHECKS["number"](prop[bound]):
+                raise SchemaError(f"'{name}': {bound} 값 {prop[bound]!r}이(가) 숫자가 아닙니다")
+        if "default" in prop:
+            errors = _property_errors(name, prop["default"], prop)
+            if errors:
+                raise SchemaError(f"'{name}': 기본값 오류 - {errors[0]}")
+    
+    missing = [name for name in schema.get("required", ()) if name not in properties]
+    if missing:
+        raise SchemaError(f"정의되지 않은 필수 속성: {', '.join(missing)}")
+
+
+def compile_validator(schema: Dict[str, Any]) -> ArgumentValidator:
+    """
+    입력 스키마를 인자 검증 함수로 컴파일합니다 (check_schema를 통과한 스키마).
+    
+    Args:
+        schema (Dict[str, Any]): inputSchema
+    
+    Returns:
+        ArgumentValidator: 인자 딕셔너리를 받아 오류 메시지 목록을 반환하는 함수
+    """
+    required = tuple(schema.get("required", ()))
+    checks = []
+    for name, prop in schema.get("properties", {}).items():
+        type_check = _TYPE_CHECKS.get(prop.get("type"))
+        enum = prop.get("enum")
+        bounded = "minimum" in prop or "maximum" in prop
+        checks.append((name, prop, type_check, tuple(enum) if enum is not None else None, bounded))
+    checks = tuple(checks)
+    
+    def validate(arguments: Any) -> List[str]:
+        if not isinstance(arguments, dict):
+            return ["인자는 객체여야 합니다"]
+        
+        errors = [f"필수 인자 '{name}'이(가) 없습니다" for name in required if name not in arguments]
+        for name, prop, type_check, enum, bounded in checks:
+            if name not in arguments:
+                continue
+            value = arguments[name]
+            # 대부분의 인자는 타입만 맞으면 통과 (enum/범위가 있는 속성만 상세 검사)
+            if type_check is not None and not type_check(value):
+                errors.extend(_property_errors(name, value, prop))
+            elif (enum is not None and value not in enum) or bounded:
+                errors.extend(_property_errors(name, value, prop))
+        return errors
+    
+    return validate
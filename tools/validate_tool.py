@@ -12,65 +12,72 @@ import re
 from typing import Dict, Any, List, Optional, Tuple
 from mcp.types import TextContent, Tool
 
-from ..msl.msl_lexer import MSLLexer
-from ..msl.msl_parser import MSLParser
+from msl.msl_lexer import MSLLexer
+from msl.msl_parser import MSLParser
+from msl.msl_simulator import MSLSimulator
+from msl.msl_cancel import check_cancelled
+from msl_ast import MultiAnalysisWalker, NodeCountAnalysis, MaxDepthAnalysis
 
 
 class ValidateTool:
     """MSL 스크립트 상세 검증 도구"""
     
+    # 도구 정의 (list_tools 카탈로그와 입력 검증의 단일 출처)
+    TOOL_DEFINITION = {
+        "name": "validate_msl",
+        "description": "MSL(Macro Scripting Language) 스크립트의 상세한 검증을 수행합니다. "
+                      "구문 오류, 의미적 문제, 성능 이슈, 보안 문제 등을 종합적으로 분석하고 "
+                      "수정 제안을 제공합니다.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "script": {
+                    "type": "string",
+                    "description": "검증할 MSL 스크립트 텍스트입니다."
+                },
+                "validation_level": {
+                    "type": "string",
+                    "enum": ["basic", "standard", "strict", "comprehensive"],
+                    "description": "검증 수준입니다. "
+                                 "basic: 기본 구문 검사, standard: 표준 검증, "
+                                 "strict: 엄격한 검증, comprehensive: 종합 검증",
+                    "default": "standard"
+                },
+                "check_performance": {
+                    "type": "boolean",
+                    "description": "성능 관련 이슈를 검사할지 여부입니다.",
+                    "default": True
+                },
+                "check_security": {
+                    "type": "boolean",
+                    "description": "보안 관련 이슈를 검사할지 여부입니다.",
+                    "default": False
+                },
+                "suggest_fixes": {
+                    "type": "boolean",
+                    "description": "발견된 문제에 대한 수정 제안을 포함할지 여부입니다.",
+                    "default": True
+                },
+                "target_platform": {
+                    "type": "string",
+                    "description": "대상 플랫폼 (Windows, Linux, Mac 등). 플랫폼별 특화 검증을 수행합니다.",
+                    "default": "Windows"
+                }
+            },
+            "required": ["script"]
+        }
+    }
+    
     def __init__(self):
         self.lexer = MSLLexer()
         self.parser = MSLParser()
+        self.simulator = MSLSimulator()
         self.validation_rules = self._load_validation_rules()
     
     @property
     def tool_definition(self) -> Tool:
         """도구 정의를 반환합니다."""
-        return Tool(
-            name="validate_msl",
-            description="MSL(Macro Scripting Language) 스크립트의 상세한 검증을 수행합니다. "
-                       "구문 오류, 의미적 문제, 성능 이슈, 보안 문제 등을 종합적으로 분석하고 "
-                       "수정 제안을 제공합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "script": {
-                        "type": "string",
-                        "description": "검증할 MSL 스크립트 텍스트입니다."
-                    },
-                    "validation_level": {
-                        "type": "string",
-                        "enum": ["basic", "standard", "strict", "comprehensive"],
-                        "description": "검증 수준입니다. "
-                                     "basic: 기본 구문 검사, standard: 표준 검증, "
-                                     "strict: 엄격한 검증, comprehensive: 종합 검증",
-                        "default": "standard"
-                    },
-                    "check_performance": {
-                        "type": "boolean",
-                        "description": "성능 관련 이슈를 검사할지 여부입니다.",
-                        "default": True
-                    },
-                    "check_security": {
-                        "type": "boolean",
-                        "description": "보안 관련 이슈를 검사할지 여부입니다.",
-                        "default": False
-                    },
-                    "suggest_fixes": {
-                        "type": "boolean",
-                        "description": "발견된 문제에 대한 수정 제안을 포함할지 여부입니다.",
-                        "default": True
-                    },
-                    "target_platform": {
-                        "type": "string",
-                        "description": "대상 플랫폼 (Windows, Linux, Mac 등). 플랫폼별 특화 검증을 수행합니다.",
-                        "default": "Windows"
-                    }
-                },
-                "required": ["script"]
-            }
-        )
+        return Tool(**self.TOOL_DEFINITION)
     
     async def execute(self, arguments: Dict[str, Any]) -> List[TextContent]:
         """검증 도구를 실행합니다."""
@@ -136,18 +143,22 @@ class ValidateTool:
             if validation_result["syntax_check"]["valid"]:
                 
                 # 2. 의미적 검사 (Semantic Check)
+                check_cancelled()
                 if level in ["standard", "strict", "comprehensive"]:
                     validation_result["semantic_check"] = await self._check_semantics(script)
                 
                 # 3. 성능 검사 (Performance Check)
+                check_cancelled()
                 if check_performance and level in ["strict", "comprehensive"]:
                     validation_result["performance_check"] = await self._check_performance(script)
                 
                 # 4. 보안 검사 (Security Check)
+                check_cancelled()
                 if check_security and level == "comprehensive":
                     validation_result["security_check"] = await self._check_security(script)
                 
                 # 5. 호환성 검사 (Compatibility Check)
+                check_cancelled()
                 if level == "comprehensive":
                     validation_result["compatibility_check"] = await self._check_compatibility(
                         script, target_platform
@@ -513,8 +524,15 @@ class ValidateTool:
     
     # 헬퍼 메서드들 (분석 로직)
     def _estimate_ast_complexity(self, ast) -> str:
-        """AST 복잡도를 추정합니다."""
-        return "medium"  # 실제 구현 시 AST 구조 분석
+        """AST 복잡도를 추정합니다 (노드 수와 깊이를 한 번의 순회로 집계)."""
+        stats = MultiAnalysisWalker([NodeCountAnalysis(), MaxDepthAnalysis()]).run(ast)
+        
+        if stats["node_count"] <= 3 and stats["max_depth"] <= 1:
+            return "low"
+        elif stats["node_count"] <= 10 and stats["max_depth"] <= 3:
+            return "medium"
+        else:
+            return "high"
     
     def _analyze_key_combinations(self, script: str) -> Dict[str, Any]:
         """키 조합을 분석합니다."""
@@ -571,14 +589,18 @@ class ValidateTool:
         return "&" in script or ">" in script
     
     def _estimate_execution_time(self, script: str) -> str:
-        """실행 시간을 추정합니다."""
-        # 간단한 추정 로직
-        if "*" in script:
-            return "중간 (1-10초)"
-        elif ">" in script:
-            return "긴편 (5-30초)"
+        """실행 시간을 시뮬레이터로 계산하여 구간으로 분류합니다."""
+        try:
+            duration_ms = self.simulator.estimate_script(script).duration_ms
+        except Exception:
+            return "알 수 없음"
+        
+        if duration_ms < 1000:
+            return f"짧음 (1초 미만, {duration_ms:.0f}ms)"
+        elif duration_ms < 10000:
+            return f"중간 (1-10초, {duration_ms:.0f}ms)"
         else:
-            return "짧음 (1초 미만)"
+            return f"긴편 (10초 이상, {duration_ms:.0f}ms)"
     
     def _load_validation_rules(self) -> Dict[str, Any]:
         """검증 규칙을 로드합니다."""
@@ -0,0 +1,226 @@
+"""
+MSL 도구 작업자 프로세스 풀
+
+파싱, 검증, 최적화, 설명 도구는 async 함수이지만 실제 작업은 모두 동기 CPU 연산이라,
+큰 스크립트 하나가 이벤트 루프를 막아 다른 클라이언트의 요청까지 멈추게 합니다.
+이 모듈은 그런 도구의 어휘 분석/파싱/분석 작업을 ProcessPoolExecutor에서 실행합니다.
+
+- 작업자는 시작할 때 도구 모듈을 임포트하고 인스턴스를 만들어 두므로(warm) 요청마다 준비 비용이 없음
+- 요청은 (도구 이름, 인자), 응답은 텍스트 튜플로 주고받아 직렬화 비용을 최소화
+- 처리 비용이 작은 스크립트는 프로세스 간 왕복보다 바로 실행하는 편이 빠르므로 이벤트 루프에서 바로 실행
+  (비용은 글자 수가 아니라 반복/연속 입력으로 펼쳐지는 양까지 반영한 추정치)
+- 작업자가 비정상 종료되면 풀을 다시 만들어 한 번 더 시도하고, 또 실패하면 오류 반환 (서버 프로세스에서는 실행하지 않음)
+- 요청의 절대 마감 시각을 작업자에 넘겨 같은 마감 시각의 취소 토큰으로 실행
+  (풀 대기열에서 기다린 시간도 마감에 포함되며, 시간 초과 시 작업자도 중단)
+"""
+
+import re
+import sys
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, List, Optional, Tuple
+
+from mcp.types import TextContent
+
+from msl.msl_cancel import CancellationToken, cancellation_scope, current_token
+from msl.msl_compiler import CONTINUOUS_MAX_DURATION_MS, CONTINUOUS_MIN_PERIOD_MS
+
+
+# 기본 작업자 수
+DEFAULT_WORKER_PROCESSES = 2
+# 추정 비용이 이 값 이하인 스크립트는 이벤트 루프에서 바로 실행
+DEFAULT_INLINE_MAX_COST = 2000
+
+# 반복 횟수 (*N)
+_REPEAT_COUNT = re.compile(r'\*\s*(\d+)')
+# 비용 추정에 쓰는 반복 횟수 상한 (자릿수가 이보다 많으면 상한으로 취급)
+_REPEAT_COUNT_DIGITS = 7
+_REPEAT_COUNT_CAP = 10 ** _REPEAT_COUNT_DIGITS
+# 연속 입력(&) 하나가 펼쳐질 수 있는 최대 반복 횟수
+_CONTINUOUS_MAX_COUNT = CONTINUOUS_MAX_DURATION_MS // CONTINUOUS_MIN_PERIOD_MS
+
+# 작업자 프로세스 상태 (작업자 안에서만 사용)
+_worker_registry = None
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _init_worker(specs: Tuple[Any, ...]):
+    """작업자 초기화: 도구 인스턴스와 이벤트 루프를 미리 준비"""
+    global _worker_registry, _worker_loop
+    from .registry import ToolRegistry
+    
+    _worker_registry = ToolRegistry(specs)
+    for spec in specs:
+        _worker_registry.get(spec.name)
+    _worker_loop = asyncio.new_event_loop()
+
+
+def _run_in_worker(name: str, arguments: Dict[str, Any], wall_deadline: Optional[float],
+                   timeout: Optional[float]) -> Tuple[str, ...]:
+    """작업자에서 도구 실행 (결과는 텍스트 튜플, wall_deadline은 요청의 절대 마감 시각)"""
+    with cancellation_scope(CancellationToken.from_wall_deadline(wall_deadline, timeout)):
+        result = _worker_loop.run_until_complete(_worker_registry.get(name).execute(arguments))
+    return tuple(content.text for content in result)
+
+
+def estimate_script_cost(script: str, limit: Optional[int] = None) -> int:
+    """
+    스크립트 처리 비용 추정 (파싱 없이 한 번 훑어서 계산하는 상한)
+    
+    글자 수에 모든 반복 횟수(*N)와 연속 입력(&)의 최대 반복 횟수를 곱합니다.
+    중첩 여부를 보지 않으므로 실제 이벤트 수보다 크거나 같습니다.
+    반복 횟수는 _REPEAT_COUNT_CAP에서 자르므로 자릿수가 아주 많은 횟수도 정수 변환 없이 처리합니다.
+    
+    Args:
+        script (str): MSL 스크립트
+        limit (int, optional): 비용이 이 값을 넘으면 나머지를 보지 않고 바로 반환
+    
+    Returns:
+        int: 추정 비용 (limit를 넘어 일찍 반환한 경우 limit보다 큰 값)
+    """
+    cost = max(1, len(script))
+    for match in _REPEAT_COUNT.finditer(script):
+        digits = match.group(1).lstrip('0')
+        if len(digits) > _REPEAT_COUNT_DIGITS:
+            cost *= _REPEAT_COUNT_CAP
+        elif digits:  # 0회 반복은 1로 취급
+            cost *= int(digits)
+        if limit is not None and cost > limit:
+            return cost
+    for _ in range(script.count('&')):
+        cost *= _CONTINUOUS_MAX_COUNT
+        if limit is not None and cost > limit:
+            return cost
+    return cost
+
+
+class WorkerCrashError(Exception):
+    """작업자 프로세스가 요청을 처리하다 비정상 종료된 경우"""
+    pass
+
+
+def _ping() -> bool:
+    """작업자 예열용 빈 작업"""
+    return True
+
+
+class WorkerPool:
+    """
+    CPU 작업용 도구 작업자 풀
+    
+    run()은 스크립트의 추정 처리 비용에 따라 작업자 프로세스 또는 이벤트 루프에서 도구를 실행합니다.
+    작업자 프로세스가 비정상 종료되면 풀을 다시 만들어 새 풀에서 한 번 더 시도합니다.
+    """
+    
+    def __init__(self, registry, tool_names: Tuple[str, ...],
+                 max_workers: int = DEFAULT_WORKER_PROCESSES,
+                 inline_max_cost: int = DEFAULT_INLINE_MAX_COST):
+        """
+        Worker Pool 초기화
+        
+        Args:
+            registry (ToolRegistry): 이벤트 루프에서 바로 실행할 때 사용할 도구 레지스트리
+            tool_names (Tuple[str, ...]): 작업자에서 실행할 도구 이름
+            max_workers (int): 작업자 프로세스 수
+            inline_max_cost (int): 추정 비용(estimate_script_cost)이 이 값 이하인 스크립트는 이벤트 루프에서 바로 실행
+        """
+        self.registry = registry
+        self.tool_names = tuple(tool_names)
+        self.max_workers = max(1, max_workers)
+        self.inline_max_cost = inline_max_cost
+        self.offloaded = 0
+        self.inline = 0
+        self.crashes = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.logger = logging.getLogger("msl-worker-pool")
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(tuple(self.registry.spec(name) for name in self.tool_names),)
+            )
+        return self._executor
+    
+    def should_offload(self, name: str, arguments: Dict[str, Any]) -> bool:
+        """작업자에서 실행할 요청인지 여부 (작업자 도구이면서 스크립트의 추정 비용이 큰 경우)"""
+        if name not in self.tool_names:
+            return False
+        script = arguments.get("script")
+        return isinstance(script, str) and estimate_script_cost(script, self.inline_max_cost) > self.inline_max_cost
+    
+    async def warm(self):
+        """작업자 프로세스를 미리 띄우고 도구를 준비시킵니다 (서버 시작 후 백그라운드에서 호출)."""
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        await asyncio.gather(*[loop.run_in_executor(executor, _ping) for _ in range(self.max_workers)])
+        self.logger.info(f"도구 작업자 준비 완료: {self.max_workers}개")
+    
+    async def run(self, name: str, arguments: Dict[str, Any]) -> List[TextContent]:
+        """
+        도구를 실행합니다 (비용이 큰 스크립트는 작업자 프로세스, 작은 스크립트는 이벤트 루프).
+        
+        현재 컨텍스트의 취소 토큰이 있으면 절대 마감 시각을 작업자에 넘깁니다.
+        호출이 취소되면 아직 시작하지 않은 작업은 대기열에서 빠지고, 실행 중인 작업은 작업자의 토큰으로 중단됩니다.
+        
+        Args:
+            name (str): 도구 이름
+            arguments (Dict[str, Any]): 도구 인자
+        
+        Returns:
+            List[TextContent]: 도구 실행 결과
+        
+        Raises:
+            WorkerCrashError: 다시 만든 풀의 작업자도 비정상 종료된 경우
+        """
+        if not self.should_offload(name, arguments):
+            self.inline += 1
+            return await self.registry.get(name).execute(arguments)
+        
+        token = current_token()
+        wall_deadline = token.wall_deadline() if token is not None else None
+        timeout = token.timeout_seconds if token is not None else None
+        
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            executor = self._get_executor()
+            try:
+                texts = await loop.run_in_executor(executor, _run_in_worker, name, arguments,
+                                                   wall_deadline, timeout)
+                break
+            except BrokenProcessPool:
+                self.crashes += 1
+                # 같은 풀을 쓰던 다른 요청이 이미 다시 만들었을 수 있음
+                if self._executor is executor:
+                    self._executor = None
+                if attempt:
+                    self.logger.error(f"도구 작업자가 {name} 요청 처리 중 다시 종료되었습니다")
+                    raise WorkerCrashError(f"{name} 요청을 처리하던 작업자 프로세스가 비정상 종료되었습니다")
+                self.logger.warning(f"도구 작업자가 종료되어 풀을 다시 만들고 {name} 요청을 다시 시도합니다")
+        
+        self.offloaded += 1
+        return [TextContent(type="text", text=text) for text in texts]
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """작업자/인라인 실행 횟수와 작업자 비정상 종료 횟수"""
+        return {
+            'max_workers': self.max_workers,
+            'inline_max_cost': self.inline_max_cost,
+            'offloaded': self.offloaded,
+            'inline': self.inline,
+            'crashes': self.crashes
+        }
+    
+    def shutdown(self):
+        """작업자 프로세스 종료 (대기 중인 작업은 취소)"""
+        if self._executor is not None:
+            if sys.version_info >= (3, 9):
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                self._executor.shutdown(wait=False)
+            self._executor = None